@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+    Admission control of geb write requests
+
+    Writes are limited by token bucket of their owner, roles which
+    drive the procedure (chronograph and auction module) are not limited.
+    Rejected requests get 429 at once, instead of waiting for a worker.
+    Controller is kept by every worker process, so rate is per worker,
+    owner may make rate times number of workers requests per second.
+"""
+from threading import Lock
+from time import time
+
+from openprocurement.auctions.geb.constants import (
+    ADMISSION_EXEMPT_ROLES
+)
+
+RATE_LIMITED = 'rate limit of owner is exceeded'
+
+
+class TokenBucket(object):
+    """
+        Bucket of burst tokens, refilled by rate tokens per second
+
+        >>> bucket = TokenBucket(rate=1, burst=2, now=0)
+        >>> [bucket.take(0), bucket.take(0), bucket.take(0), bucket.take(1)]
+        [True, True, False, True]
+    """
+
+    def __init__(self, rate, burst, now):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = now
+
+    def take(self, now):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+
+class AdmissionController(object):
+    """
+        Token buckets of writes by owner
+
+        buckets are kept for every owner (broker) which made writes,
+        there are few of them, so buckets are not evicted
+    """
+
+    def __init__(self, rate, burst, clock=time):
+        self.rate = rate
+        self.burst = burst
+        self.clock = clock
+        self.buckets = {}
+        self.lock = Lock()
+
+    def admit(self, role, owner):
+        """
+            Reason of rejection, or None if request is admitted
+        """
+        if role in ADMISSION_EXEMPT_ROLES:
+            return None
+        with self.lock:
+            now = self.clock()
+            bucket = self.buckets.get(owner)
+            if bucket is None:
+                bucket = self.buckets[owner] = TokenBucket(self.rate, self.burst, now)
+            if not bucket.take(now):
+                return RATE_LIMITED
+        return None
+
+
+def get_admission_controller(plugin_map):
+    """
+        Controller from 'admission' section of plugin configuration,
+        None if admission control is not configured
+    """
+    config = plugin_map.get('admission')
+    if not config:
+        return None
+    return AdmissionController(float(config['rate']),
+                               float(config.get('burst', config['rate'])))
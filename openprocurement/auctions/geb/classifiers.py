@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+from bisect import bisect_left
+from collections import OrderedDict
+from itertools import islice
+
+from schematics.types import BaseType
+
+
+class Choices(frozenset):
+    """
+        Frozen set of choices
+
+        Membership is checked by hash, iteration and representation
+        keep the order of declaration, so messages look like lists.
+    """
+
+    def __new__(cls, choices):
+        # duplicates are dropped, the first occurrence keeps its place
+        ordered = tuple(OrderedDict.fromkeys(choices))
+        instance = super(Choices, cls).__new__(cls, ordered)
+        instance._ordered = ordered
+        return instance
+
+    def __iter__(self):
+        return iter(self._ordered)
+
+    def __repr__(self):
+        return repr(list(self._ordered))
+
+    __str__ = __repr__
+
+
+def code_digits(code):
+    # '06111000-3' -> '06111000', check digit is not a part of hierarchy
+    return code.split('-')[0]
+
+
+def parent_digits(digits):
+    """
+        Digits of the next upper level of classification
+        top level (division) is defined by the first two digits
+
+        '06111000' -> '06110000' -> '06100000' -> '06000000' -> None
+    """
+    significant = digits.rstrip('0')
+    if len(significant) <= 2:
+        return None
+    return significant[:-1].ljust(len(digits), '0')
+
+
+class Classifier(object):
+    """
+        Index of classifier codes
+
+        Membership of code is checked by hash,
+        codes are also kept sorted for prefix queries.
+        Every code is linked to the nearest upper code of the classifier.
+    """
+
+    def __init__(self, codes):
+        self.codes = Choices(codes)
+        self._sorted_codes = sorted(self.codes)
+        self._error_message = None
+
+        by_digits = dict((code_digits(code), code) for code in self.codes)
+        self._parents = {}
+        self._children = {}
+        for code in self.codes:
+            digits = parent_digits(code_digits(code))
+            while digits and digits not in by_digits:
+                digits = parent_digits(digits)
+            parent = by_digits.get(digits)
+            self._parents[code] = parent
+            self._children.setdefault(parent, []).append(code)
+
+    def __contains__(self, code):
+        return code in self.codes
+
+    def __iter__(self):
+        return iter(self.codes)
+
+    def __len__(self):
+        return len(self.codes)
+
+    def startswith(self, prefix):
+        """
+            Codes which start with prefix, in sorted order
+        """
+        start = bisect_left(self._sorted_codes, prefix)
+        codes = []
+        for code in islice(self._sorted_codes, start, None):
+            if not code.startswith(prefix):
+                break
+            codes.append(code)
+        return codes
+
+    def parent(self, code):
+        """
+            Nearest upper code of the classifier, None for top level codes
+        """
+        return self._parents.get(code)
+
+    def children(self, code=None):
+        """
+            Codes for which code is the nearest upper one,
+            top level codes if code is None
+        """
+        return list(self._children.get(code, []))
+
+    def ancestors(self, code):
+        ancestors = []
+        parent = self.parent(code)
+        while parent:
+            ancestors.append(parent)
+            parent = self.parent(parent)
+        return ancestors
+
+    @property
+    def error_message(self):
+        # formatting of all codes is done once, on first invalid code
+        if self._error_message is None:
+            self._error_message = BaseType.MESSAGES['choices'].format(self.codes)
+        return self._error_message
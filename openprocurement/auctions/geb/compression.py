@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+    Content coding of geb responses, negotiated by Accept-Encoding
+
+    gzip and deflate are always available, br is offered
+    only if brotli is installed.
+"""
+import zlib
+
+from openprocurement.auctions.geb.constants import (
+    COMPRESSION_LEVEL,
+    COMPRESSION_MIN_SIZE
+)
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+IDENTITY = 'identity'
+
+
+def gzip_compress(body):
+    # wbits offset of 16 makes zlib write gzip header and trailer
+    compressor = zlib.compressobj(COMPRESSION_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    return compressor.compress(body) + compressor.flush()
+
+
+def deflate_compress(body):
+    return zlib.compress(body, COMPRESSION_LEVEL)
+
+
+COMPRESSORS = {
+    'gzip': gzip_compress,
+    'deflate': deflate_compress
+}
+# codings in order of preference, for equal quality values
+ENCODINGS = ('gzip', 'deflate')
+
+if brotli is not None:
+    COMPRESSORS['br'] = brotli.compress
+    ENCODINGS = ('br',) + ENCODINGS
+
+
+def parse_accept_encoding(header):
+    accepted = {}
+    for part in header.split(','):
+        coding, _, params = part.partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        params = params.replace(' ', '')
+        if params.startswith('q='):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0
+        accepted[coding] = quality
+    return accepted
+
+
+def negotiate_encoding(header, encodings=ENCODINGS):
+    """
+        Content coding of response for Accept-Encoding header
+
+        >>> negotiate_encoding('gzip, deflate', ('gzip', 'deflate'))
+        'gzip'
+        >>> negotiate_encoding('gzip;q=0.5, deflate', ('gzip', 'deflate'))
+        'deflate'
+        >>> negotiate_encoding('*, gzip;q=0', ('gzip', 'deflate'))
+        'deflate'
+        >>> negotiate_encoding('', ('gzip', 'deflate'))
+        'identity'
+    """
+    accepted = parse_accept_encoding(header or '')
+    best, best_quality = IDENTITY, 0
+    for coding in encodings:
+        quality = accepted.get(coding, accepted.get('*', 0))
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+def get_encoding(request):
+    return negotiate_encoding(request.headers.get('Accept-Encoding'))
+
+
+def compress(body, encoding):
+    """
+        Compressed body and its coding,
+        small bodies are left as is
+    """
+    if encoding == IDENTITY or len(body) < COMPRESSION_MIN_SIZE:
+        return body, IDENTITY
+    return COMPRESSORS[encoding](body), encoding
@@ -1,9 +1,19 @@
 from datetime import timedelta
 
+from openprocurement.api.constants import (
+    CPVS_CODES,
+    KVTSPZ_CODES
+)
+
+from openprocurement.auctions.geb.classifiers import (
+    Choices,
+    Classifier
+)
+
 # --DOCUMETS contstants--------------------------------------------------------
 
 # document type for ofline documents
-DOCUMENT_TYPE_OFFLINE = ['x_dgfAssetFamiliarization']
+DOCUMENT_TYPE_OFFLINE = Choices(['x_dgfAssetFamiliarization'])
 
 DOCUMENT_BLACKLISTED_FIELDS = (
     'title',
@@ -14,6 +24,70 @@ DOCUMENT_BLACKLISTED_FIELDS = (
     'hash'
 )
 
+# size of chunks in which uploaded file is sent to document service
+DOCUMENT_UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# number of attempts to upload file to document service
+DOCUMENT_UPLOAD_ATTEMPTS = 10
+
+# number of attempts to merge changes into auction after conflict on save
+SAVE_CONFLICT_ATTEMPTS = 3
+
+# base delay (in seconds) before merge attempt, doubled with every attempt
+SAVE_CONFLICT_BACKOFF = 0.05
+
+# header with revision of last saved auction, used to read own writes from replicas
+REVISION_HEADER = 'X-Revision'
+
+# number of changes read at once from changes feed by geb indexes
+CHANGES_FEED_BATCH_SIZE = 1000
+
+# number of processed changes after which geb indexes are checkpointed
+CHANGES_CHECKPOINT_INTERVAL = 10000
+
+# seconds between polls of changes feed by background thread of geb indexes
+CHANGES_POLL_INTERVAL = 1
+
+# number of changes batches read by request, if indexes are not polled in background
+CHANGES_CATCH_UP_BATCHES = 1
+
+# seconds request waits for geb indexes to catch up with changes feed after start of process
+INDEXES_READY_TIMEOUT = 1
+
+# max number of bids in page of bidder portfolio
+PORTFOLIO_PAGE_SIZE = 100
+
+# max number of log records waiting for background logging thread
+LOG_QUEUE_SIZE = 10000
+
+# only one of every n messages is logged, by MESSAGE_ID,
+# messages are sampled only if 'log_sampling' is set in plugin configuration
+LOG_SAMPLING = {}
+
+# number of auctions read and saved at once by data migration
+MIGRATION_BATCH_SIZE = 500
+
+# number of batches migrated concurrently
+MIGRATION_WORKERS = 4
+
+# number of attempts to save auction, which conflicted during migration
+MIGRATION_SAVE_ATTEMPTS = 3
+
+# responses smaller than this number of bytes are not compressed
+COMPRESSION_MIN_SIZE = 1024
+
+# zlib compression level of gzip and deflate responses
+COMPRESSION_LEVEL = 6
+
+# max number of encoded (and compressed) representations kept in memory
+REPRESENTATION_CACHE_SIZE = 256
+
+# roles, which are not limited by admission control
+ADMISSION_EXEMPT_ROLES = Choices([
+    'auction',
+    'chronograph'
+])
+
 # auction resource document types
 AUCTION_DOCUMENT_TYPES = [
     'technicalSpecifications',
@@ -67,92 +141,92 @@ AUCTION_STATUSES = [
 ]
 
 # in this auction resource statuses can delete bids
-AUCTION_STATUSES_FOR_DELETING_BIDS = [
+AUCTION_STATUSES_FOR_DELETING_BIDS = Choices([
     'active.tendering',
     'active.enquiry'
-]
+])
 
 # in this auction resource statuses can patch auction fields
-AUCTION_STATUSES_FOR_PATCHING_AUCTION = [
+AUCTION_STATUSES_FOR_PATCHING_AUCTION = Choices([
     'draft',
     'active.rectification'
-]
+])
 
 # in this auction resource statuses can patch bids
-AUCTION_STATUSES_FOR_PATCHING_BIDS = [
+AUCTION_STATUSES_FOR_PATCHING_BIDS = Choices([
     'active.tendering',
     'active.enquiry'
-]
+])
 
 # after cancellation was created
 # if auction resource was in this statuses
 # all bids will be deleted
-AUCTION_STATUSES_FOR_CLEAN_BIDS_IN_CANCELLATION = [
+AUCTION_STATUSES_FOR_CLEAN_BIDS_IN_CANCELLATION = Choices([
     'active.tendering',
     'active.enquiry',
     'active.auction'
-]
+])
 
 # in this auctioon resource statuses: nobody can`t get bid (only bid owner)
-AUCTION_STATUSES_FOR_FORBIDDEN_GET_BIDS = [
+AUCTION_STATUSES_FOR_FORBIDDEN_GET_BIDS = Choices([
     'active.tendering',
     'active.enquiry',
     'active.auction'
-]
+])
 
 # in this auction resource statuses can post questions
-AUCTION_STATUSES_FOR_ADDING_QUESTIONS = [
+AUCTION_STATUSES_FOR_ADDING_QUESTIONS = Choices([
     'active.rectification',
     'active.tendering',
     'active.enquiry'
-]
+])
 
 # in this auctioon resource statuses: can patch auction document
-AUCTION_STATUSES_FOR_PATCHING_DOCUMENTS_STATUSES = [
+AUCTION_STATUSES_FOR_PATCHING_DOCUMENTS_STATUSES = Choices([
     'active.rectification',
     'active.tendering',
     'active.enquiry'
-]
+])
 
 # statuses in which can put auction document
-AUCTION_STATUSES_FOR_PUT_DOCUMENTS_STATUSES = [
+AUCTION_STATUSES_FOR_PUT_DOCUMENTS_STATUSES = Choices([
     'active.rectification',
     'active.tendering',
     'active.enquiry',
     'active.qualification',
     'active.awarded'
-]
+])
 
 
 # in this auction resource statuses can post auction documents
-AUCTION_STATUSES_FOR_ADDING_DOCUMENTS = [
+AUCTION_STATUSES_FOR_ADDING_DOCUMENTS = Choices([
     'active.rectification',
     'active.tendering',
     'active.enquiry'
-]
+])
 
 # auction resoure statuses in which module auction can post document
-AUCTION_STATUSES_FOR_MODULE_AUCTION_ADDING_DOCUMENTS = [
+AUCTION_STATUSES_FOR_MODULE_AUCTION_ADDING_DOCUMENTS = Choices([
     'active.auction',
     'active.qualification'
-]
+])
 
 # in this auction resource statuses can patch(answer) questions
-AUCTION_STATUSES_FOR_CHANGING_QUESTIONS = [
+AUCTION_STATUSES_FOR_CHANGING_QUESTIONS = Choices([
     'active.rectification',
     'active.tendering',
     'active.enquiry'
-]
+])
 
 # in this auction resource statuses can patch items
-AUCTION_STATUSES_FOR_CHANGING_ITEMS = ['active.rectification']
+AUCTION_STATUSES_FOR_CHANGING_ITEMS = Choices(['active.rectification'])
 
 # in this auction resource statuses can post bid document
-AUCTION_STATUSES_FOR_ADDING_BID_DOCUMENTS = [
+AUCTION_STATUSES_FOR_ADDING_BID_DOCUMENTS = Choices([
     'active.tendering',
     'active.enquiry',
     'active.qualification'
-]
+])
 
 # duration of rectification period
 AUCTION_RECTIFICATION_PERIOD_DURATION = timedelta(hours=48)
@@ -170,24 +244,24 @@ BID_STATUSES = [
 ]
 
 # in this bid statuses: can patch bid
-BID_STATUSES_FOR_PATCHING = [
+BID_STATUSES_FOR_PATCHING = Choices([
     'pending',
     'active'
-]
+])
 
 # in this bid statuses: can delete bid
-BID_STATUSES_FOR_DELETING = [
+BID_STATUSES_FOR_DELETING = Choices([
     'draft',
     'pending',
     'active'
-]
+])
 
 # in this bid statuses: can post bid document
-BID_STATUSES_FOR_ADDING_BID_DOCUMENTS = [
+BID_STATUSES_FOR_ADDING_BID_DOCUMENTS = Choices([
     'draft',
     'pending',
     'active'
-]
+])
 
 # --ITEM contstants------------------------------------------------------------
 
@@ -217,6 +291,20 @@ CAV_PS_CODES = [
     "06129000-2"
 ]
 
+# index of cav ps codes
+CAV_PS = Classifier(CAV_PS_CODES)
+
+# indexes of additional classifications codes
+CPVS = Classifier(CPVS_CODES)
+KVTSPZ = Classifier(KVTSPZ_CODES)
+
+# indexes available in classifiers search, by scheme
+CLASSIFIERS = {
+    u'CAV-PS': CAV_PS,
+    u'CPVS': CPVS,
+    u'kvtspz': KVTSPZ
+}
+
 # if level of accreditation not defined in the config file, then use these
 DEFAULT_LEVEL_OF_ACCREDITATION = {
     'create': [1],
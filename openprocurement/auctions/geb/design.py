@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""
+    CouchDB views and changes filters of geb auctions, shared by all processes
+"""
+from couchdb.design import ViewDefinition
+from couchdb.http import ResourceConflict, ResourceNotFound
+
+# not cancelled auctions by lotIdentifier and tenderAttempts
+auctions_by_lot_attempt_view = ViewDefinition('geb_auctions', 'by_lot_attempt', '''function(doc) {
+    if(doc.doc_type == 'Auction' && doc.status != 'cancelled' && doc.lotIdentifier) {
+        emit([doc.lotIdentifier, doc.tenderAttempts], [doc.auctionID, doc.procurementMethodType]);
+    }
+}''')
+
+# auctions by auctionID and by lotIdentifier and tenderAttempts,
+# with fields of geb lookup, used while indexes of process are not ready
+auctions_by_auction_id_view = ViewDefinition('geb_auctions', 'by_auction_id', '''function(doc) {
+    if(doc.doc_type == 'Auction' && doc.auctionID) {
+        emit(doc.auctionID, {'id': doc._id, 'auctionID': doc.auctionID, 'lotIdentifier': doc.lotIdentifier,
+                             'tenderAttempts': doc.tenderAttempts, 'status': doc.status,
+                             'procurementMethodType': doc.procurementMethodType});
+    }
+}''')
+
+auctions_by_lot_view = ViewDefinition('geb_auctions', 'by_lot', '''function(doc) {
+    if(doc.doc_type == 'Auction' && doc.lotIdentifier) {
+        emit([doc.lotIdentifier, doc.tenderAttempts], {'id': doc._id, 'auctionID': doc.auctionID,
+                                                       'lotIdentifier': doc.lotIdentifier,
+                                                       'tenderAttempts': doc.tenderAttempts, 'status': doc.status,
+                                                       'procurementMethodType': doc.procurementMethodType});
+    }
+}''')
+
+VIEWS = (
+    auctions_by_lot_attempt_view,
+    auctions_by_auction_id_view,
+    auctions_by_lot_view
+)
+
+# changes of geb auctions and deleted documents,
+# procurement method types are passed by comma separated 'types' parameter
+CHANGES_DESIGN_DOC = '_design/geb_changes'
+CHANGES_FILTERS = {
+    'auctions': '''function(doc, req) {
+    if(doc._deleted) {
+        return true;
+    }
+    return doc.doc_type == 'Auction' && req.query.types.split(',').indexOf(doc.procurementMethodType) >= 0;
+}'''
+}
+AUCTIONS_CHANGES_FILTER = 'geb_changes/auctions'
+
+
+def sync_views(db):
+    ViewDefinition.sync_many(db, VIEWS)
+
+
+def sync_filters(db):
+    doc = db.get(CHANGES_DESIGN_DOC, {'_id': CHANGES_DESIGN_DOC, 'language': 'javascript'})
+    if doc.get('filters') == CHANGES_FILTERS:
+        return
+    doc['filters'] = CHANGES_FILTERS
+    try:
+        db.save(doc)
+    except ResourceConflict:
+        # saved by other process at the same time
+        pass
+
+
+def query_view(db, view, **options):
+    """
+        Rows of view, design document is synced if database has not got it yet
+    """
+    try:
+        return list(view(db, **options))
+    except ResourceNotFound:
+        view.sync(db)
+        return list(view(db, **options))
+
+
+def query_changes(db, procurement_method_types, **options):
+    """
+        Changes feed of geb auctions, filtered by database,
+        filter is synced if database has not got it yet
+    """
+    options.update(filter=AUCTIONS_CHANGES_FILTER, types=','.join(sorted(procurement_method_types)))
+    try:
+        return db.changes(**options)
+    except ResourceNotFound:
+        sync_filters(db)
+        return db.changes(**options)
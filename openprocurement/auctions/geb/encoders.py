@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""
+    JSON encoding of geb responses
+
+    Views render data with render_json, which writes encoded body
+    straight to response, so the renderer is not called.
+    Backend is chosen by 'json_backend' of plugin configuration,
+    simplejson (with C speedups) is used by default, if it is installed.
+    Body is compressed with coding negotiated by Accept-Encoding.
+"""
+import json
+
+from datetime import date, datetime
+from decimal import Decimal
+
+from openprocurement.auctions.geb.compression import (
+    IDENTITY,
+    compress,
+    get_encoding
+)
+
+try:
+    import simplejson
+except ImportError:  # pragma: no cover
+    simplejson = None
+
+
+class Encoded(bytes):
+    """
+        Already encoded JSON, it is written to response as is
+    """
+
+
+def default(obj):
+    # IsoDateTimeType and DecimalType values are serialized to strings by schematics,
+    # values which were not serialized are formatted the same way by every backend
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, Decimal):
+        return unicode(obj)
+    raise TypeError('{!r} is not JSON serializable'.format(obj))
+
+
+def json_dumps(data):
+    return json.dumps(data, default=default, separators=(',', ':'))
+
+
+def simplejson_dumps(data):
+    # Decimal is left to default, as in json_dumps
+    return simplejson.dumps(data, default=default, separators=(',', ':'), use_decimal=False)
+
+
+BACKENDS = {'json': json_dumps}
+if simplejson is not None:
+    BACKENDS['simplejson'] = simplejson_dumps
+
+DEFAULT_BACKEND = 'simplejson' if simplejson is not None else 'json'
+
+
+class JSONEncoder(object):
+
+    def __init__(self, backend=None):
+        self.backend = backend or DEFAULT_BACKEND
+        if self.backend not in BACKENDS:
+            raise ValueError('Unknown JSON backend {}, available: {}'.format(self.backend, sorted(BACKENDS)))
+        self.dumps = BACKENDS[self.backend]
+
+    def encode(self, data):
+        if isinstance(data, Encoded):
+            return data
+        return Encoded(self.dumps(data))
+
+
+def get_encoder(request):
+    return request.registry.geb_encoder
+
+
+def write_json(request, body, encoding=IDENTITY):
+    response = request.response
+    response.content_type = 'application/json'
+    response.charset = 'utf-8'
+    response.body = body
+    if encoding != IDENTITY:
+        response.content_encoding = encoding
+    response.vary = tuple(response.vary or ()) + ('Accept-Encoding',)
+    return response
+
+
+def render_json(request, data):
+    """
+        Write data encoded (and compressed, if client accepts it)
+        to response body and return response
+
+        Requests with renderer overridden (opt_pretty, opt_jsonp)
+        are left to that renderer.
+    """
+    if getattr(request, 'override_renderer', None):
+        return json.loads(data) if isinstance(data, Encoded) else data
+    body, encoding = compress(get_encoder(request).encode(data), get_encoding(request))
+    return write_json(request, body, encoding)
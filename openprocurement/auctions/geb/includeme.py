@@ -1,4 +1,8 @@
 import logging
+import os
+
+from pkg_resources import iter_entry_points
+from pyramid.events import NewRequest, NewResponse
 from pyramid.interfaces import IRequest
 
 from openprocurement.auctions.geb.managers.base import (
@@ -12,15 +16,56 @@ from openprocurement.auctions.geb.managers.base import (
     ItemManager,
     QuestionManager
 )
+from openprocurement.auctions.geb.managers.dispatch import (
+    ManagersDispatcher
+)
 from openprocurement.auctions.geb.managers.configurator import (
     AuctionConfigurator
 )
 from openprocurement.auctions.geb.constants import (
+    CHANGES_POLL_INTERVAL,
     DEFAULT_PROCUREMENT_METHOD_TYPE,
-    DEFAULT_LEVEL_OF_ACCREDITATION
+    DEFAULT_LEVEL_OF_ACCREDITATION,
+    REPRESENTATION_CACHE_SIZE
 )
 from openprocurement.auctions.geb.models.schemas import (
-    Auction
+    Auction,
+    AuctionDocument,
+    Bid,
+    BidDocument,
+    Cancellation,
+    CancellationDocument,
+    Item,
+    Question
+)
+from openprocurement.auctions.geb.managers.loggers.pipeline import (
+    enable_queue_logging
+)
+from openprocurement.auctions.geb.managers.loggers.journal import (
+    TransitionJournal,
+    write_transitions
+)
+from openprocurement.auctions.geb.admission import (
+    get_admission_controller
+)
+from openprocurement.auctions.geb.encoders import (
+    JSONEncoder
+)
+from openprocurement.auctions.geb.representations import (
+    RepresentationCache
+)
+from openprocurement.auctions.geb.design import (
+    sync_filters,
+    sync_views
+)
+from openprocurement.auctions.geb.indexes import (
+    ChangesConsumer,
+    db_changes_feed
+)
+from openprocurement.auctions.geb.storage import (
+    ReplicaPool,
+    read_auction,
+    set_revision_token
 )
 
 from openprocurement.auctions.core.interfaces import (
@@ -41,6 +86,18 @@ from openprocurement.auctions.geb.interfaces import (
 )
 
 LOGGER = logging.getLogger(__name__)
+PLUGINS_GROUP = 'openprocurement.auctions.geb.plugins'
+
+
+def load_plugins(config, plugins, group=PLUGINS_GROUP):
+    """
+        Run plugins of geb, which are enabled in configuration,
+        every plugin is called with registry
+    """
+    for name in plugins:
+        for entry_point in iter_entry_points(group, name):
+            plugin = entry_point.load()
+            plugin(config.registry)
 
 
 def includeme(config, plugin_map):
@@ -51,6 +108,7 @@ def includeme(config, plugin_map):
         procurement_method_types.append(DEFAULT_PROCUREMENT_METHOD_TYPE)
     for procurementMethodType in procurement_method_types:
         config.add_auction_procurementMethodType(Auction, procurementMethodType)
+    config.registry.geb_procurement_method_types = frozenset(procurement_method_types)
 
     # add views
     config.scan("openprocurement.auctions.geb.views")
@@ -67,6 +125,50 @@ def includeme(config, plugin_map):
     config.registry.registerAdapter(CancellationDocumentManager, (IRequest, ICancellationDocument), IManager)
     config.registry.registerAdapter(AuctionDocumentManager, (IRequest, IAuctionDocument), IManager)
 
+    # managers of geb resources are resolved once
+    config.registry.geb_managers = ManagersDispatcher(config.registry)
+    config.registry.geb_managers.prepare((Auction, AuctionDocument, Bid, BidDocument,
+                                          Cancellation, CancellationDocument, Item, Question))
+
+    # admission control of writes
+    config.registry.geb_admission = get_admission_controller(plugin_map)
+
+    # encoder of responses
+    config.registry.geb_encoder = JSONEncoder(plugin_map.get('json_backend'))
+    cache_size = int(plugin_map.get('representations_cache_size', REPRESENTATION_CACHE_SIZE))
+    config.registry.geb_representations = RepresentationCache(cache_size)
+
+    # databases for reads
+    config.registry.geb_replicas = ReplicaPool(config.registry, plugin_map.get('replicas', []))
+    config.add_subscriber(read_auction, NewRequest)
+    config.add_subscriber(set_revision_token, NewResponse)
+
+    # logs of geb are written by background thread
+    if plugin_map.get('log_queue'):
+        enable_queue_logging('openprocurement.auctions.geb')
+    config.registry.geb_log_sampling = dict((message_id, int(rate))
+                                            for message_id, rate in plugin_map.get('log_sampling', {}).items())
+
+    # journal of auction status transitions
+    journal_path = plugin_map.get('transitions_journal')
+    config.registry.geb_journal = TransitionJournal(journal_path) if journal_path else None
+    config.add_subscriber(write_transitions, NewResponse)
+
+    # views and changes filters of geb auctions
+    sync_views(config.registry.db)
+    sync_filters(config.registry.db)
+
+    # indexes of geb auctions, updated from changes feed by background thread
+    config.registry.geb_changes_consumer = ChangesConsumer(db_changes_feed(config.registry, procurement_method_types),
+                                                           procurement_method_types,
+                                                           plugin_map.get('indexes_checkpoint'),
+                                                           interval=float(plugin_map.get('indexes_poll_interval',
+                                                                                         CHANGES_POLL_INTERVAL)))
+
+    # migrate data
+    if plugin_map.get('migration') and not os.environ.get('MIGRATION_SKIP'):
+        load_plugins(config, plugin_map.get('plugins', {}))
+
     LOGGER.info("Included openprocurement.auctions.geb plugin",
                 extra={'MESSAGE_ID': 'included_plugin'})
 
@@ -0,0 +1,378 @@
+# -*- coding: utf-8 -*-
+"""
+    Indexes derived from geb auctions, kept up to date by the changes feed
+
+    ChangesConsumer reads changes of database since the last processed
+    sequence and updates AuctionIndexes only for changed geb auctions.
+    Changes are polled by background thread of every process,
+    requests only read indexes, once they have caught up with the feed.
+    Feed is filtered by database, so only changes of geb auctions are read.
+    Indexes with the sequence can be checkpointed to file and restored,
+    so consumer continues from the checkpoint instead of the full scan.
+"""
+import json
+import os
+import tempfile
+
+from bisect import bisect_left, insort
+from collections import defaultdict
+from functools import wraps
+from logging import getLogger
+from threading import Event, Lock, RLock, Thread
+
+from openprocurement.auctions.geb.constants import (
+    CHANGES_CATCH_UP_BATCHES,
+    CHANGES_CHECKPOINT_INTERVAL,
+    CHANGES_FEED_BATCH_SIZE,
+    CHANGES_POLL_INTERVAL,
+    INDEXES_READY_TIMEOUT
+)
+from openprocurement.auctions.geb.design import (
+    query_changes
+)
+
+LOGGER = getLogger(__name__)
+
+
+def get_auction_summary(doc):
+    """
+        Fields of auction document which are indexed
+    """
+    return {
+        'id': doc['_id'],
+        'auctionID': doc.get('auctionID'),
+        'lotIdentifier': doc.get('lotIdentifier'),
+        'tenderAttempts': doc.get('tenderAttempts'),
+        'status': doc.get('status'),
+        'next_check': doc.get('next_check'),
+        'bids': [get_bid_ref(doc, bid) for bid in doc.get('bids', [])]
+    }
+
+
+def get_bid_ref(doc, bid):
+    tenderers = bid.get('tenderers') or [{}]
+    identifier = tenderers[0].get('identifier', {})
+    return {
+        'id': bid['id'],
+        'auction_id': doc['_id'],
+        'auctionID': doc.get('auctionID'),
+        'auction_status': doc.get('status'),
+        'owner': bid.get('owner'),
+        'tenderer': [identifier.get('scheme'), identifier.get('id')],
+        'status': bid.get('status'),
+        'bidNumber': bid.get('bidNumber'),
+        'qualified': bid.get('qualified')
+    }
+
+
+def locked(method):
+    # indexes are changed by consumer thread while requests query them
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+class AuctionIndexes(object):
+    """
+        In memory indexes of geb auctions:
+        next_check ordering, auctions by status, by auctionID, by lotIdentifier
+        and bids by owner and by tenderer identifier
+    """
+
+    def __init__(self):
+        self.lock = RLock()
+        self.auctions = {}
+        self.statuses = defaultdict(set)
+        self.auction_ids = {}
+        self.lots = defaultdict(set)
+        self.owners = defaultdict(dict)
+        self.tenderers = defaultdict(dict)
+        self._next_checks = []
+
+    @locked
+    def update(self, doc):
+        self.remove(doc['_id'])
+        self.add(get_auction_summary(doc))
+
+    @locked
+    def add(self, summary):
+        auction_id = summary['id']
+        self.auctions[auction_id] = summary
+        self.statuses[summary['status']].add(auction_id)
+        if summary['auctionID']:
+            self.auction_ids[summary['auctionID']] = auction_id
+        if summary['lotIdentifier']:
+            self.lots[summary['lotIdentifier']].add(auction_id)
+        if summary['next_check']:
+            insort(self._next_checks, (summary['next_check'], auction_id))
+        for bid in summary['bids']:
+            self.owners[bid['owner']][bid['id']] = bid
+            self.tenderers[tuple(bid['tenderer'])][bid['id']] = bid
+
+    @locked
+    def remove(self, auction_id):
+        summary = self.auctions.pop(auction_id, None)
+        if summary is None:
+            return
+        self._discard(self.statuses, summary['status'], auction_id)
+        self.auction_ids.pop(summary['auctionID'], None)
+        self._discard(self.lots, summary['lotIdentifier'], auction_id)
+        if summary['next_check']:
+            key = (summary['next_check'], auction_id)
+            position = bisect_left(self._next_checks, key)
+            if position < len(self._next_checks) and self._next_checks[position] == key:
+                del self._next_checks[position]
+        for bid in summary['bids']:
+            self._discard(self.owners, bid['owner'], bid['id'])
+            self._discard(self.tenderers, tuple(bid['tenderer']), bid['id'])
+
+    @staticmethod
+    def _discard(index, key, value):
+        values = index.get(key)
+        if values is None:
+            return
+        if isinstance(values, set):
+            values.discard(value)
+        else:
+            values.pop(value, None)
+        if not values:
+            del index[key]
+
+    # queries
+
+    @locked
+    def next_checks(self, until=None):
+        """
+            Ids of auctions ordered by next_check, with next_check not later than until
+        """
+        result = []
+        for next_check, auction_id in self._next_checks:
+            if until and next_check > until:
+                break
+            result.append(auction_id)
+        return result
+
+    @locked
+    def by_status(self, status):
+        return sorted(self.statuses.get(status, ()))
+
+    @locked
+    def by_auction_id(self, auction_id):
+        return self.auction_ids.get(auction_id)
+
+    @locked
+    def by_lot(self, lot_identifier):
+        """
+            Summaries of auctions of lot, ordered by tenderAttempts
+        """
+        ids = self.lots.get(lot_identifier, ())
+        return sorted((self.auctions[i] for i in ids), key=lambda summary: summary['tenderAttempts'])
+
+    @locked
+    def bids_by_owner(self, owner):
+        return self._sorted_bids(self.owners.get(owner, {}))
+
+    @locked
+    def bids_by_tenderer(self, scheme, identifier):
+        return self._sorted_bids(self.tenderers.get((scheme, identifier), {}))
+
+    @staticmethod
+    def _sorted_bids(bids):
+        return sorted(bids.values(), key=lambda bid: (bid['auction_id'], bid['id']))
+
+    # checkpoints
+
+    @locked
+    def dump(self):
+        return list(self.auctions.values())
+
+    @locked
+    def load(self, summaries):
+        for summary in summaries:
+            self.add(summary)
+
+
+class ChangesConsumer(object):
+    """
+        Consumer of database changes feed, which updates indexes of geb auctions
+
+        feed is called as db.changes(since=..., limit=..., include_docs=True)
+        and returns dict with results and last_seq.
+        Changes are read outside of lock of indexes, so queries are not blocked by reads of feed.
+        ready is set when consumer has read the feed to its end for the first time.
+    """
+
+    def __init__(self, feed, procurement_method_types, checkpoint_path=None,
+                 batch_size=CHANGES_FEED_BATCH_SIZE, interval=CHANGES_POLL_INTERVAL):
+        self.feed = feed
+        self.procurement_method_types = set(procurement_method_types)
+        self.indexes = AuctionIndexes()
+        self.since = 0
+        self.batch_size = batch_size
+        self.interval = interval
+        self.checkpoint_path = checkpoint_path
+        # one poll of feed at a time
+        self.lock = Lock()
+        self._unsaved = 0
+        self._thread = None
+        self._pid = None
+        self._stopped = Event()
+        self.ready = Event()
+        if checkpoint_path:
+            self.restore(checkpoint_path)
+
+    def is_geb_auction(self, doc):
+        return doc.get('doc_type') == 'Auction' and doc.get('procurementMethodType') in self.procurement_method_types
+
+    def reset(self):
+        """
+            Drop indexes, so they are built again from the start of changes feed
+        """
+        with self.lock:
+            self.indexes = AuctionIndexes()
+            self.since = 0
+            self._unsaved = 0
+            self.ready.clear()
+
+    def process(self, change):
+        doc = change.get('doc')
+        if change.get('deleted') or not doc or not self.is_geb_auction(doc):
+            self.indexes.remove(change['id'])
+        else:
+            self.indexes.update(doc)
+
+    def poll(self, max_batches=None):
+        """
+            Process changes since the last processed sequence,
+            all of them or max_batches batches
+            return number of processed changes
+        """
+        with self.lock:
+            return self._poll(max_batches)
+
+    def catch_up(self, max_batches=CHANGES_CATCH_UP_BATCHES):
+        """
+            Bounded poll, which is skipped if feed is polled at the moment
+        """
+        if not self.lock.acquire(False):
+            return 0
+        try:
+            return self._poll(max_batches)
+        finally:
+            self.lock.release()
+
+    def _poll(self, max_batches):
+        processed = 0
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            changes = self.feed(since=self.since, limit=self.batch_size, include_docs=True)
+            results = changes['results']
+            indexes = self.indexes
+            with indexes.lock:
+                for change in results:
+                    self.process(change)
+            self.since = changes['last_seq']
+            processed += len(results)
+            batches += 1
+            if len(results) < self.batch_size:
+                self.ready.set()
+                break
+        self._unsaved += processed
+        if self.checkpoint_path and self._unsaved >= CHANGES_CHECKPOINT_INTERVAL:
+            self.checkpoint(self.checkpoint_path)
+        return processed
+
+    # background polling
+
+    @property
+    def running(self):
+        # thread is not inherited by forked worker process
+        return self._thread is not None and self._pid == os.getpid() and self._thread.is_alive()
+
+    def start(self):
+        """
+            Poll changes by background thread of current process,
+            every interval seconds
+        """
+        if not self.interval or self.running:
+            return False
+        self._stopped.clear()
+        self._pid = os.getpid()
+        self._thread = Thread(target=self.run, name='geb-changes-consumer')
+        self._thread.daemon = True
+        self._thread.start()
+        return True
+
+    def stop(self):
+        if not self.running:
+            return
+        self._stopped.set()
+        self._thread.join()
+        self._thread = None
+
+    def run(self):
+        while not self._stopped.is_set():
+            try:
+                self.poll()
+            except Exception as e:
+                LOGGER.warning('Failed to poll changes of geb auctions: {}'.format(e),
+                               extra={'MESSAGE_ID': 'geb_indexes_poll_failed'})
+            self._stopped.wait(self.interval)
+
+    def checkpoint(self, path):
+        """
+            Write sequence and indexes to file, atomically
+            called by poll, under lock of consumer
+        """
+        data = {'since': self.since, 'auctions': self.indexes.dump()}
+        self._unsaved = 0
+        # file is shared by processes of the same configuration,
+        # every one writes its own temporary file
+        directory, name = os.path.split(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(prefix='{}.'.format(name), suffix='.tmp', dir=directory)
+        try:
+            with os.fdopen(fd, 'w') as tmp_file:
+                json.dump(data, tmp_file)
+            os.rename(tmp_path, path)
+        except Exception:
+            os.remove(tmp_path)
+            raise
+
+    def restore(self, path):
+        if not os.path.exists(path):
+            return False
+        with open(path) as fd:
+            data = json.load(fd)
+        with self.lock:
+            self.indexes = AuctionIndexes()
+            self.indexes.load(data['auctions'])
+            self.since = data['since']
+        LOGGER.info('Restored geb indexes from checkpoint {} at sequence {}'.format(path, self.since),
+                    extra={'MESSAGE_ID': 'geb_indexes_restored'})
+        return True
+
+
+def get_indexes(request, timeout=INDEXES_READY_TIMEOUT):
+    """
+        Indexes of geb auctions, as they are updated by background thread,
+        None if they have not caught up with the changes feed yet
+
+        Thread is started by the first request of process, requests wait
+        for it to catch up not longer than timeout. If polling
+        in background is disabled (interval is 0), request catches up
+        with the changes feed by a bounded number of batches.
+    """
+    consumer = request.registry.geb_changes_consumer
+    if not consumer.start() and not consumer.running:
+        consumer.catch_up()
+    elif not consumer.ready.is_set():
+        consumer.ready.wait(timeout)
+    return consumer.indexes if consumer.ready.is_set() else None
+
+
+def db_changes_feed(registry, procurement_method_types):
+    def feed(**options):
+        return query_changes(registry.db, procurement_method_types, **options)
+    return feed
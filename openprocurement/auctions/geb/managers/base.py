@@ -12,6 +12,10 @@ from openprocurement.auctions.core.adapters import (
     AuctionManagerAdapter
 )
 
+from openprocurement.auctions.geb.utils import (
+    save_auction_with_retry
+)
+
 from openprocurement.auctions.geb.managers.representers.managers import (
     AuctionRepresentationManager,
     BidRepresentationManager,
@@ -61,6 +65,10 @@ class BidManager(BidManager):
     representation_manager = BidRepresentationManager
     log = BidLogger
 
+    def save(self):
+        # bids of the same auction are patched concurrently by bidders
+        return save_auction_with_retry(self.request, super(BidManager, self).save)
+
 
 class BidDocumentManager(BidDocumentManager):
     changion_manager = BidDocumentChangionManager
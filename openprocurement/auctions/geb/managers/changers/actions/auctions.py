@@ -3,12 +3,14 @@ from datetime import timedelta
 
 from openprocurement.auctions.core.utils import (
     calculate_business_date,
-    get_now,
-    log_auction_status_change
+    get_now
 )
 from openprocurement.auctions.core.interfaces import (
     IContentConfigurator
 )
+from openprocurement.auctions.geb.managers.loggers.journal import (
+    log_status_change
+)
 from openprocurement.auctions.geb.constants import (
     AUCTION_RECTIFICATION_PERIOD_DURATION,
 )
@@ -219,4 +221,4 @@ class ModuleAuctionBringsResultAction(BaseAction):
             awarding.start_awarding()
         else:
             self.context.status = 'unsuccessful'
-            log_auction_status_change(self.request, self.context, self.context.status)
+            log_status_change(self.request, self.context, self.context.status, self)
@@ -1,5 +1,5 @@
-from openprocurement.auctions.core.utils import (
-    log_auction_status_change
+from openprocurement.auctions.geb.managers.loggers.journal import (
+    log_status_change
 )
 from openprocurement.auctions.geb.constants import (
     AUCTION_STATUSES_FOR_CLEAN_BIDS_IN_CANCELLATION
@@ -38,7 +38,7 @@ class CancellationActivationAction(BaseAction):
         # pendify auction status
         status = 'cancelled'
         auction.status = status
-        log_auction_status_change(self.request, self.context, status)
+        log_status_change(self.request, self.context, status, self)
 
         # clean bids after cancellation procedure
         auction_status = self.request.validated['auction_src']['status']
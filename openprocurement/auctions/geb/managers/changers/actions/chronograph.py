@@ -4,10 +4,12 @@ from openprocurement.auctions.core.interfaces import (
 )
 from openprocurement.auctions.core.utils import (
     get_now,
-    remove_bid,
-    log_auction_status_change
+    remove_bid
 )
 
+from openprocurement.auctions.geb.managers.loggers.journal import (
+    log_status_change
+)
 from openprocurement.auctions.geb.managers.changers.base import (
     BaseAction
 )
@@ -36,7 +38,7 @@ class EndActiveRectificationAction(BaseAction):
         # switch procedure to 'active.tendering'
 
         self.context.status = 'active.tendering'
-        log_auction_status_change(self.request, self.context, self.context.status)
+        log_status_change(self.request, self.context, self.context.status, self)
 
 
 class EndActiveTenderingAction(BaseAction):
@@ -66,7 +68,7 @@ class EndActiveTenderingAction(BaseAction):
         # switch procedure to status 'unsuccessful'
         if not active_bids:
             self.context.status = 'unsuccessful'
-            log_auction_status_change(self.request, self.context, self.context.status)
+            log_status_change(self.request, self.context, self.context.status, self)
             return True
 
         # if minNumberOfQualifiedBids is 2 and is only 1 bid
@@ -75,7 +77,7 @@ class EndActiveTenderingAction(BaseAction):
 
         if min_number == 2 and len(active_bids) == 1:
             self.context.status = 'unsuccessful'
-            log_auction_status_change(self.request, self.context, self.context.status)
+            log_status_change(self.request, self.context, self.context.status, self)
             return True
 
         # after tendering period, all bids in status 'draft' are delete
@@ -85,7 +87,7 @@ class EndActiveTenderingAction(BaseAction):
 
         # switch procedure to 'active.enquiry'
         self.context.status = 'active.enquiry'
-        log_auction_status_change(self.request, self.context, self.context.status)
+        log_status_change(self.request, self.context, self.context.status, self)
 
 
 class EndActiveEnquiryAction(BaseAction):
@@ -142,7 +144,7 @@ class EndActiveEnquiryAction(BaseAction):
                 status = 'active.auction'
 
         self.context.status = status
-        log_auction_status_change(self.request, self.context, self.context.status)
+        log_status_change(self.request, self.context, self.context.status, self)
 
 
 class ChronographPatchAction(BaseAction):
@@ -9,6 +9,31 @@ from openprocurement.auctions.geb.interfaces import (
     IAction
 )
 
+VALIDATORS_PIPELINES = {}
+
+
+def get_validators_pipeline(action_types, role):
+    """
+        Validators of actions joined in order of actions
+
+        every validator is taken once, validators bypassed for role
+        are left out, so role is checked once for whole pipeline.
+        Pipelines are cached by actions types and role.
+    """
+    key = (action_types, role)
+    pipeline = VALIDATORS_PIPELINES.get(key)
+    if pipeline is None:
+        pipeline = []
+        for action_type in action_types:
+            for validator in action_type.validators:
+                if role in getattr(validator, 'bypass_roles', ()):
+                    continue
+                validator = getattr(validator, 'validator', validator)
+                if validator not in pipeline:
+                    pipeline.append(validator)
+        pipeline = VALIDATORS_PIPELINES[key] = tuple(pipeline)
+    return pipeline
+
 
 @implementer(IResourceChanger)
 class BaseResourceChanger(object):
@@ -24,6 +49,14 @@ class BaseResourceChanger(object):
                 return False
         return True
 
+    def validate(self, actions):
+        """
+            Run validators of all actions, stop on first failed validator
+        """
+        action_types = tuple(type(action) for action in actions)
+        pipeline = get_validators_pipeline(action_types, self.request.authenticated_role)
+        return self._validate(pipeline)
+
     def get_actions(self):
         actions = []
 
@@ -41,7 +74,7 @@ class BaseResourceChanger(object):
     def change(self):
         actions = self.get_actions()
         if actions:
-            if all([self._validate(action.validators) for action in actions]):
+            if self.validate(actions):
                 change = self._change()
                 if change:
                     for action in actions:
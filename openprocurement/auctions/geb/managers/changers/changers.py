@@ -90,7 +90,7 @@ class ChronographChanger(BaseResourceChanger):
     def change(self):
         actions = self.get_actions()
         if actions:
-            if all([self._validate(action.validators) for action in actions]):
+            if self.validate(actions):
                 change = self._change()
                 for action in actions:
                     action.act()
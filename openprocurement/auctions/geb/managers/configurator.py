@@ -11,8 +11,10 @@ from openprocurement.auctions.core.adapters import (
 )
 from openprocurement.auctions.core.utils import (
     set_specific_hour,
-    get_now,
-    log_auction_status_change
+    get_now
+)
+from openprocurement.auctions.geb.managers.loggers.journal import (
+    log_status_change
 )
 from openprocurement.auctions.geb.models.schemas import (
     Auction
@@ -97,7 +99,7 @@ class AuctionConfigurator(BaseAuctionConfigurator, BaseAwarding, BaseContracting
         # organizer reject award, auction switch to status 'unsuccessful'
 
         self.context.status = 'unsuccessful'
-        log_auction_status_change(self.request, self.context, self.context.status)
+        log_status_change(self.request, self.context, self.context.status, self)
 
     def back_to_awarding(self):
         self._reject_award()
@@ -1,4 +1,8 @@
-from zope.interface import implementer
+from zope.interface import (
+    implementer,
+    implementedBy,
+    providedBy
+)
 from openprocurement.auctions.geb.interfaces import (
     ICreationManager,
     IResourceCreator
@@ -10,20 +14,38 @@ from openprocurement.auctions.geb.interfaces import (
 class CreatorsFactory(object):
     """
         Creators Factory
+
+        Creator of applicant class is resolved once per creators of manager
+        and kept in routes, applicants which provide interfaces
+        not by class are resolved on every call.
     """
+    routes = {}
+
     def __init__(self, request, context, creators):
         self.request = request
         self.context = context
         self.creators = creators
 
-    def __call__(self, applicant):
-        if 'file' in self.request.validated:
-            applicant = type(self.context).documents.model_class()
-
+    def resolve(self, specification):
         for creator in self.creators:
-            if creator.resource_interface.providedBy(applicant):
+            if specification.isOrExtends(creator.resource_interface):
                 return creator
 
+    def __call__(self, applicant):
+        if 'file' in self.request.validated:
+            applicant_type = type(self.context).documents.model_class
+        else:
+            applicant_type = type(applicant)
+
+        routes = self.routes.setdefault(tuple(self.creators), {})
+        creator = routes.get(applicant_type)
+        if creator is None:
+            creator = self.resolve(implementedBy(applicant_type))
+            if creator is None:
+                return self.resolve(providedBy(applicant))
+            routes[applicant_type] = creator
+        return creator
+
 # base creators
 
 
@@ -18,6 +18,7 @@ from openprocurement.auctions.geb.interfaces import (
     IQuestion,
 )
 from openprocurement.auctions.geb.validation import (
+    validate_auction_lot_attempt,
     validate_auction_post,
     validate_auction_document_post,
     validate_bid_document_post,
@@ -36,7 +37,7 @@ class AuctionCreator(BaseCreator):
        Auction Creator
     """
     resource_interface = IAuction
-    validators = [validate_auction_post]
+    validators = [validate_auction_post, validate_auction_lot_attempt]
 
     def _create(self, auction):
         auction_id = uuid4().hex
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""
+    Dispatch of managers for view contexts
+
+    Managers are registered as multi adapters of (IRequest, resource interface),
+    so which manager serves context depends only on the class of context.
+    Managers of geb resources are resolved once, at includeme,
+    views get manager by one dict lookup.
+"""
+from pyramid.interfaces import IRequest
+from zope.interface import implementedBy
+
+from openprocurement.auctions.core.interfaces import (
+    IManager
+)
+
+
+class ManagersDispatcher(object):
+    """
+        Managers by class of context
+
+        Classes which were not resolved at includeme (e.g. registered later)
+        are resolved by adapter registry on first use and cached.
+    """
+
+    def __init__(self, registry):
+        self.registry = registry
+        self.managers = {}
+
+    def resolve(self, context_class):
+        manager = self.registry.adapters.lookup((IRequest, implementedBy(context_class)), IManager)
+        if manager is not None:
+            self.managers[context_class] = manager
+        return manager
+
+    def prepare(self, context_classes):
+        for context_class in context_classes:
+            self.resolve(context_class)
+
+    def __call__(self, request, context):
+        manager = self.managers.get(type(context))
+        if manager is None and self.resolve(type(context)) is None:
+            # context provides interfaces directly, not by class
+            return self.registry.queryMultiAdapter((request, context), IManager)
+        return self.managers[type(context)](request, context)
+
+
+def get_manager(request, context):
+    return request.registry.geb_managers(request, context)
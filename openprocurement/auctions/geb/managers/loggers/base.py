@@ -1,5 +1,5 @@
 from zope.interface import implementer
-from logging import getLogger
+from logging import INFO, getLogger
 
 from openprocurement.auctions.core.utils import (
     context_unpack
@@ -7,6 +7,32 @@ from openprocurement.auctions.core.utils import (
 from openprocurement.auctions.geb.interfaces import (
     IResourceLogger
 )
+from openprocurement.auctions.geb.managers.loggers.pipeline import (
+    sampled
+)
+
+LOGGERS = {}
+
+
+def get_class_logger(cls):
+    # logger of module of logger class, looked up once per class
+    logger = LOGGERS.get(cls)
+    if logger is None:
+        logger = LOGGERS[cls] = getLogger(cls.__module__)
+    return logger
+
+
+def log_action(logger, request, action, msg, params=None):
+    """
+        Log msg of action with context of request,
+        context is unpacked only for records which are logged,
+        actions are sampled only if sampling is configured
+    """
+    sampling = getattr(request.registry, 'geb_log_sampling', None)
+    if not logger.isEnabledFor(INFO) or (sampling and not sampled(action, sampling)):
+        return
+    extra = context_unpack(request, {'MESSAGE_ID': action}, params)
+    logger.info(msg, extra=extra)
 
 
 @implementer(IResourceLogger)
@@ -15,8 +41,7 @@ class BaseLogger(object):
     def __init__(self, request, context):
         self.request = request
         self.context = context
-        self.LOGGER = getLogger(type(self).__module__)
+        self.LOGGER = get_class_logger(type(self))
 
     def log(self, action, msg):
-        extra = context_unpack(self.request, {'MESSAGE_ID': action})
-        self.LOGGER.info(msg, extra=extra)
+        log_action(self.LOGGER, self.request, action, msg)
@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+"""
+    Journal of auction status transitions
+
+    Transitions made by actions during request are collected on request
+    and appended to journal file as JSON lines, when response is successful,
+    so the journal keeps only transitions which were saved.
+    Status changes made outside of geb actions (e.g. by core awarding)
+    are found by status of saved auction.
+"""
+import json
+import os
+import sys
+
+from bisect import bisect_left, bisect_right, insort
+from threading import Lock
+
+from openprocurement.auctions.core.utils import (
+    get_now,
+    log_auction_status_change
+)
+from openprocurement.auctions.geb.interfaces import (
+    IAuction
+)
+
+TRANSITIONS_KEY = 'geb.transitions'
+
+
+def get_transition(request, auction, previous, status, action):
+    return {
+        'date': get_now().isoformat(),
+        'auction_id': auction.id,
+        'auctionID': auction.auctionID,
+        'from': previous,
+        'to': status,
+        'action': action,
+        'role': request.authenticated_role,
+        'user': request.authenticated_userid
+    }
+
+
+def get_last_status(request):
+    transitions = request.environ.get(TRANSITIONS_KEY)
+    if transitions:
+        return transitions[-1]['to']
+    return (request.validated.get('auction_src') or {}).get('status')
+
+
+def log_status_change(request, context, status, trigger):
+    """
+        Log auction status change and record transition for journal
+
+        trigger is the action (or configurator) which changed the status
+    """
+    log_auction_status_change(request, context, status)
+
+    previous = get_last_status(request)
+    transition = get_transition(request, request.auction, previous, status, type(trigger).__name__)
+    request.environ.setdefault(TRANSITIONS_KEY, []).append(transition)
+
+
+def get_saved_transitions(request):
+    """
+        Transitions of request, with the change of status which
+        was saved, but not recorded by actions
+    """
+    transitions = list(request.environ.get(TRANSITIONS_KEY, []))
+    validated = getattr(request, 'validated', {})
+    auction = validated.get('auction')
+    if not validated.get('auction_src') or not IAuction.providedBy(auction):
+        return transitions
+    previous = get_last_status(request)
+    if auction.status != previous:
+        action = request.matched_route.name if request.matched_route else None
+        transitions.append(get_transition(request, auction, previous, auction.status, action))
+    return transitions
+
+
+class TransitionJournal(object):
+    """
+        Append only JSON lines file of transitions
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = Lock()
+
+    def write(self, transitions):
+        lines = ''.join(json.dumps(transition, sort_keys=True) + '\n' for transition in transitions)
+        with self.lock:
+            # one write of all lines, file is opened in append mode
+            # so lines of other processes are not interleaved
+            with open(self.path, 'a') as fd:
+                fd.write(lines)
+
+
+def write_transitions(event):
+    """
+        Append transitions of request to journal, if response is successful
+    """
+    journal = getattr(event.request.registry, 'geb_journal', None)
+    if not journal or event.response.status_int >= 400 or event.request.method in ('GET', 'HEAD'):
+        return
+    transitions = get_saved_transitions(event.request)
+    if transitions:
+        journal.write(transitions)
+
+
+class JournalReader(object):
+    """
+        Reader of transitions journal
+
+        journal is scanned once to index offsets of lines by auction and by date,
+        lines appended later are indexed by refresh, which reads only them,
+        history of auction is read by seeking its lines only
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.auctions = {}
+        self.size = 0
+        self.inode = None
+        self._dated = []
+        self.lock = Lock()
+        self.refresh()
+
+    def refresh(self):
+        """
+            Index lines appended since the last scan,
+            journal which was replaced or became shorter (e.g. rotated) is scanned again
+        """
+        with self.lock:
+            if not os.path.exists(self.path):
+                return
+            stat = os.stat(self.path)
+            if stat.st_ino != self.inode or stat.st_size < self.size:
+                self.auctions = {}
+                self.size = 0
+                self.inode = stat.st_ino
+                self._dated = []
+            with open(self.path) as fd:
+                fd.seek(self.size)
+                for line in fd:
+                    if not line.endswith('\n'):
+                        # line is being written, it is indexed by the next refresh
+                        break
+                    transition = json.loads(line)
+                    self.auctions.setdefault(transition['auction_id'], []).append(self.size)
+                    insort(self._dated, (transition['date'], self.size))
+                    self.size += len(line)
+
+    def _read(self, offsets):
+        transitions = []
+        with open(self.path) as fd:
+            for offset in offsets:
+                fd.seek(offset)
+                transitions.append(json.loads(fd.readline()))
+        return transitions
+
+    def history(self, auction_id):
+        """
+            Transitions of auction in order they were made
+        """
+        with self.lock:
+            offsets = list(self.auctions.get(auction_id, []))
+        return self._read(offsets)
+
+    def between(self, start=None, end=None):
+        """
+            Transitions with date in [start, end], ordered by date
+        """
+        with self.lock:
+            low = bisect_left(self._dated, (start,)) if start else 0
+            high = bisect_right(self._dated, (end, sys.maxsize)) if end else len(self._dated)
+            offsets = [offset for _, offset in self._dated[low:high]]
+        return self._read(offsets)
+
+
+READERS = {}
+READERS_LOCK = Lock()
+
+
+def get_journal_reader(path):
+    """
+        Reader of journal, kept by path and refreshed on every call,
+        so journal is scanned once per process
+    """
+    with READERS_LOCK:
+        reader = READERS.get(path)
+        if reader is None:
+            reader = READERS[path] = JournalReader(path)
+            return reader
+    reader.refresh()
+    return reader
+
+
+def replay(path, auction_id):
+    """
+        Statuses of auction from journal, starting from the first known one
+    """
+    history = get_journal_reader(path).history(auction_id)
+    if not history:
+        return []
+    return [history[0]['from']] + [transition['to'] for transition in history]
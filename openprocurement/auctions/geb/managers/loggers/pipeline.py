@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+    Queue based logging of geb
+
+    Records of geb loggers (views, utils and managers) are put into bounded queue in request thread
+    and are handled (formatted and written) by background thread
+    with handlers of parent loggers. Queue never blocks request,
+    records which do not fit into queue are dropped and counted.
+"""
+import logging
+import os
+
+from itertools import count
+from threading import Lock, Thread
+from Queue import Full, Queue
+
+from openprocurement.auctions.geb.constants import (
+    LOG_QUEUE_SIZE,
+    LOG_SAMPLING
+)
+
+SAMPLING_COUNTERS = {}
+
+
+def sampled(message_id, sampling=LOG_SAMPLING, counters=SAMPLING_COUNTERS):
+    """
+        Only one of every n messages with message_id is logged,
+        messages without sampling rate are always logged
+    """
+    rate = sampling.get(message_id)
+    if not rate:
+        return True
+    counter = counters.get(message_id)
+    if counter is None:
+        counter = counters.setdefault(message_id, count())
+    return next(counter) % rate == 0
+
+
+class QueueHandler(logging.Handler):
+    """
+        Handler which puts records into queue, handled by background thread
+        with handlers of parent of source logger
+    """
+
+    def __init__(self, source, size=LOG_QUEUE_SIZE):
+        logging.Handler.__init__(self)
+        self.source = source
+        self.queue = Queue(size)
+        self.dropped = 0
+        self._listener = None
+        self._pid = None
+        self._lock = Lock()
+
+    def ensure_listener(self):
+        # listener is started in every process, threads do not survive fork of workers
+        if self._pid == os.getpid() and self._listener.is_alive():
+            return
+        with self._lock:
+            if self._pid != os.getpid() or not self._listener.is_alive():
+                self._listener = Thread(target=self.listen, name='geb-log-listener')
+                self._listener.daemon = True
+                self._listener.start()
+                self._pid = os.getpid()
+
+    def emit(self, record):
+        self.ensure_listener()
+        try:
+            self.queue.put_nowait(record)
+        except Full:
+            self.dropped += 1
+
+    @property
+    def target(self):
+        # parent is looked up for every record, loggers created
+        # after the handler between source and its parent take its place
+        return logging.getLogger(self.source).parent
+
+    def listen(self):
+        while True:
+            record = self.queue.get()
+            if record is None:
+                break
+            try:
+                self.target.handle(record)
+            except Exception:
+                self.handleError(record)
+
+    def stop(self):
+        if self._listener and self._listener.is_alive():
+            self.queue.put(None)
+            self._listener.join()
+
+
+def enable_queue_logging(name, size=LOG_QUEUE_SIZE):
+    """
+        Handle records of logger name and its children in background thread
+        by handlers of its parent loggers
+    """
+    logger = logging.getLogger(name)
+    for handler in logger.handlers:
+        if isinstance(handler, QueueHandler):
+            return handler
+    handler = QueueHandler(name, size)
+    logger.addHandler(handler)
+    logger.propagate = False
+    return handler
@@ -53,16 +53,35 @@ class BaseListingRepresenter(object):
 class RepresentersFactory():
     """
         Base listings representer factory
+
+        Representer of resource is resolved once per representers of manager
+        and kept in routes by interfaces specification and by class of resource
     """
+    routes = {}
 
     def __init__(self, representers):
         self.representers = representers
 
-    def __call__(self, implamented):
+    def resolve(self, implamented):
         for representer in self.representers:
             if representer.resource_interface in implamented:
                 return representer
 
+    def _route(self, key, implamented):
+        routes = self.routes.setdefault(tuple(self.representers), {})
+        representer = routes.get(key)
+        if representer is None:
+            representer = self.resolve(implamented if implamented is not None else implementedBy(key))
+            if representer is not None:
+                routes[key] = representer
+        return representer
+
+    def __call__(self, implamented):
+        return self._route(implamented, implamented)
+
+    def for_class(self, resource_type):
+        return self._route(resource_type, None)
+
 
 @implementer(IRepresentationManager)
 class BaseRepresentationManager(object):
@@ -77,8 +96,7 @@ class BaseRepresentationManager(object):
 
     def represent_created(self, created):
         factory = self.factory(self.created_representers)
-        implamented = implementedBy(created.__class__)
-        representer_type = factory(implamented)
+        representer_type = factory.for_class(created.__class__)
         representer = representer_type(self.request, self.context)
         return representer.represent(created)
 
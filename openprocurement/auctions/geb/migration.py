@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+import logging
+
+from itertools import islice
+from multiprocessing.dummy import Pool
+from timeit import default_timer
+
+from openprocurement.auctions.geb.constants import (
+    DEFAULT_PROCUREMENT_METHOD_TYPE,
+    MIGRATION_BATCH_SIZE,
+    MIGRATION_SAVE_ATTEMPTS,
+    MIGRATION_WORKERS
+)
+from openprocurement.auctions.geb.models.schemas import (
+    Auction
+)
+
+LOGGER = logging.getLogger(__name__)
+SCHEMA_VERSION = 0
+SCHEMA_DOC = 'openprocurement_auctions_geb_schema'
+
+# migration steps by version they migrate from
+# step changes auction data in place and returns True if it was changed,
+# step must be idempotent, because batches after checkpoint are migrated again on resume
+MIGRATION_STEPS = {}
+
+
+def migration_step(version):
+    """
+        Register migration step of auctions from version to version + 1
+    """
+    def decorator(step):
+        MIGRATION_STEPS[version] = step
+        return step
+    return decorator
+
+
+def get_schema_doc(db):
+    return db.get(SCHEMA_DOC, {'_id': SCHEMA_DOC})
+
+
+def get_db_schema_version(db):
+    return get_schema_doc(db).get('version', 0)
+
+
+def set_db_schema_version(db, version, checkpoint=None):
+    schema_doc = get_schema_doc(db)
+    schema_doc['version'] = version
+    if checkpoint:
+        schema_doc['checkpoint'] = checkpoint
+    else:
+        schema_doc.pop('checkpoint', None)
+    db.save(schema_doc)
+
+
+def get_procurement_method_types(registry):
+    types = getattr(registry, 'auction_procurementMethodTypes', {})
+    return set(pmt for pmt, model in types.items() if model is Auction) or set([DEFAULT_PROCUREMENT_METHOD_TYPE])
+
+
+def iter_batches(db, startkey=None, batch_size=MIGRATION_BATCH_SIZE):
+    """
+        Stream all documents of database by batches in order of ids,
+        starting after startkey
+    """
+    options = {'include_docs': True, 'limit': batch_size}
+    if startkey:
+        options.update(startkey=startkey, skip=1)
+    while True:
+        rows = list(db.view('_all_docs', **options))
+        if not rows:
+            return
+        yield [row.doc for row in rows], rows[-1].id
+        if len(rows) < batch_size:
+            return
+        options.update(startkey=rows[-1].id, skip=1)
+
+
+def iter_windows(batches, size):
+    """
+        Batches grouped by windows of size,
+        the next window is read only when the previous one is requested
+    """
+    while True:
+        window = list(islice(batches, size))
+        if not window:
+            return
+        yield window
+
+
+def migrate_auction(auction, current, destination):
+    changed = False
+    for version in range(current, destination):
+        step = MIGRATION_STEPS.get(version)
+        if step and step(auction):
+            changed = True
+    return changed
+
+
+class BatchMigration(object):
+    """
+        Migration of batch of documents: migrate geb auctions and save them by one bulk request,
+        auctions which conflicted on save are reloaded and migrated again
+    """
+
+    def __init__(self, db, procurement_method_types, current, destination):
+        self.db = db
+        self.procurement_method_types = procurement_method_types
+        self.current = current
+        self.destination = destination
+
+    def is_geb_auction(self, doc):
+        return doc.get('doc_type') == 'Auction' and doc.get('procurementMethodType') in self.procurement_method_types
+
+    def migrate(self, docs):
+        auctions = [doc for doc in docs if self.is_geb_auction(doc)]
+        changed = [auction for auction in auctions if migrate_auction(auction, self.current, self.destination)]
+        migrated = 0
+        for _ in range(MIGRATION_SAVE_ATTEMPTS):
+            if not changed:
+                break
+            results = self.db.update(changed)
+            migrated += len([success for success, _, _ in results if success])
+            conflicted = [doc_id for success, doc_id, _ in results if not success]
+            changed = []
+            for doc_id in conflicted:
+                auction = self.db.get(doc_id)
+                if auction and migrate_auction(auction, self.current, self.destination):
+                    changed.append(auction)
+        failed = [auction['_id'] for auction in changed]
+        return len(docs), len(auctions), migrated, failed
+
+    def __call__(self, batch):
+        docs, last_key = batch
+        return self.migrate(docs) + (last_key,)
+
+
+def migrate_data(registry, destination=None):
+    """
+        Migrate geb auctions from current schema version of database to destination
+
+        Auctions are streamed by batches, migrated by MIGRATION_WORKERS concurrently
+        and saved by bulk requests. Batches are read by windows of MIGRATION_WORKERS,
+        so no more batches are kept in memory than are migrated at once.
+        Progress is checkpointed in schema document,
+        so interrupted migration resumes after the last completed batch.
+        If auctions of window were not saved, migration is stopped
+        before its checkpoint and version of database is not changed.
+    """
+    db = registry.db
+    destination = SCHEMA_VERSION if destination is None else destination
+    current = get_db_schema_version(db)
+    if current >= destination:
+        return current
+
+    checkpoint = get_schema_doc(db).get('checkpoint', {})
+    startkey = checkpoint.get('key') if checkpoint.get('destination') == destination else None
+    migration = BatchMigration(db, get_procurement_method_types(registry), current, destination)
+
+    LOGGER.info('Migrate geb auctions from schema version {} to {}'.format(current, destination),
+                extra={'MESSAGE_ID': 'migrate_data'})
+    start = default_timer()
+    total_docs = total_auctions = total_migrated = 0
+
+    pool = Pool(MIGRATION_WORKERS)
+    try:
+        for window in iter_windows(iter_batches(db, startkey), MIGRATION_WORKERS):
+            # the whole window is migrated before checkpoint, so it follows only completed batches
+            failed = []
+            for docs, auctions, migrated, failed_ids, last_key in pool.map(migration, window):
+                total_docs += docs
+                total_auctions += auctions
+                total_migrated += migrated
+                failed.extend(failed_ids)
+            if failed:
+                LOGGER.error('Failed to migrate auctions {}, migration is stopped at schema version {}'.format(
+                    ', '.join(failed), current), extra={'MESSAGE_ID': 'migrate_data_failed'})
+                return current
+            set_db_schema_version(db, current, {'destination': destination, 'key': last_key})
+            elapsed = default_timer() - start
+            LOGGER.info('Checked {} documents, migrated {} of {} geb auctions, {:.1f} documents/s'.format(
+                total_docs, total_migrated, total_auctions, total_docs / elapsed if elapsed else 0),
+                extra={'MESSAGE_ID': 'migrate_data_progress'})
+    finally:
+        pool.close()
+        pool.join()
+
+    set_db_schema_version(db, destination)
+    LOGGER.info('Migrated {} geb auctions to schema version {} in {:.1f}s'.format(total_migrated, destination, default_timer() - start),
+                extra={'MESSAGE_ID': 'migrate_data_done'})
+    return destination
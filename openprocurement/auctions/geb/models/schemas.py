@@ -44,10 +44,6 @@ from openprocurement.auctions.core.utils import (
     TZ,
     get_now
 )
-from openprocurement.auctions.core.validation import (
-    cpvs_validator,
-    kvtspz_validator
-)
 
 from openprocurement.auctions.geb.interfaces import (
     IAuction,
@@ -104,7 +100,9 @@ from openprocurement.auctions.geb.models.roles import (
 )
 
 from openprocurement.auctions.geb.validation import (
-    cav_ps_code_validator
+    cav_ps_code_validator,
+    cpvs_code_validator,
+    kvtspz_code_validator
 )
 from openprocurement.auctions.geb.utils import (
     calc_expected_auction_end_time
@@ -289,8 +287,8 @@ class GebClassification(Classification):
 
 class GebAdditionalClassification(Classification):
     scheme = StringType(required=True, choices=ITEM_ADDITIONAL_CLASSIFICATIONS_TYPES)
-    _id_field_validators = Classification._id_field_validators + (cpvs_validator,
-                                                                  kvtspz_validator)
+    _id_field_validators = Classification._id_field_validators + (cpvs_code_validator,
+                                                                  kvtspz_code_validator)
 
 
 @implementer(IItem)
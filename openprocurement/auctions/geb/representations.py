@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+    Cache of encoded representations
+
+    Representation of resource is identified by key,
+    e.g. auction id, revision and role of request.
+    Parts of representation computed from current time
+    are added to key by the moment they change.
+    Encoded body is kept for every content coding it was requested with,
+    so popular auctions are encoded and compressed once per revision.
+"""
+from collections import OrderedDict
+from threading import Lock
+
+from openprocurement.auctions.core.utils import (
+    get_now
+)
+from openprocurement.auctions.geb.compression import (
+    IDENTITY,
+    compress,
+    get_encoding
+)
+from openprocurement.auctions.geb.constants import (
+    REPRESENTATION_CACHE_SIZE
+)
+from openprocurement.auctions.geb.encoders import (
+    get_encoder,
+    write_json
+)
+from openprocurement.auctions.geb.utils import (
+    calc_expected_auction_end_time
+)
+
+
+class RepresentationCache(object):
+    """
+        Least recently used bodies, bounded by number of items
+    """
+
+    def __init__(self, size=REPRESENTATION_CACHE_SIZE):
+        self.size = size
+        self.items = OrderedDict()
+        self.lock = Lock()
+
+    def get(self, key):
+        with self.lock:
+            body = self.items.pop(key, None)
+            if body is not None:
+                self.items[key] = body
+            return body
+
+    def set(self, key, body):
+        with self.lock:
+            self.items.pop(key, None)
+            self.items[key] = body
+            while len(self.items) > self.size:
+                self.items.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.items.clear()
+
+    def __len__(self):
+        return len(self.items)
+
+
+def get_auction_key(request, auction):
+    """
+        Key of auction representation
+
+        auctionPeriod.shouldStartAfter is moved when module auction
+        has not happened till its expected end time,
+        so key tells whether that time has passed
+    """
+    period = auction.auctionPeriod
+    outstanding = bool(period and period.startDate and not period.endDate and
+                       get_now() > calc_expected_auction_end_time(period.startDate))
+    return ('auction', auction.id, auction.rev, request.authenticated_role, outstanding)
+
+
+def get_representation(request, key, represent):
+    """
+        Body and content coding of representation,
+        represent is called only if representation is not cached
+    """
+    cache = request.registry.geb_representations
+    encoding = get_encoding(request)
+
+    body = cache.get(key + (encoding,))
+    if body is not None:
+        return body, encoding
+
+    encoded = cache.get(key + (IDENTITY,))
+    if encoded is None:
+        encoded = get_encoder(request).encode(represent())
+        cache.set(key + (IDENTITY,), encoded)
+
+    body, encoding = compress(encoded, encoding)
+    if encoding != IDENTITY:
+        cache.set(key + (encoding,), body)
+    return body, encoding
+
+
+def render_representation(request, key, represent):
+    """
+        Write cached representation to response body and return response
+
+        Requests with renderer overridden (opt_pretty, opt_jsonp)
+        are left to that renderer.
+    """
+    if getattr(request, 'override_renderer', None):
+        return represent()
+    body, encoding = get_representation(request, key, represent)
+    return write_json(request, body, encoding)
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+from itertools import cycle
+
+from couchdb import Database
+
+from openprocurement.auctions.geb.constants import (
+    REVISION_HEADER
+)
+from openprocurement.auctions.geb.interfaces import (
+    IAuction
+)
+
+
+class ReplicaPool(object):
+    """
+        Databases for geb reads
+
+        reads are spread over replicas by round robin,
+        primary database (registry.db) is used if there are no replicas
+    """
+
+    def __init__(self, registry, replicas=()):
+        self.registry = registry
+        self.replicas = [Database(url) if isinstance(url, basestring) else url for url in replicas]
+        self._replicas = cycle(self.replicas)
+
+    @property
+    def primary(self):
+        return self.registry.db
+
+    def choose(self):
+        if not self.replicas:
+            return self.primary
+        return next(self._replicas)
+
+
+def get_replica_pool(registry):
+    pool = getattr(registry, 'geb_replicas', None)
+    if pool is None:
+        pool = registry.geb_replicas = ReplicaPool(registry)
+    return pool
+
+
+def revision_number(rev):
+    """
+        >>> revision_number('12-4b0c5a8a1d6b4a0f')
+        12
+        >>> revision_number('invalid') is None
+        True
+    """
+    try:
+        return int(rev.split('-', 1)[0])
+    except (AttributeError, ValueError):
+        return None
+
+
+def get_revision_token(request):
+    # revision of last write of client session
+    return request.headers.get(REVISION_HEADER)
+
+
+def read_doc(request, doc_id):
+    """
+        Read document from replica
+
+        if request has revision token and replica has older revision of document,
+        it is read from primary, so client sees its own writes
+    """
+    pool = get_replica_pool(request.registry)
+    db = pool.choose()
+    doc = db.get(doc_id)
+    if db is pool.primary:
+        return doc
+
+    token = get_revision_token(request)
+    if token and (doc is None or revision_number(doc['_rev']) < revision_number(token)):
+        doc = pool.primary.get(doc_id)
+    return doc
+
+
+def read_view(request, name, **options):
+    """
+        Query view of replica, or of primary if request has revision token
+    """
+    pool = get_replica_pool(request.registry)
+    db = pool.primary if get_revision_token(request) else pool.choose()
+    return db.view(name, **options)
+
+
+def read_docs(request, doc_ids):
+    """
+        Read documents by ids with one query of replica (see read_view),
+        in order of ids, missing and deleted documents are skipped
+    """
+    if not doc_ids:
+        return []
+    rows = read_view(request, '_all_docs', keys=list(doc_ids), include_docs=True)
+    return [row.doc for row in rows if row.doc]
+
+
+def get_auction_id(request):
+    # /api/<version>/auctions/<auction_id>/... as auction is extracted by core
+    parts = request.path_info.split('/')
+    if len(parts) < 5 or parts[3] != 'auctions':
+        return None
+    return parts[4] or None
+
+
+def read_auction(event):
+    """
+        Load geb auction of GET request from replica (see read_doc)
+
+        Auction is set to request before core extracts it from primary,
+        other auctions, and auctions which replica has not got yet,
+        are left to core.
+    """
+    request = event.request
+    if request.method not in ('GET', 'HEAD') or not get_replica_pool(request.registry).replicas:
+        return
+    auction_id = get_auction_id(request)
+    if not auction_id:
+        return
+    doc = read_doc(request, auction_id)
+    if doc is None or doc.get('doc_type') != 'Auction':
+        return
+    if doc.get('procurementMethodType') not in request.registry.geb_procurement_method_types:
+        return
+    request.auction = request.auction_from_data(doc)
+
+
+def set_revision_token(event):
+    """
+        Return revision of saved geb auction to client,
+        to be sent back in REVISION_HEADER of next reads
+    """
+    request = event.request
+    if request.method in ('GET', 'HEAD') or event.response.status_int >= 400:
+        return
+    auction = getattr(request, 'validated', {}).get('auction')
+    if IAuction.providedBy(auction) and auction.rev:
+        event.response.headers[REVISION_HEADER] = str(auction.rev)
@@ -1,9 +1,16 @@
 # -*- coding: utf-8 -*-
 
 from StringIO import StringIO
+from base64 import b64encode
+from cgi import parse_multipart
+from hashlib import md5
+from urllib import urlencode
+from urlparse import parse_qsl, urlparse, urlunparse
 import json
 import os
 
+from openprocurement.api.utils import SESSION
+
 from openprocurement.auctions.core.tests.base import (
     BaseWebTest as CoreBaseWebTest,
 )
@@ -31,6 +38,50 @@ class BaseWebTest(CoreBaseWebTest):
     relative_to = os.path.dirname(__file__)
     mock_config = MOCK_CONFIG
 
+    def setUp(self):
+        super(BaseWebTest, self).setUp()
+        # database is created again for every test
+        self.app.app.registry.geb_changes_consumer.reset()
+        self.app.app.registry.geb_representations.clear()
+
+    def setUpDS(self):
+        super(BaseWebTest, self).setUpDS()
+        # document service mock answers with hash of the file it received
+        # and url signed over that hash, received files are kept in docservice_uploads
+        self.docservice_uploads = []
+        base_request = SESSION.request
+        test = self
+
+        def request(method, url, **kwargs):
+            response = base_request(method, url, **kwargs)
+            if method == 'POST' and '/upload' in url:
+                content = test.read_docservice_upload(kwargs)
+                test.docservice_uploads.append(content)
+                data = response.json()
+                digest = md5(content).hexdigest()
+                data['data']['hash'] = 'md5:{}'.format(digest)
+                data['data']['url'] = data['get_url'] = test.sign_docservice_url(data['data']['url'], digest)
+                response._content = json.dumps(data)
+            return response
+        SESSION.request = request
+
+    def sign_docservice_url(self, url, digest):
+        # signature of document service url is made over key of document and its hash
+        parsed_url = urlparse(url)
+        query = dict(parse_qsl(parsed_url.query))
+        key = parsed_url.path.split('/')[-1]
+        query['Signature'] = b64encode(self.app.app.registry.docservice_key.signature('{}\0{}'.format(key, digest)))
+        return urlunparse(parsed_url._replace(query=urlencode(query)))
+
+    def read_docservice_upload(self, kwargs):
+        if kwargs.get('files'):
+            # body is built by requests
+            return kwargs['files']['file'][1].read()
+        # body is streamed as multipart/form-data
+        _, boundary = kwargs['headers']['Content-Type'].split('boundary=')
+        body = ''.join(iter(lambda: kwargs['data'].read(1024), ''))
+        return parse_multipart(StringIO(body), {'boundary': boundary})['file'][0]
+
 
 class BaseWebDocsTest(BaseWebTest):
     """
@@ -103,3 +154,25 @@ class BaseWebDocsTest(BaseWebTest):
         format_request = self.construct_request(request)
         format_response = self.construct_response(response, request)
         self.dump_to_file(format_request, format_response, filename)
+
+
+class MemoryFeed(object):
+    """
+        In memory changes feed, with the same interface as db.changes
+    """
+
+    def __init__(self):
+        self.changes = []
+
+    def change(self, doc, deleted=False):
+        change = {'id': doc['_id'], 'seq': len(self.changes) + 1}
+        if deleted:
+            change['deleted'] = True
+        else:
+            change['doc'] = doc
+        self.changes.append(change)
+
+    def __call__(self, since=0, limit=None, include_docs=False):
+        results = self.changes[since:since + limit if limit else None]
+        last_seq = results[-1]['seq'] if results else since
+        return {'results': results, 'last_seq': last_seq}
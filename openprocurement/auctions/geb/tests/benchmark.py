@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+"""
+    Benchmarks of the geb hot paths with a regression gate
+
+    Run the benchmarks and compare them with the stored baseline:
+
+        BENCHMARK=True ./bin/nosetests openprocurement.auctions.geb.tests.benchmark
+
+    Timings depend on the machine, so the baseline (benchmark_baseline.json)
+    is recorded on the reference environment and is not shipped.
+    Scenarios without stored baseline can not be compared, the run is skipped
+    with their names. Write (or refresh) the baseline after an intended change:
+
+        BENCHMARK=True BENCHMARK_UPDATE=True ./bin/nosetests openprocurement.auctions.geb.tests.benchmark
+
+    Every scenario is sampled BENCHMARK_SAMPLES times against the test database.
+    A scenario is reported as regressed when its median time grew more than
+    TOLERANCE and the one-sided Mann-Whitney U test says the slowdown
+    is significant at SIGNIFICANCE level.
+"""
+import json
+import math
+import os
+import unittest
+
+from copy import deepcopy
+from logging import getLogger
+from timeit import default_timer
+
+from openprocurement.auctions.core.tests.base import (
+    test_document_data
+)
+from openprocurement.auctions.geb.tests.base import (
+    BaseWebTest
+)
+from openprocurement.auctions.geb.tests.fixtures.active_tendering import (
+    AUCTION_WITH_BID_PENDING
+)
+from openprocurement.auctions.geb.tests.states import (
+    ProcedureMachine
+)
+
+LOGGER = getLogger(__name__)
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), 'benchmark_baseline.json')
+SAMPLES = int(os.environ.get('BENCHMARK_SAMPLES', 30))
+SIGNIFICANCE = 0.01
+TOLERANCE = 0.1
+
+# statistics
+
+
+def median(samples):
+    """
+        >>> median([3, 1, 2])
+        2
+        >>> median([4, 1, 3, 2])
+        2.5
+    """
+    ordered = sorted(samples)
+    middle = len(ordered) // 2
+    if len(ordered) % 2:
+        return ordered[middle]
+    return (ordered[middle - 1] + ordered[middle]) / 2.0
+
+
+def _rank(values):
+    # average ranks, ties get the mean of the ranks they occupy
+    ordered = sorted(range(len(values)), key=lambda i: values[i])
+    ranks = [0] * len(values)
+    i = 0
+    while i < len(ordered):
+        j = i
+        while j + 1 < len(ordered) and values[ordered[j + 1]] == values[ordered[i]]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[ordered[k]] = (i + j) / 2.0 + 1
+        i = j + 1
+    return ranks
+
+
+def slowdown_p_value(baseline, current):
+    """
+        One-sided Mann-Whitney U test (normal approximation)
+        p-value of hypothesis that current samples are not slower than baseline
+
+        >>> slowdown_p_value([1, 2, 3, 4, 5], [6, 7, 8, 9, 10]) < SIGNIFICANCE
+        True
+        >>> slowdown_p_value([6, 7, 8, 9, 10], [1, 2, 3, 4, 5]) > 0.5
+        True
+    """
+    n1, n2 = len(baseline), len(current)
+    ranks = _rank(list(baseline) + list(current))
+    u = sum(ranks[n1:]) - n2 * (n2 + 1) / 2.0
+    mean = n1 * n2 / 2.0
+    sigma = math.sqrt(n1 * n2 * (n1 + n2 + 1) / 12.0)
+    if not sigma:
+        return 1.0
+    z = (u - mean - 0.5) / sigma
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def compare(baseline, current):
+    """
+        Compare current benchmark samples with baseline samples
+        return result for every scenario of current run
+    """
+    results = []
+    for name in sorted(current):
+        samples = current[name]
+        result = {
+            'name': name,
+            'current': median(samples),
+            'baseline': None,
+            'change': None,
+            'p_value': None,
+            'regressed': False
+        }
+        if baseline.get(name):
+            result['baseline'] = median(baseline[name])
+            result['change'] = result['current'] / result['baseline'] - 1
+            result['p_value'] = slowdown_p_value(baseline[name], samples)
+            result['regressed'] = result['change'] > TOLERANCE and result['p_value'] < SIGNIFICANCE
+        results.append(result)
+    return results
+
+
+def report(results):
+    lines = ['{:<32} {:>12} {:>12} {:>9} {:>9}'.format('scenario', 'baseline ms', 'current ms', 'change', 'p-value')]
+    for result in results:
+        if result['baseline'] is None:
+            line = '{:<32} {:>12} {:>12.3f} {:>9} {:>9}'.format(result['name'], '-', result['current'] * 1000, 'new', '-')
+        else:
+            line = '{:<32} {:>12.3f} {:>12.3f} {:>+8.1f}% {:>9.4f}'.format(
+                result['name'],
+                result['baseline'] * 1000,
+                result['current'] * 1000,
+                result['change'] * 100,
+                result['p_value']
+            )
+        if result['regressed']:
+            line += '  REGRESSION'
+        lines.append(line)
+    return '\n'.join(lines)
+
+
+def load_baseline(path=BASELINE_PATH):
+    if not os.path.exists(path):
+        return {}
+    with open(path) as fd:
+        return json.load(fd)
+
+
+def dump_baseline(samples, path=BASELINE_PATH):
+    with open(path, 'w') as fd:
+        json.dump(samples, fd, indent=2, sort_keys=True)
+
+# scenarios
+# each scenario prepares the request and returns the callable that is sampled
+
+
+def auction_get(test_case):
+    # Auction.serialize
+    entrypoint = '/auctions/{}'.format(test_case.auction['data']['id'])
+    return lambda: test_case.app.get(entrypoint)
+
+
+def bid_patch(test_case):
+    # _validate_patch_data and BidChanger
+    pattern = '/auctions/{auction}/bids/{bid}?acc_token={token}'
+    entrypoint = pattern.format(auction=test_case.auction['data']['id'],
+                                bid=test_case.bid['data']['id'],
+                                token=test_case.bid['access']['token'])
+    request_data = {'data': {'qualified': True}}
+
+    def sample():
+        test_case.app.authorization = ('Basic', (test_case.bid['access']['owner'], ''))
+        test_case.app.patch_json(entrypoint, request_data)
+    return sample
+
+
+def chronograph_patch(test_case):
+    # ChronographChanger.change
+    entrypoint = '/auctions/{}'.format(test_case.auction['data']['id'])
+    request_data = {'data': {'id': test_case.auction['data']['id']}}
+
+    def sample():
+        test_case.app.authorization = ('Basic', ('chronograph', ''))
+        test_case.app.patch_json(entrypoint, request_data)
+    return sample
+
+
+def auction_document_post(test_case):
+    # CreatorsFactory and RepresentersFactory routing
+    # every sample adds document, so auction grows with documents
+    pattern = '/auctions/{auction}/documents?acc_token={token}'
+    entrypoint = pattern.format(auction=test_case.auction['data']['id'],
+                                token=test_case.auction['access']['token'])
+    document = deepcopy(test_document_data)
+    document.pop('hash')
+    document['accessDetails'] = 'test accessDetails'
+    document['documentType'] = 'x_dgfAssetFamiliarization'
+    request_data = {'data': document}
+
+    def sample():
+        test_case.app.authorization = ('Basic', (test_case.auction['access']['owner'], ''))
+        test_case.app.post_json(entrypoint, request_data)
+    return sample
+
+
+SCENARIOS = (
+    auction_get,
+    auction_document_post,
+    bid_patch,
+    chronograph_patch
+)
+
+
+def run_scenario(test_case, scenario, samples=SAMPLES):
+    sample = scenario(test_case)
+    # warm up caches and lazy imports
+    sample()
+    timings = []
+    for _ in range(samples):
+        start = default_timer()
+        sample()
+        timings.append(default_timer() - start)
+    return timings
+
+
+class BenchmarkTest(BaseWebTest):
+    """
+        Benchmark Test, runs only if BENCHMARK is set
+    """
+    docservice = True
+
+    def setUp(self):
+        super(BenchmarkTest, self).setUp()
+
+        if not os.environ.get('BENCHMARK'):
+            self.skipTest('not benchmark test')
+
+        procedure = ProcedureMachine()
+        procedure.set_db_connector(self.db)
+        procedure.toggle('active.tendering')
+        context = procedure.snapshot(fixture=AUCTION_WITH_BID_PENDING)
+
+        self.auction = context['auction']
+        self.bid = context['bids'][0]
+
+    def test_benchmarks(self):
+        current = {}
+        for scenario in SCENARIOS:
+            current[scenario.__name__] = run_scenario(self, scenario)
+
+        if os.environ.get('BENCHMARK_UPDATE'):
+            dump_baseline(current)
+            return
+
+        baseline = load_baseline()
+        results = compare(baseline, current)
+        summary = report(results)
+        LOGGER.info('Benchmark results\n{}'.format(summary))
+
+        regressions = [result['name'] for result in results if result['regressed']]
+        if regressions:
+            self.fail('Performance regression in {}\n{}'.format(', '.join(regressions), summary))
+
+        # without baseline the gate can not compare
+        missing = [result['name'] for result in results if result['baseline'] is None]
+        if missing:
+            self.skipTest('No baseline for {}, record it with BENCHMARK_UPDATE on the reference environment\n{}'.format(
+                ', '.join(missing), summary))
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(BenchmarkTest))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.main(defaultTest='suite')
@@ -1,3 +1,6 @@
+import os
+import shutil
+import tempfile
 import unittest
 from freezegun import freeze_time
 from copy import deepcopy
@@ -12,6 +15,10 @@ from openprocurement.auctions.core.utils import (
     SANDBOX_MODE
 )
 
+from openprocurement.auctions.geb.managers.loggers.journal import (
+    JournalReader,
+    TransitionJournal
+)
 from openprocurement.auctions.geb.tests.fixtures.common import (
     test_question_data
 )
@@ -394,6 +401,40 @@ def module_auction_switch_to_qualification(test_case):
 
 
 @unittest.skipIf(SANDBOX_MODE, 'If sandbox mode is it enabled generating correct periods')
+
+def module_auction_switch_to_qualification_journal(test_case):
+    # transition made by core awarding is written to journal
+    registry = test_case.app.app.registry
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, 'transitions.jsonl')
+    registry.geb_journal = TransitionJournal(path)
+    try:
+        context = test_case.procedure.snapshot(fixture=AUCTION_WITH_URLS)
+        auction = context['auction']
+        bids = context['bids']
+
+        bid_value = {"value": {"currency": "UAH", "valueAddedTaxIncluded": True}}
+        loser = deepcopy(bid_value)
+        loser['id'] = bids[0]['data']['id']
+        loser['value']['amount'] = auction['data']['value']['amount']
+        winner = deepcopy(bid_value)
+        winner['id'] = bids[1]['data']['id']
+        winner['value']['amount'] = auction['data']['value']['amount'] + auction['data']['minimalStep']['amount']
+
+        response = test_case.app.get('/auctions/{}'.format(auction['data']['id']))
+        auction_start_date = parse_date(response.json['data']['auctionPeriod']['startDate'])
+        with freeze_time(set_specific_hour(auction_start_date + timedelta(days=1), 14)):
+            auction_url = '/auctions/{}/auction'.format(auction['data']['id'])
+            test_case.app.post_json(auction_url, {'data': {'bids': [loser, winner]}})
+
+        history = JournalReader(path).history(auction['data']['id'])
+        test_case.assertEqual([(transition['from'], transition['to']) for transition in history],
+                              [('active.auction', 'active.qualification')])
+        test_case.assertEqual(history[0]['role'], 'auction')
+    finally:
+        registry.geb_journal = None
+        shutil.rmtree(directory)
+
 def module_auction_switch_to_qualification_outstanding(test_case):
     context = test_case.procedure.snapshot(fixture=AUCTION_WITH_URLS)
     auction = context['auction']
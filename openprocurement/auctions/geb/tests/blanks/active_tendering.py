@@ -1,10 +1,38 @@
 # -*- coding: utf-8 -*-
 from copy import deepcopy
+from datetime import timedelta
+from hashlib import md5
+
+import mock
+import zlib
+
+from freezegun import freeze_time
+from iso8601 import parse_date
 
 from openprocurement.auctions.core.tests.base import (
     test_document_data,
     test_organization
 )
+from openprocurement.auctions.core.utils import (
+    set_specific_hour
+)
+from openprocurement.auctions.geb.admission import (
+    AdmissionController
+)
+from openprocurement.auctions.geb.constants import (
+    COMPRESSION_MIN_SIZE,
+    REVISION_HEADER
+)
+from openprocurement.auctions.geb.models.schemas import (
+    Auction
+)
+from openprocurement.auctions.geb.storage import (
+    ReplicaPool,
+    read_doc
+)
+from openprocurement.auctions.geb.utils import (
+    MultipartFileStream
+)
 from openprocurement.auctions.geb.tests.fixtures.common import (
     test_question_data,
     test_bid_data
@@ -144,6 +172,65 @@ def auction_document_post_without_ds(test_case):
     test_case.assertEqual(file_title, response.json["data"]["title"])
 
 
+def auction_document_post_streamed(test_case):
+    file_title = 'name.doc'
+    file_info = ('file', file_title, 'content')
+    with mock.patch('openprocurement.auctions.geb.utils.LOGGER') as logger:
+        response = test_case.app.post(test_case.ENTRYPOINTS['documents'], upload_files=[file_info])
+
+    test_case.assertEqual(response.status, '201 Created')
+    document = response.json['data']
+    test_case.assertEqual(document['title'], file_title)
+    test_case.assertEqual(document['hash'], 'md5:{}'.format(md5('content').hexdigest()))
+    test_case.assertIn('download=', document['url'])
+    # document service received the file, with the same hash
+    test_case.assertEqual(test_case.docservice_uploads, ['content'])
+    test_case.assertFalse(logger.warning.called)
+
+    # document service received other bytes, document is not registered
+    documents_url = '/auctions/{}/documents'.format(test_case.auction['data']['id'])
+    documents = test_case.app.get(documents_url).json['data']
+    stream_hash = mock.PropertyMock(return_value='md5:{}'.format('0' * 32))
+    with mock.patch.object(MultipartFileStream, 'hash', new=stream_hash):
+        response = test_case.app.post(test_case.ENTRYPOINTS['documents'], upload_files=[file_info], status=422)
+    test_case.assertEqual(response.json['errors'][0]['description'],
+                          'Document was corrupted on uploading to document service.')
+    test_case.assertEqual(test_case.app.get(documents_url).json['data'], documents)
+
+
+def auction_document_download_range_without_ds(test_case):
+    file_info = ('file', 'name.doc', 'content')
+    response = test_case.app.post(test_case.ENTRYPOINTS['documents'], upload_files=[file_info])
+    document = response.json['data']
+
+    # download part of document
+    entrypoint_pattern = '/auctions/{}/documents/{}?{}'
+    entrypoint = entrypoint_pattern.format(test_case.auction['data']['id'],
+                                           document['id'],
+                                           document['url'].split('?')[-1])
+    response = test_case.app.get(entrypoint, headers={'Range': 'bytes=1-3'}, status=206)
+    test_case.assertEqual(response.status, '206 Partial Content')
+    test_case.assertEqual(response.body, 'ont')
+    test_case.assertEqual(response.headers['Content-Range'], 'bytes 1-3/7')
+
+    # download whole document
+    response = test_case.app.get(entrypoint)
+    test_case.assertEqual(response.status, '200 OK')
+    test_case.assertEqual(response.body, 'content')
+    test_case.assertEqual(response.headers['Accept-Ranges'], 'bytes')
+    etag = response.headers['ETag']
+
+    # download document which client already has
+    response = test_case.app.get(entrypoint, headers={'If-None-Match': etag}, status=304)
+    test_case.assertEqual(response.status, '304 Not Modified')
+    test_case.assertEqual(response.body, '')
+
+    # document is downloaded again if it was changed
+    response = test_case.app.get(entrypoint, headers={'If-None-Match': '"md5-changed"'})
+    test_case.assertEqual(response.status, '200 OK')
+    test_case.assertEqual(response.body, 'content')
+
+
 def auction_document_put_without_ds(test_case):
     file_title = 'name.doc'
     file_info = ('file', file_title, 'content')
@@ -240,6 +327,31 @@ def auction_document_put(test_case):
     test_case.assertEqual(document['title'], new_title)
 
 
+def auction_document_listing_versions(test_case):
+    response = test_case.app.get(test_case.ENTRYPOINTS['documents_get'])
+    documents_count = len(response.json['data'])
+
+    # put new version of document
+    new_document = deepcopy(test_document_data)
+    new_document['url'] = test_case.generate_docservice_url()
+    new_document['title'] = 'Title for new version of Document'
+
+    request_data = {'data': new_document}
+    response = test_case.app.put_json(test_case.ENTRYPOINTS['document_put'], request_data)
+    test_case.assertEqual(response.status, '200 OK')
+
+    # listing contains only actual versions
+    response = test_case.app.get(test_case.ENTRYPOINTS['documents_get'])
+    documents = response.json['data']
+    test_case.assertEqual(len(documents), documents_count)
+    document = [document for document in documents if document['id'] == test_case.document['data']['id']][0]
+    test_case.assertEqual(document['title'], new_document['title'])
+
+    # listing with all versions
+    response = test_case.app.get(test_case.ENTRYPOINTS['documents_get'] + '?all=true')
+    test_case.assertEqual(len(response.json['data']), documents_count + 1)
+
+
 def auction_document_put_offline(test_case):
     new_document = deepcopy(test_document_data)
     new_title = 'Title for new Offline Document'
@@ -400,6 +512,18 @@ def bid_document_post(test_case):
     test_case.assertEqual(expected_http_status, response.status)
 
 
+def bid_document_post_multipart(test_case):
+    file_title = 'name.doc'
+    file_info = ('file', file_title, 'content')
+    response = test_case.app.post(test_case.ENTRYPOINTS['add_bid_document'], upload_files=[file_info])
+
+    test_case.assertEqual(response.status, '201 Created')
+    document = response.json['data']
+    test_case.assertEqual(file_title, document['title'])
+    test_case.assertIn('download=', document['url'])
+    test_case.assertIn('hash', document)
+
+
 def bid_document_post_without_ds(test_case):
     file_title = 'name.doc'
     file_info = ('file', file_title, 'content')
@@ -546,6 +670,119 @@ def bid_patch_in_pending_status(test_case):
     test_case.app.authorization = auth
 
 
+def bid_patch_concurrent_save(test_case):
+    auction_id = test_case.auction['data']['id']
+    store = Auction.store
+    concurrent_title = u'Concurrent title'
+    saves = []
+
+    def store_after_concurrent_save(auction, db, *args, **kwargs):
+        # other request saves auction first
+        if not saves:
+            doc = test_case.db.get(auction_id)
+            doc['title'] = concurrent_title
+            test_case.db.save(doc)
+        saves.append(auction.id)
+        return store(auction, db, *args, **kwargs)
+
+    auth = test_case.app.authorization
+    test_case.app.authorization = ('Basic', ('{}'.format(test_case.bid['access']['owner']), ''))
+
+    expected_http_status = '200 OK'
+    request_data = {"data": {'qualified': True}}
+    with mock.patch.object(Auction, 'store', store_after_concurrent_save):
+        response = test_case.app.patch_json(test_case.ENTRYPOINTS['bid'], request_data)
+    test_case.assertEqual(expected_http_status, response.status)
+    test_case.assertEqual(len(saves), 2)
+
+    doc = test_case.db.get(auction_id)
+    test_case.assertEqual(doc['title'], concurrent_title)
+    test_case.assertTrue(doc['bids'][0]['qualified'])
+
+    test_case.app.authorization = auth
+
+
+def bid_patch_revision_token(test_case):
+    auction_id = test_case.auction['data']['id']
+    auth = test_case.app.authorization
+    test_case.app.authorization = ('Basic', ('{}'.format(test_case.bid['access']['owner']), ''))
+
+    request_data = {"data": {'qualified': True}}
+    response = test_case.app.patch_json(test_case.ENTRYPOINTS['bid'], request_data)
+    token = response.headers[REVISION_HEADER]
+    test_case.assertEqual(token, test_case.db.get(auction_id)['_rev'])
+
+    test_case.app.authorization = auth
+
+    # replica has not got the last revision yet
+    stale_doc = deepcopy(test_case.db.get(auction_id))
+    stale_doc['_rev'] = '1-stale'
+    replica = mock.Mock()
+    replica.get.return_value = stale_doc
+    registry = mock.Mock(db=test_case.db)
+    registry.geb_replicas = ReplicaPool(registry, [replica])
+
+    request = mock.Mock(registry=registry, headers={})
+    test_case.assertEqual(read_doc(request, auction_id)['_rev'], '1-stale')
+
+    request = mock.Mock(registry=registry, headers={REVISION_HEADER: token})
+    test_case.assertEqual(read_doc(request, auction_id)['_rev'], token)
+
+
+def bid_owner_portfolio(test_case):
+    auth = test_case.app.authorization
+    entrypoint = test_case.ENTRYPOINTS['portfolio']
+
+    test_case.app.authorization = None
+    response = test_case.app.get(entrypoint, status=403)
+    test_case.assertEqual(response.status, '403 Forbidden')
+
+    test_case.app.authorization = ('Basic', ('{}'.format(test_case.bid['access']['owner']), ''))
+    response = test_case.app.get(entrypoint)
+    test_case.assertEqual(response.status, '200 OK')
+    bids = [bid for bid in response.json['data'] if bid['id'] == test_case.bid['data']['id']]
+    test_case.assertEqual(len(bids), 1)
+    test_case.assertEqual(bids[0]['auction_id'], test_case.auction['data']['id'])
+    test_case.assertEqual(bids[0]['status'], 'pending')
+    test_case.assertIn('qualified', bids[0])
+
+    response = test_case.app.get(entrypoint + '?opt_fields=status')
+    test_case.assertEqual(set(response.json['data'][0]), set(['id', 'auction_id', 'status']))
+
+    response = test_case.app.get(entrypoint + '?limit=0')
+    test_case.assertEqual(response.json['data'], [])
+    test_case.assertEqual(response.json['next_page']['offset'], 0)
+
+    # bids of tenderer
+    identifier = test_case.bid['data']['tenderers'][0]['identifier']
+    query = '?tenderer_scheme={}&tenderer_id={}'
+    response = test_case.app.get(entrypoint + query.format(identifier['scheme'], identifier['id']))
+    test_case.assertIn(test_case.bid['data']['id'], [bid['id'] for bid in response.json['data']])
+    response = test_case.app.get(entrypoint + query.format(identifier['scheme'], 'other'))
+    test_case.assertEqual(response.json['data'], [])
+
+    # tenderer is identified by both scheme and id
+    response = test_case.app.get(entrypoint + '?tenderer_id={}'.format(identifier['id']), status=422)
+    test_case.assertEqual(response.status, '422 Unprocessable Entity')
+    test_case.assertEqual(response.json['errors'][0]['name'], 'tenderer_id')
+    response = test_case.app.get(entrypoint + '?tenderer_scheme={}'.format(identifier['scheme']), status=422)
+    test_case.assertEqual(response.status, '422 Unprocessable Entity')
+
+    # bids are served from indexes, auctions are not read
+    with mock.patch('couchdb.client.Database.get') as get, mock.patch('couchdb.client.Database.view') as view:
+        response = test_case.app.get(entrypoint)
+    test_case.assertEqual(response.status, '200 OK')
+    test_case.assertFalse(get.called)
+    test_case.assertFalse(view.called)
+
+    # indexes have not caught up with the changes feed
+    with mock.patch('openprocurement.auctions.geb.views.portfolio.get_indexes', return_value=None):
+        response = test_case.app.get(entrypoint, status=503)
+    test_case.assertEqual(response.status, '503 Service Unavailable')
+
+    test_case.app.authorization = auth
+
+
 def bid_patch_in_active_status(test_case):
     auth = test_case.app.authorization
 
@@ -754,3 +991,87 @@ def bid_make_activate_dump(test_case):
 
     filename = 'docs/source/tutorial/active_tendering_bid_get_active_status.http'
     test_case.dump(response.request, response, filename)
+
+
+def auction_get_encoded(test_case):
+    response = test_case.app.get(test_case.ENTRYPOINTS['get_auction'])
+    test_case.assertEqual(response.status, '200 OK')
+    test_case.assertEqual(response.content_type, 'application/json')
+    auction = response.json['data']
+    test_case.assertEqual(auction['id'], test_case.auction['data']['id'])
+
+    # pretty output is left to renderer
+    response = test_case.app.get(test_case.ENTRYPOINTS['get_auction'] + '?opt_pretty=1')
+    test_case.assertEqual(response.status, '200 OK')
+    test_case.assertIn('\n', response.body)
+    test_case.assertEqual(response.json['data'], auction)
+
+
+def auction_get_compressed(test_case):
+    response = test_case.app.get(test_case.ENTRYPOINTS['get_auction'])
+    identity = response.body
+    test_case.assertIsNone(response.content_encoding)
+
+    headers = {'Accept-Encoding': 'gzip, deflate'}
+    response = test_case.app.get(test_case.ENTRYPOINTS['get_auction'], headers=headers)
+    test_case.assertEqual(response.status, '200 OK')
+    test_case.assertIn('Accept-Encoding', response.headers['Vary'])
+    if len(identity) >= COMPRESSION_MIN_SIZE:
+        test_case.assertEqual(response.content_encoding, 'gzip')
+        test_case.assertEqual(zlib.decompress(response.body, 16 + zlib.MAX_WBITS), identity)
+    else:
+        test_case.assertEqual(response.body, identity)
+
+    # compressed representation is cached for revision of auction
+    cache = test_case.app.app.registry.geb_representations
+    cached = len(cache)
+    response = test_case.app.get(test_case.ENTRYPOINTS['get_auction'], headers=headers)
+    test_case.assertEqual(len(cache), cached)
+    test_case.assertEqual(response.status, '200 OK')
+
+
+def auction_get_should_start_after(test_case):
+    # enquiry ends the day before auction starts
+    doc = test_case.db.get(test_case.auction['data']['id'])
+    auction_start_date = parse_date(doc['auctionPeriod']['startDate'])
+    enquiry_end_date = auction_start_date - timedelta(days=1)
+    doc['enquiryPeriod']['endDate'] = enquiry_end_date.isoformat()
+    test_case.db.save(doc)
+
+    response = test_case.app.get(test_case.ENTRYPOINTS['get_auction'])
+    should_start_after = parse_date(response.json['data']['auctionPeriod']['shouldStartAfter'])
+    test_case.assertEqual(should_start_after.date(), enquiry_end_date.date() + timedelta(days=1))
+
+    # auction has not happened till its expected end,
+    # cached representation of the same revision is not returned
+    outstanding_auction_time = set_specific_hour(auction_start_date, 19)
+    with freeze_time(outstanding_auction_time):
+        response = test_case.app.get(test_case.ENTRYPOINTS['get_auction'])
+    should_start_after = parse_date(response.json['data']['auctionPeriod']['shouldStartAfter'])
+    test_case.assertEqual(should_start_after.date(), auction_start_date.date() + timedelta(days=1))
+
+
+def bid_patch_admission(test_case):
+    registry = test_case.app.app.registry
+    # one write per owner, time does not go
+    controller = AdmissionController(rate=1, burst=1, clock=lambda: 0)
+    registry.geb_admission = controller
+    auth = test_case.app.authorization
+    try:
+        test_case.app.authorization = ('Basic', ('{}'.format(test_case.bid['access']['owner']), ''))
+        request_data = {"data": {'qualified': True}}
+        response = test_case.app.patch_json(test_case.ENTRYPOINTS['bid'], request_data)
+        test_case.assertEqual(response.status, '200 OK')
+
+        response = test_case.app.patch_json(test_case.ENTRYPOINTS['bid'], request_data, status=429)
+        test_case.assertEqual(response.status, '429 Too Many Requests')
+        test_case.assertEqual(response.json['errors'][0]['description'], 'Too many requests, rate limit of owner is exceeded')
+
+        # chronograph is not limited by owner buckets
+        test_case.app.authorization = ('Basic', ('chronograph', ''))
+        request_data = {'data': {'id': test_case.auction['data']['id']}}
+        response = test_case.app.patch_json('/auctions/{}'.format(test_case.auction['data']['id']), request_data)
+        test_case.assertEqual(response.status, '200 OK')
+    finally:
+        registry.geb_admission = None
+        test_case.app.authorization = auth
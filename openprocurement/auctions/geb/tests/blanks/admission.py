@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+from openprocurement.auctions.geb.admission import (
+    RATE_LIMITED,
+    AdmissionController
+)
+
+
+def admission_exempt_roles(test_case):
+    controller = AdmissionController(rate=1, burst=1, clock=lambda: 0)
+    test_case.assertIsNone(controller.admit('bid_owner', 'broker1'))
+    test_case.assertEqual(controller.admit('bid_owner', 'broker1'), RATE_LIMITED)
+
+    # chronograph and auction module are not limited
+    for _ in range(3):
+        test_case.assertIsNone(controller.admit('chronograph', 'chronograph'))
+        test_case.assertIsNone(controller.admit('auction', 'auction'))
+    test_case.assertEqual(list(controller.buckets), ['broker1'])
+
+
+def admission_owner_rate(test_case):
+    now = [0]
+    controller = AdmissionController(rate=1, burst=2, clock=lambda: now[0])
+    test_case.assertIsNone(controller.admit('bid_owner', 'broker1'))
+    test_case.assertIsNone(controller.admit('bid_owner', 'broker1'))
+    test_case.assertEqual(controller.admit('bid_owner', 'broker1'), RATE_LIMITED)
+
+    # buckets are kept by owner
+    test_case.assertIsNone(controller.admit('bid_owner', 'broker2'))
+
+    now[0] = 1
+    test_case.assertIsNone(controller.admit('bid_owner', 'broker1'))
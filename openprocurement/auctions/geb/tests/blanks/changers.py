@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+import mock
+
+from openprocurement.auctions.geb.managers.changers.base import (
+    BaseAction,
+    BaseResourceChanger,
+    get_validators_pipeline
+)
+from openprocurement.auctions.geb.validation import (
+    bypass_roles
+)
+
+
+def make_validator(calls, name, result=True):
+    def validator(request, **kwargs):
+        calls.append(name)
+        if not result:
+            request.errors.add('body', 'data', '{} failed'.format(name))
+            request.errors.status = 403
+        return result
+    validator.__name__ = name
+    return validator
+
+
+def validator_bypass_roles(test_case):
+    calls = []
+    validator = bypass_roles('Administrator')(make_validator(calls, 'validate_status', result=False))
+    test_case.assertEqual(validator.__name__, 'validate_status')
+    test_case.assertEqual(validator.bypass_roles, frozenset(['Administrator']))
+
+    request = mock.MagicMock(authenticated_role='Administrator')
+    test_case.assertTrue(validator(request, context=None))
+    test_case.assertEqual(calls, [])
+
+    request = mock.MagicMock(authenticated_role='broker')
+    test_case.assertFalse(validator(request, context=None))
+    test_case.assertEqual(calls, ['validate_status'])
+
+
+def validators_pipeline(test_case):
+    calls = []
+    validate_period = make_validator(calls, 'validate_period')
+    validate_owner = bypass_roles('Administrator')(make_validator(calls, 'validate_owner'))
+    validate_status = make_validator(calls, 'validate_status')
+
+    class PatchAction(BaseAction):
+        validators = [validate_period, validate_owner]
+
+    class StatusAction(BaseAction):
+        validators = [validate_owner, validate_status]
+
+    action_types = (PatchAction, StatusAction)
+    # validators are taken once, in order of actions
+    pipeline = get_validators_pipeline(action_types, 'broker')
+    test_case.assertEqual(pipeline, (validate_period, validate_owner.validator, validate_status))
+    test_case.assertIs(get_validators_pipeline(action_types, 'broker'), pipeline)
+
+    # validators bypassed for role are left out
+    pipeline = get_validators_pipeline(action_types, 'Administrator')
+    test_case.assertEqual(pipeline, (validate_period, validate_status))
+
+
+def validators_pipeline_stops(test_case):
+    calls = []
+
+    class PatchAction(BaseAction):
+        validators = [make_validator(calls, 'validate_period'),
+                      make_validator(calls, 'validate_data', result=False)]
+
+    class StatusAction(BaseAction):
+        validators = [make_validator(calls, 'validate_status', result=False)]
+
+    request = mock.MagicMock(authenticated_role='broker')
+    changer = BaseResourceChanger(request, None)
+    actions = [PatchAction(request, None), StatusAction(request, None)]
+
+    test_case.assertFalse(changer.validate(actions))
+    # validators after the first failed one are not run,
+    # only errors of the failed validator are reported
+    test_case.assertEqual(calls, ['validate_period', 'validate_data'])
+    request.errors.add.assert_called_once_with('body', 'data', 'validate_data failed')
+    test_case.assertEqual(request.errors.status, 403)
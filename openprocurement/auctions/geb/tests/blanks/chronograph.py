@@ -1,3 +1,6 @@
+import os
+import shutil
+import tempfile
 import unittest
 from freezegun import freeze_time
 from iso8601 import parse_date
@@ -8,6 +11,11 @@ from openprocurement.auctions.core.utils import (
     SANDBOX_MODE
 )
 
+from openprocurement.auctions.geb.managers.loggers.journal import (
+    JournalReader,
+    TransitionJournal,
+    replay
+)
 from openprocurement.auctions.geb.tests.fixtures.active_tendering import (
     END_ACTIVE_TENDERING_AUCTION_WITH_ONE_BID,
     END_ACTIVE_TENDERING_AUCTION_WITH_TWO_BIDS,
@@ -122,6 +130,34 @@ def tendering_switch_to_enquiry(test_case):
     test_case.assertEqual(response.json['data']["status"], 'active.enquiry')
 
 
+def tendering_switch_to_enquiry_journal(test_case):
+    # status transition is written to journal
+    registry = test_case.app.app.registry
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, 'transitions.jsonl')
+    registry.geb_journal = TransitionJournal(path)
+    try:
+        context = test_case.procedure.snapshot(fixture=END_ACTIVE_TENDERING_AUCTION_WITH_TWO_BIDS)
+        auction = context['auction']
+        entrypoint = '/auctions/{}'.format(auction['data']['id'])
+
+        response = test_case.app.get(entrypoint)
+        tendering_end = parse_date(response.json['data']['tenderPeriod']['endDate'])
+
+        with freeze_time(tendering_end):
+            request_data = {'data': {'id': auction['data']['id']}}
+            test_case.app.patch_json(entrypoint, request_data)
+
+        test_case.assertEqual(replay(path, auction['data']['id']), ['active.tendering', 'active.enquiry'])
+        transition = JournalReader(path).history(auction['data']['id'])[0]
+        test_case.assertEqual(transition['action'], 'EndActiveTenderingAction')
+        test_case.assertEqual(transition['role'], 'chronograph')
+        test_case.assertEqual(len(JournalReader(path).between(start=transition['date'])), 1)
+    finally:
+        registry.geb_journal = None
+        shutil.rmtree(directory)
+
+
 def tendering_delete_draft_bids(test_case):
     # end active.tendering Period
     # chronograph check
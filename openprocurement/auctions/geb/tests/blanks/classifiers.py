@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+from openprocurement.auctions.geb.classifiers import (
+    Choices,
+    Classifier
+)
+
+
+def choices_membership(test_case):
+    choices = Choices(['draft', 'pending', 'active', 'pending'])
+    test_case.assertIn('pending', choices)
+    test_case.assertNotIn('deleted', choices)
+    test_case.assertEqual(len(choices), 3)
+    test_case.assertEqual(choices, frozenset(['active', 'draft', 'pending']))
+    test_case.assertIsInstance(choices, frozenset)
+
+
+def choices_ordering(test_case):
+    choices = Choices(iter(['pending', 'draft', 'pending', 'active', 'draft']))
+    # the first occurrence of choice keeps its place
+    test_case.assertEqual(list(choices), ['pending', 'draft', 'active'])
+    test_case.assertEqual(repr(choices), "['pending', 'draft', 'active']")
+    test_case.assertEqual(str(choices), repr(choices))
+    test_case.assertEqual(list(Choices([])), [])
+
+
+def classifier_lookup(test_case):
+    classifier = Classifier([
+        '06120000-9',
+        '06110000-6',
+        '06111000-3',
+        '06112000-0',
+        '06111000-3',
+        '06121100-7'
+    ])
+    test_case.assertEqual(len(classifier), 5)
+    test_case.assertIn('06111000-3', classifier)
+    test_case.assertNotIn('06000000-2', classifier)
+    test_case.assertEqual(list(classifier)[:2], ['06120000-9', '06110000-6'])
+
+    # codes are found by prefix in sorted order
+    test_case.assertEqual(classifier.startswith('0611'), ['06110000-6', '06111000-3', '06112000-0'])
+    test_case.assertEqual(classifier.startswith('0613'), [])
+    test_case.assertEqual(len(classifier.startswith('')), 5)
+
+    # missing levels of hierarchy are skipped
+    test_case.assertEqual(classifier.parent('06121100-7'), '06120000-9')
+    test_case.assertEqual(classifier.parent('06111000-3'), '06110000-6')
+    test_case.assertIsNone(classifier.parent('06110000-6'))
+    test_case.assertEqual(classifier.children(), ['06120000-9', '06110000-6'])
+    test_case.assertEqual(classifier.children('06110000-6'), ['06111000-3', '06112000-0'])
+    test_case.assertEqual(classifier.children('06112000-0'), [])
+    test_case.assertEqual(classifier.ancestors('06111000-3'), ['06110000-6'])
+    test_case.assertEqual(classifier.ancestors('06110000-6'), [])
+
+    test_case.assertIn('06110000-6', classifier.error_message)
+    test_case.assertIs(classifier.error_message, classifier.error_message)
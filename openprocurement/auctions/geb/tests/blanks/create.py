@@ -1,5 +1,20 @@
 from copy import deepcopy
 
+import mock
+
+from openprocurement.auctions.geb.constants import (
+    REVISION_HEADER
+)
+from openprocurement.auctions.geb.managers.base import (
+    AuctionManager
+)
+from openprocurement.auctions.geb.models.schemas import (
+    Auction
+)
+from openprocurement.auctions.geb.storage import (
+    ReplicaPool
+)
+
 
 def create_auction(test_case):
     expected_http_status = '201 Created'
@@ -140,6 +155,18 @@ def create_auction_invalid_item_additional_classifications(test_case):
     test_case.assertEqual(response.status, expected_http_status)
 
 
+def create_auction_invalid_item_additional_classification_code(test_case):
+    auction = deepcopy(test_case.auction)
+    item = auction['items'][0]
+    item['additionalClassifications'][0]['id'] = '99.99'
+
+    request_data = {"data": auction}
+    response = test_case.app.post_json(test_case.ENTRYPOINTS['auction_post'], request_data, status=422)
+    expected_http_status = '422 Unprocessable Entity'
+    test_case.assertEqual(response.status, expected_http_status)
+    test_case.assertEqual(response.json['errors'][0]['name'], 'items')
+
+
 def create_auction_invalid_value(test_case):
     # get context
     auction = deepcopy(test_case.auction)
@@ -162,3 +189,188 @@ def create_auction_dump(test_case):
     filename = 'docs/source/tutorial/create_auction.http'
 
     test_case.dump(response.request, response, filename)
+
+
+def classifiers_search(test_case):
+    expected_http_status = '200 OK'
+
+    entrypoint = test_case.ENTRYPOINTS['classifiers'].format(scheme='CAV-PS')
+    response = test_case.app.get(entrypoint + '?prefix=06111')
+    test_case.assertEqual(response.status, expected_http_status)
+    test_case.assertEqual(response.json['data'], [{'id': '06111000-3', 'parent': '06110000-6'}])
+
+    entrypoint = test_case.ENTRYPOINTS['classifier'].format(scheme='CAV-PS', code='06110000-6')
+    response = test_case.app.get(entrypoint)
+    test_case.assertEqual(response.status, expected_http_status)
+    classifier = response.json['data']
+    test_case.assertIsNone(classifier['parent'])
+    test_case.assertEqual(classifier['ancestors'], [])
+    test_case.assertEqual(classifier['children'], ['06111000-3', '06112000-0'])
+
+    # codes of additional classifications are searched too
+    for scheme, code in (('kvtspz', '01.04'), ('CPVS', 'PA01-7')):
+        entrypoint = test_case.ENTRYPOINTS['classifier'].format(scheme=scheme, code=code)
+        response = test_case.app.get(entrypoint)
+        test_case.assertEqual(response.status, expected_http_status)
+        test_case.assertEqual(response.json['data']['id'], code)
+
+    expected_http_status = '404 Not Found'
+    entrypoint = test_case.ENTRYPOINTS['classifiers'].format(scheme='CPV')
+    response = test_case.app.get(entrypoint, status=404)
+    test_case.assertEqual(response.status, expected_http_status)
+
+    entrypoint = test_case.ENTRYPOINTS['classifier'].format(scheme='CAV-PS', code='00000000-0')
+    response = test_case.app.get(entrypoint, status=404)
+    test_case.assertEqual(response.status, expected_http_status)
+
+
+def create_auction_duplicate_lot_attempt(test_case):
+    request_data = {"data": test_case.auction}
+    response = test_case.app.post_json(test_case.ENTRYPOINTS['auction_post'], request_data)
+    test_case.assertEqual(response.status, '201 Created')
+    auction = response.json['data']
+
+    expected_http_status = '409 Conflict'
+    response = test_case.app.post_json(test_case.ENTRYPOINTS['auction_post'], request_data, status=409)
+    test_case.assertEqual(response.status, expected_http_status)
+    test_case.assertEqual(response.json['errors'][0]['name'], 'lotIdentifier')
+
+    # next attempt of lot
+    request_data = {"data": deepcopy(test_case.auction)}
+    request_data['data']['tenderAttempts'] = test_case.auction['tenderAttempts'] + 1
+    response = test_case.app.post_json(test_case.ENTRYPOINTS['auction_post'], request_data)
+    test_case.assertEqual(response.status, '201 Created')
+    next_auction = response.json['data']
+
+    entrypoint = '{}?auctionID={}'.format(test_case.ENTRYPOINTS['lookup'], auction['auctionID'])
+    response = test_case.app.get(entrypoint)
+    test_case.assertEqual([found['id'] for found in response.json['data']], [auction['id']])
+
+    entrypoint = '{}?lotIdentifier={}'.format(test_case.ENTRYPOINTS['lookup'], auction['lotIdentifier'])
+    response = test_case.app.get(entrypoint)
+    test_case.assertEqual([found['id'] for found in response.json['data']], [auction['id'], next_auction['id']])
+
+    response = test_case.app.get(test_case.ENTRYPOINTS['lookup'], status=422)
+    test_case.assertEqual(response.status, '422 Unprocessable Entity')
+
+
+def auction_lookup_from_replica(test_case):
+    registry = test_case.app.app.registry
+    response = test_case.app.post_json(test_case.ENTRYPOINTS['auction_post'], {"data": test_case.auction})
+    auction = response.json['data']
+    entrypoint = '{}?auctionID={}'.format(test_case.ENTRYPOINTS['lookup'], auction['auctionID'])
+
+    # replica has not got the last revision of auction yet
+    server = registry.couchdb_server
+    name = '{}_replica'.format(test_case.db.name)
+    replica = server.create(name)
+    try:
+        doc = test_case.db.get(auction['id'])
+        stale_doc = dict(doc, status='cancelled')
+        del stale_doc['_rev']
+        replica.save(stale_doc)
+
+        with mock.patch.object(registry, 'geb_replicas', ReplicaPool(registry, [replica])):
+            response = test_case.app.get(entrypoint)
+            test_case.assertEqual(response.json['data'][0]['status'], 'cancelled')
+
+            # client which sent revision of its write reads from primary
+            response = test_case.app.get(entrypoint, headers={REVISION_HEADER: doc['_rev']})
+            test_case.assertEqual(response.json['data'][0]['status'], auction['status'])
+    finally:
+        del server[name]
+
+
+def auction_lookup_by_views(test_case):
+    request_data = {"data": deepcopy(test_case.auction)}
+    response = test_case.app.post_json(test_case.ENTRYPOINTS['auction_post'], request_data)
+    auction = response.json['data']
+    request_data['data']['tenderAttempts'] = test_case.auction['tenderAttempts'] + 1
+    response = test_case.app.post_json(test_case.ENTRYPOINTS['auction_post'], request_data)
+    next_auction = response.json['data']
+
+    # indexes of process have not caught up with the changes feed
+    with mock.patch('openprocurement.auctions.geb.views.lookup.get_indexes', return_value=None):
+        entrypoint = '{}?auctionID={}'.format(test_case.ENTRYPOINTS['lookup'], auction['auctionID'])
+        response = test_case.app.get(entrypoint)
+        test_case.assertEqual(response.status, '200 OK')
+        test_case.assertEqual(response.json['data'], [
+            dict((field, auction[field]) for field in ('id', 'auctionID', 'lotIdentifier', 'tenderAttempts', 'status'))
+        ])
+
+        entrypoint = '{}?lotIdentifier={}'.format(test_case.ENTRYPOINTS['lookup'], auction['lotIdentifier'])
+        response = test_case.app.get(entrypoint)
+        test_case.assertEqual([found['id'] for found in response.json['data']], [auction['id'], next_auction['id']])
+
+        entrypoint = '{}?lotIdentifier={}'.format(test_case.ENTRYPOINTS['lookup'], 'unknown')
+        response = test_case.app.get(entrypoint)
+        test_case.assertEqual(response.json['data'], [])
+
+
+def auction_get_from_replica(test_case):
+    registry = test_case.app.app.registry
+    response = test_case.app.post_json(test_case.ENTRYPOINTS['auction_post'], {"data": test_case.auction})
+    auction = response.json['data']
+    entrypoint = '/auctions/{}'.format(auction['id'])
+
+    server = registry.couchdb_server
+    name = '{}_replica'.format(test_case.db.name)
+    replica = server.create(name)
+    try:
+        doc = test_case.db.get(auction['id'])
+        stale_doc = dict(doc, title='Stale title')
+        del stale_doc['_rev']
+        replica.save(stale_doc)
+
+        with mock.patch.object(registry, 'geb_replicas', ReplicaPool(registry, [replica])):
+            response = test_case.app.get(entrypoint)
+            test_case.assertEqual(response.json['data']['title'], 'Stale title')
+            response = test_case.app.get('{}/items'.format(entrypoint))
+            test_case.assertEqual(response.status, '200 OK')
+
+            # client which sent revision of its write reads from primary
+            response = test_case.app.get(entrypoint, headers={REVISION_HEADER: doc['_rev']})
+            test_case.assertEqual(response.json['data']['title'], auction['title'])
+
+            # auction which replica has not got yet is read from primary
+            del replica[auction['id']]
+            response = test_case.app.get(entrypoint)
+            test_case.assertEqual(response.json['data']['title'], auction['title'])
+    finally:
+        del server[name]
+
+
+def create_auction_lot_attempt_across_workers(test_case):
+    registry = test_case.app.app.registry
+    request_data = {"data": test_case.auction}
+    response = test_case.app.post_json(test_case.ENTRYPOINTS['auction_post'], request_data)
+    auction = response.json['data']
+
+    # duplicate is found by worker which has not indexed the auction yet
+    registry.geb_changes_consumer.reset()
+    response = test_case.app.post_json(test_case.ENTRYPOINTS['auction_post'], request_data, status=409)
+    test_case.assertEqual(response.json['errors'][0]['name'], 'lotIdentifier')
+
+    # attempt of cancelled auction can be made again
+    doc = test_case.db.get(auction['id'])
+    doc['status'] = 'cancelled'
+    test_case.db.save(doc)
+    response = test_case.app.post_json(test_case.ENTRYPOINTS['auction_post'], request_data)
+    test_case.assertEqual(response.status, '201 Created')
+
+
+def managers_dispatch(test_case):
+    registry = test_case.app.app.registry
+    dispatcher = registry.geb_managers
+    test_case.assertIs(dispatcher.managers[Auction], AuctionManager)
+
+    request = mock.Mock(registry=registry)
+    context = Auction(test_case.auction)
+    with mock.patch.object(registry, 'queryMultiAdapter') as query:
+        manager = dispatcher(request, context)
+    test_case.assertIsInstance(manager, AuctionManager)
+    test_case.assertIs(manager.context, context)
+    query.assert_not_called()
+
+    # contexts without registered manager are resolved by adapter registry
+    test_case.assertIsNone(dispatcher(request, object()))
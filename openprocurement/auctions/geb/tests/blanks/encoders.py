@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+import json
+
+from datetime import datetime
+from decimal import Decimal
+
+from openprocurement.auctions.geb.compression import (
+    IDENTITY,
+    compress
+)
+from openprocurement.auctions.geb.encoders import (
+    BACKENDS,
+    Encoded,
+    JSONEncoder
+)
+from openprocurement.auctions.geb.representations import (
+    RepresentationCache
+)
+
+
+def encode_values(test_case):
+    data = {
+        'value': {'amount': 100.5},
+        'quantity': Decimal('0.1000000000000000000001'),
+        'date': datetime(2018, 3, 1, 10, 0),
+        'title': u'лот'
+    }
+    expected = json.dumps({
+        'value': {'amount': 100.5},
+        'quantity': '0.1000000000000000000001',
+        'date': '2018-03-01T10:00:00',
+        'title': u'лот'
+    }, sort_keys=True)
+    for backend in BACKENDS:
+        encoded = JSONEncoder(backend).encode(data)
+        test_case.assertIsInstance(encoded, Encoded)
+        # every backend writes Decimal exactly, as string of DecimalType
+        test_case.assertEqual(json.dumps(json.loads(encoded), sort_keys=True), expected)
+    # and backends are interchangeable for cached representations
+    test_case.assertEqual(len(set(JSONEncoder(backend).encode(data) for backend in BACKENDS)), 1)
+
+    with test_case.assertRaises(TypeError):
+        JSONEncoder().encode({'value': object()})
+    with test_case.assertRaises(ValueError):
+        JSONEncoder('unknown')
+
+
+def encode_encoded(test_case):
+    encoded = Encoded('{"data":{}}')
+    test_case.assertIs(JSONEncoder().encode(encoded), encoded)
+
+
+def compress_bodies(test_case):
+    body = Encoded('{"data":{}}')
+    test_case.assertEqual(compress(body, 'gzip'), (body, IDENTITY))
+
+    body = Encoded(json.dumps({'data': [{'id': i} for i in range(1000)]}))
+    for encoding in ('gzip', 'deflate'):
+        compressed, coding = compress(body, encoding)
+        test_case.assertEqual(coding, encoding)
+        test_case.assertLess(len(compressed), len(body))
+
+
+def representation_cache_lru(test_case):
+    cache = RepresentationCache(size=2)
+    cache.set(('auction', '1-a'), 'first')
+    cache.set(('auction', '2-b'), 'second')
+    test_case.assertEqual(cache.get(('auction', '1-a')), 'first')
+
+    # least recently used is dropped
+    cache.set(('auction', '3-c'), 'third')
+    test_case.assertEqual(len(cache), 2)
+    test_case.assertIsNone(cache.get(('auction', '2-b')))
+    test_case.assertEqual(cache.get(('auction', '1-a')), 'first')
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+import os
+import shutil
+import tempfile
+import time
+
+import mock
+
+from openprocurement.auctions.geb.indexes import (
+    ChangesConsumer,
+    db_changes_feed,
+    get_indexes
+)
+from openprocurement.auctions.geb.tests.base import (
+    MemoryFeed
+)
+
+
+def auction_doc(auction_id, **kwargs):
+    doc = {
+        '_id': auction_id,
+        'doc_type': 'Auction',
+        'procurementMethodType': 'landlease',
+        'auctionID': 'UA-{}'.format(auction_id),
+        'lotIdentifier': 'lot',
+        'tenderAttempts': 1,
+        'status': 'active.tendering',
+        'next_check': '2018-01-01T00:00:00+02:00',
+        'bids': [{
+            'id': '{}-bid'.format(auction_id),
+            'owner': 'broker',
+            'status': 'pending',
+            'tenderers': [{'identifier': {'scheme': 'UA-EDR', 'id': '00037256'}}]
+        }]
+    }
+    doc.update(kwargs)
+    return doc
+
+
+def indexes_changes_consume(test_case):
+    feed = MemoryFeed()
+    consumer = ChangesConsumer(feed, ['landlease'], batch_size=2)
+
+    feed.change(auction_doc('a', next_check='2018-01-02T00:00:00+02:00'))
+    feed.change(auction_doc('b', lotIdentifier='other'))
+    feed.change(auction_doc('c', procurementMethodType='dgfOtherAssets'))
+    feed.change({'_id': 'schema'})
+    test_case.assertEqual(consumer.poll(), 4)
+
+    indexes = consumer.indexes
+    test_case.assertEqual(indexes.next_checks(), ['b', 'a'])
+    test_case.assertEqual(indexes.next_checks(until='2018-01-01T12:00:00+02:00'), ['b'])
+    test_case.assertEqual(indexes.by_status('active.tendering'), ['a', 'b'])
+    test_case.assertEqual(indexes.by_auction_id('UA-a'), 'a')
+    test_case.assertIsNone(indexes.by_auction_id('UA-c'))
+    test_case.assertEqual([auction['id'] for auction in indexes.by_lot('lot')], ['a'])
+    test_case.assertEqual([bid['id'] for bid in indexes.bids_by_owner('broker')], ['a-bid', 'b-bid'])
+    test_case.assertEqual(len(indexes.bids_by_tenderer('UA-EDR', '00037256')), 2)
+
+    # only new changes are processed
+    feed.change(auction_doc('a', status='active.enquiry', bids=[]))
+    feed.change(auction_doc('b'), deleted=True)
+    test_case.assertEqual(consumer.poll(), 2)
+    test_case.assertEqual(consumer.poll(), 0)
+
+    test_case.assertEqual(indexes.by_status('active.tendering'), [])
+    test_case.assertEqual(indexes.by_status('active.enquiry'), ['a'])
+    test_case.assertEqual(indexes.next_checks(), ['a'])
+    test_case.assertEqual(indexes.bids_by_owner('broker'), [])
+
+
+def indexes_checkpoint(test_case):
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, 'indexes.json')
+    try:
+        feed = MemoryFeed()
+        feed.change(auction_doc('a'))
+        consumer = ChangesConsumer(feed, ['landlease'], path)
+        consumer.poll()
+        consumer.checkpoint(path)
+        # temporary file of process is renamed to checkpoint
+        test_case.assertEqual(os.listdir(directory), ['indexes.json'])
+
+        feed.change(auction_doc('b'))
+        restored = ChangesConsumer(feed, ['landlease'], path)
+        test_case.assertEqual(restored.since, 1)
+        test_case.assertEqual(restored.indexes.by_status('active.tendering'), ['a'])
+        test_case.assertEqual(restored.poll(), 1)
+        test_case.assertEqual(restored.indexes.by_status('active.tendering'), ['a', 'b'])
+        test_case.assertEqual([bid['id'] for bid in restored.indexes.bids_by_owner('broker')], ['a-bid', 'b-bid'])
+    finally:
+        shutil.rmtree(directory)
+
+
+def indexes_catch_up(test_case):
+    feed = MemoryFeed()
+    consumer = ChangesConsumer(feed, ['landlease'], batch_size=1, interval=0)
+    feed.change(auction_doc('a'))
+    feed.change(auction_doc('b', lotIdentifier='other'))
+
+    # polling in background is disabled, request reads one batch of changes,
+    # indexes are not given until the end of feed is read
+    request = mock.Mock()
+    request.registry.geb_changes_consumer = consumer
+    test_case.assertIsNone(get_indexes(request))
+    test_case.assertEqual(consumer.indexes.by_status('active.tendering'), ['a'])
+    test_case.assertFalse(consumer.running)
+
+    # catch up is skipped while feed is polled
+    with consumer.lock:
+        test_case.assertEqual(consumer.catch_up(), 0)
+    test_case.assertEqual(consumer.poll(), 1)
+    test_case.assertEqual(get_indexes(request).by_status('active.tendering'), ['a', 'b'])
+
+    # indexes are built again after reset
+    consumer.reset()
+    test_case.assertFalse(consumer.ready.is_set())
+
+
+def indexes_background_polling(test_case):
+    feed = MemoryFeed()
+    consumer = ChangesConsumer(feed, ['landlease'], interval=0.01)
+    feed.change(auction_doc('a'))
+
+    # the first request starts thread and waits for indexes to catch up
+    request = mock.Mock()
+    request.registry.geb_changes_consumer = consumer
+    try:
+        indexes = get_indexes(request, timeout=1)
+        test_case.assertFalse(consumer.start())
+        test_case.assertTrue(consumer.running)
+        test_case.assertEqual(indexes.by_auction_id('UA-a'), 'a')
+
+        feed.change(auction_doc('b'))
+        for _ in range(100):
+            if consumer.indexes.by_auction_id('UA-b'):
+                break
+            time.sleep(0.01)
+        test_case.assertEqual(consumer.indexes.by_auction_id('UA-b'), 'b')
+
+        # requests only read indexes
+        with mock.patch.object(consumer, 'catch_up') as catch_up:
+            test_case.assertIs(get_indexes(request), consumer.indexes)
+        test_case.assertFalse(catch_up.called)
+    finally:
+        consumer.stop()
+    test_case.assertFalse(consumer.running)
+
+
+def indexes_db_changes(test_case):
+    consumer = test_case.app.app.registry.geb_changes_consumer
+    consumer.poll()
+    test_case.assertEqual(consumer.indexes.by_auction_id(test_case.auction['data']['auctionID']),
+                          test_case.auction['data']['id'])
+
+
+def indexes_db_changes_filtered(test_case):
+    registry = test_case.app.app.registry
+    test_case.db.save(auction_doc('other', procurementMethodType='dgfOtherAssets'))
+    test_case.db.save({'_id': 'other_doc'})
+
+    # database sends only changes of geb auctions
+    feed = db_changes_feed(registry, registry.geb_procurement_method_types)
+    ids = [change['id'] for change in feed(since=0, include_docs=True)['results']]
+    test_case.assertIn(test_case.auction['data']['id'], ids)
+    test_case.assertNotIn('other', ids)
+    test_case.assertNotIn('other_doc', ids)
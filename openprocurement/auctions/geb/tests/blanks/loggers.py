@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+import json
+import logging
+import os
+import shutil
+import tempfile
+
+import mock
+
+from openprocurement.auctions.geb.managers.loggers.base import (
+    log_action
+)
+from openprocurement.auctions.geb.managers.loggers import journal as journal_module
+from openprocurement.auctions.geb.managers.loggers.journal import (
+    TransitionJournal,
+    get_journal_reader,
+    replay
+)
+from openprocurement.auctions.geb.managers.loggers.pipeline import (
+    QueueHandler,
+    sampled
+)
+
+
+class MemoryHandler(logging.Handler):
+
+    def __init__(self):
+        logging.Handler.__init__(self)
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(self.format(record))
+
+
+def log_sampling(test_case):
+    sampling = {'sampled_message': 3}
+    counters = {}
+    logged = [sampled('sampled_message', sampling, counters) for _ in range(6)]
+    test_case.assertEqual(logged, [True, False, False, True, False, False])
+    test_case.assertTrue(all(sampled('other_message', sampling, counters) for _ in range(3)))
+    test_case.assertEqual(list(counters), ['sampled_message'])
+
+
+def log_action_lazy(test_case):
+    logger = logging.getLogger('geb.tests.action')
+    logger.propagate = False
+    memory = MemoryHandler()
+    logger.addHandler(memory)
+    request = mock.MagicMock()
+    request.registry.geb_log_sampling = {}
+    path = 'openprocurement.auctions.geb.managers.loggers.base.context_unpack'
+    try:
+        with mock.patch(path, return_value={'MESSAGE_ID': 'auction_patch'}) as context_unpack:
+            logger.setLevel(logging.WARNING)
+            log_action(logger, request, 'auction_patch', 'Updated auction')
+            test_case.assertFalse(context_unpack.called)
+
+            logger.setLevel(logging.INFO)
+            log_action(logger, request, 'auction_patch', 'Updated auction', {'document_id': 'document_id'})
+            context_unpack.assert_called_once_with(request, {'MESSAGE_ID': 'auction_patch'}, {'document_id': 'document_id'})
+
+            # every record is logged without configured sampling
+            for _ in range(3):
+                log_action(logger, request, 'auction_bid_patch', 'Updated auction bid')
+
+            request.registry.geb_log_sampling = {'sampled_bid_patch': 3}
+            for _ in range(3):
+                log_action(logger, request, 'sampled_bid_patch', 'Sampled auction bid')
+    finally:
+        logger.removeHandler(memory)
+        logger.setLevel(logging.NOTSET)
+    test_case.assertEqual(memory.messages, ['Updated auction'] + ['Updated auction bid'] * 3 + ['Sampled auction bid'])
+
+
+def log_queue(test_case):
+    target = logging.getLogger('geb.tests.queue.target')
+    target.propagate = False
+    memory = MemoryHandler()
+    target.addHandler(memory)
+
+    logger = logging.getLogger('geb.tests.queue.target.source')
+    logger.propagate = False
+    handler = QueueHandler(logger.name, size=10)
+    logger.addHandler(handler)
+    try:
+        logger.warning('Updated auction bid %s', 'bid_id')
+        handler.stop()
+    finally:
+        logger.removeHandler(handler)
+        target.removeHandler(memory)
+    test_case.assertEqual(memory.messages, ['Updated auction bid bid_id'])
+    test_case.assertEqual(handler.dropped, 0)
+
+
+def log_queue_target_resolved_on_emit(test_case):
+    logger = logging.getLogger('geb.tests.late.parent.source')
+    logger.propagate = False
+    handler = QueueHandler(logger.name, size=10)
+    logger.addHandler(handler)
+
+    # parent logger is configured after the handler was added
+    parent = logging.getLogger('geb.tests.late.parent')
+    parent.propagate = False
+    memory = MemoryHandler()
+    parent.addHandler(memory)
+    try:
+        logger.warning('Updated auction bid %s', 'bid_id')
+        handler.stop()
+    finally:
+        logger.removeHandler(handler)
+        parent.removeHandler(memory)
+    test_case.assertIs(handler.target, parent)
+    test_case.assertEqual(memory.messages, ['Updated auction bid bid_id'])
+
+
+def transition(auction_id, date, previous, status):
+    return {'auction_id': auction_id, 'date': date, 'from': previous, 'to': status}
+
+
+def journal_refresh(test_case):
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, 'transitions.jsonl')
+    journal = TransitionJournal(path)
+    try:
+        journal.write([transition('a', '2018-01-01', 'active.tendering', 'active.enquiry'),
+                       transition('b', '2018-01-02', 'active.tendering', 'active.enquiry')])
+        reader = get_journal_reader(path)
+        test_case.assertEqual(replay(path, 'a'), ['active.tendering', 'active.enquiry'])
+
+        # only appended lines are read by the next replay
+        size = reader.size
+        journal.write([transition('a', '2018-01-03', 'active.enquiry', 'active.auction')])
+        with mock.patch.object(journal_module, 'json', wraps=json) as journal_json:
+            test_case.assertEqual(replay(path, 'a'), ['active.tendering', 'active.enquiry', 'active.auction'])
+        # one appended line is indexed, two lines of history are read
+        test_case.assertEqual(journal_json.loads.call_count, 3)
+        test_case.assertGreater(reader.size, size)
+        test_case.assertIs(get_journal_reader(path), reader)
+
+        test_case.assertEqual([line['auction_id'] for line in reader.between(start='2018-01-02')], ['b', 'a'])
+        test_case.assertEqual([line['auction_id'] for line in reader.between(end='2018-01-02')], ['a', 'b'])
+
+        # journal which was replaced is scanned again
+        os.remove(path)
+        TransitionJournal(path).write([transition('c', '2018-01-04', 'active.tendering', 'active.enquiry')])
+        test_case.assertEqual(replay(path, 'a'), [])
+        test_case.assertEqual(replay(path, 'c'), ['active.tendering', 'active.enquiry'])
+    finally:
+        shutil.rmtree(directory)
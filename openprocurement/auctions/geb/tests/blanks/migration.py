@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+import mock
+
+from threading import Lock
+
+from openprocurement.auctions.geb.includeme import (
+    load_plugins
+)
+from openprocurement.auctions.geb.migration import (
+    MIGRATION_STEPS,
+    BatchMigration,
+    get_db_schema_version,
+    get_schema_doc,
+    migrate_data,
+    set_db_schema_version
+)
+
+
+def add_migrated_field(auction):
+    if auction.get('migrated'):
+        return False
+    auction['migrated'] = True
+    return True
+
+
+def migrate_auctions(test_case):
+    registry = test_case.app.app.registry
+
+    with mock.patch.dict(MIGRATION_STEPS, {0: add_migrated_field}):
+        version = migrate_data(registry, destination=1)
+    test_case.assertEqual(version, 1)
+    test_case.assertEqual(get_db_schema_version(test_case.db), 1)
+    test_case.assertNotIn('checkpoint', get_schema_doc(test_case.db))
+
+    auction = test_case.db.get(test_case.auction['data']['id'])
+    test_case.assertTrue(auction['migrated'])
+
+    # migration is done only once
+    rev = auction['_rev']
+    with mock.patch.dict(MIGRATION_STEPS, {0: add_migrated_field}):
+        version = migrate_data(registry, destination=1)
+    test_case.assertEqual(version, 1)
+    test_case.assertEqual(test_case.db.get(test_case.auction['data']['id'])['_rev'], rev)
+
+
+def migrate_auctions_resume(test_case):
+    registry = test_case.app.app.registry
+    auction_id = test_case.auction['data']['id']
+
+    # checkpoint is after migrated auction
+    set_db_schema_version(test_case.db, 0, {'destination': 1, 'key': auction_id})
+    with mock.patch.dict(MIGRATION_STEPS, {0: add_migrated_field}):
+        migrate_data(registry, destination=1)
+    test_case.assertNotIn('migrated', test_case.db.get(auction_id))
+    test_case.assertEqual(get_db_schema_version(test_case.db), 1)
+
+
+def migrate_auctions_by_windows(test_case):
+    registry = test_case.app.app.registry
+    lock = Lock()
+    read = []
+    migrated = []
+    ahead = []
+
+    def iter_batches(db, startkey=None):
+        for number in range(10):
+            read.append(number)
+            yield [], str(number)
+
+    def migrate(self, docs):
+        with lock:
+            ahead.append(len(read) - len(migrated))
+        with lock:
+            migrated.append(docs)
+        return 0, 0, 0, []
+
+    with mock.patch('openprocurement.auctions.geb.migration.iter_batches', iter_batches), \
+            mock.patch('openprocurement.auctions.geb.migration.MIGRATION_WORKERS', 2), \
+            mock.patch.object(BatchMigration, 'migrate', migrate):
+        migrate_data(registry, destination=1)
+
+    test_case.assertEqual(len(migrated), 10)
+    # batches are not read ahead of workers
+    test_case.assertLessEqual(max(ahead), 2)
+    test_case.assertEqual(get_db_schema_version(test_case.db), 1)
+
+
+def migrate_auctions_failed(test_case):
+    registry = test_case.app.app.registry
+    checkpoint = {'destination': 1, 'key': 'checkpoint'}
+    set_db_schema_version(test_case.db, 0, checkpoint)
+
+    def iter_batches(db, startkey=None):
+        yield [], 'first'
+        yield [], 'second'
+
+    def migrate(self, docs):
+        return 0, 1, 0, ['auction_id']
+
+    with mock.patch('openprocurement.auctions.geb.migration.iter_batches', iter_batches), \
+            mock.patch.object(BatchMigration, 'migrate', migrate):
+        version = migrate_data(registry, destination=1)
+
+    # auctions which were not saved are migrated again on the next run
+    test_case.assertEqual(version, 0)
+    test_case.assertEqual(get_db_schema_version(test_case.db), 0)
+    test_case.assertEqual(get_schema_doc(test_case.db)['checkpoint'], checkpoint)
+
+
+def migration_plugin_loaded(test_case):
+    config = mock.MagicMock()
+    entry_point = mock.MagicMock()
+    with mock.patch('openprocurement.auctions.geb.includeme.iter_entry_points',
+                    return_value=[entry_point]) as iter_entry_points:
+        load_plugins(config, {'geb.migration': None})
+
+    iter_entry_points.assert_called_once_with('openprocurement.auctions.geb.plugins', 'geb.migration')
+    entry_point.load.return_value.assert_called_once_with(config.registry)
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+from StringIO import StringIO
+from cgi import parse_header, parse_multipart
+from hashlib import md5
+
+from openprocurement.auctions.geb.constants import (
+    DOCUMENT_BLACKLISTED_FIELDS
+)
+from openprocurement.auctions.geb.models.schemas import (
+    AuctionDocument
+)
+from openprocurement.auctions.geb.utils import (
+    MultipartFileStream,
+    copy_document_fields,
+    get_document_copy_plan,
+    merge_auction_changes
+)
+
+
+def copy_document_version(test_case):
+    source = AuctionDocument({
+        'id': '1' * 32,
+        'title': u'паспорт.pdf',
+        'description': u'паспорт лоту',
+        'format': 'application/pdf',
+        'url': 'http://localhost/get/1',
+        'documentType': 'x_dgfAssetFamiliarization',
+        'accessDetails': u'за адресою',
+        'datePublished': '2018-03-01T10:00:00+02:00',
+        'language': 'uk'
+    })
+    target = AuctionDocument({
+        'title': u'паспорт_2.pdf',
+        'format': 'application/msword',
+        'url': 'http://localhost/get/2'
+    })
+
+    plan = get_document_copy_plan(AuctionDocument, DOCUMENT_BLACKLISTED_FIELDS)
+    test_case.assertIs(plan, get_document_copy_plan(AuctionDocument, DOCUMENT_BLACKLISTED_FIELDS))
+    copy_document_fields(source, target, plan)
+
+    target.validate()
+    for name in plan:
+        test_case.assertEqual(getattr(target, name), getattr(source, name))
+    # blacklisted fields are left as they are in the new version
+    test_case.assertEqual(target.title, u'паспорт_2.pdf')
+    test_case.assertEqual(target.format, 'application/msword')
+    test_case.assertEqual(target.url, 'http://localhost/get/2')
+    test_case.assertIsNone(target.accessDetails)
+
+
+def multipart_file_stream(test_case):
+    content = 'content of file ' * 10
+    stream = MultipartFileStream(u'паспорт.pdf', StringIO(content), 'application/pdf', chunk_size=16)
+
+    body = ''.join(stream)
+    test_case.assertEqual(len(stream), len(body))
+    test_case.assertEqual(stream.file_size, len(content))
+    test_case.assertEqual(stream.hash, 'md5:{}'.format(md5(content).hexdigest()))
+
+    # body is multipart/form-data with the single field 'file'
+    content_type, params = parse_header(stream.content_type)
+    test_case.assertEqual(content_type, 'multipart/form-data')
+    test_case.assertTrue(body.startswith('--{}\r\n'.format(params['boundary'])))
+    test_case.assertTrue(body.endswith('\r\n--{}--\r\n'.format(params['boundary'])))
+    test_case.assertIn('Content-Type: application/pdf\r\n', body)
+    fields = parse_multipart(StringIO(body), params)
+    test_case.assertEqual(fields.keys(), ['file'])
+    test_case.assertEqual(fields['file'], [content])
+
+
+def multipart_file_stream_read(test_case):
+    content = 'content'
+    stream = MultipartFileStream('name.doc', StringIO(content), 'application/msword', chunk_size=2)
+    body = ''.join(stream)
+
+    # body is read by parts of any size, across chunks of file
+    stream.rewind()
+    parts = [stream.read(5) for _ in range(len(body) // 5 + 1)]
+    test_case.assertTrue(all(len(part) == 5 for part in parts[:-1]))
+    test_case.assertEqual(''.join(parts), body)
+    test_case.assertEqual(stream.read(5), '')
+
+    # stream is sent again from the beginning after rewind, hash is the same
+    stream.rewind()
+    test_case.assertEqual(stream.read(), body)
+    test_case.assertEqual(stream.hash, 'md5:{}'.format(md5(content).hexdigest()))
+
+
+def merge_concurrent_auction_changes(test_case):
+    src = {'status': 'active.tendering', 'title': u'лот', 'bids': [{'id': '1', 'status': 'draft'}]}
+
+    # bids of different bidders are merged
+    ours = {'status': 'active.tendering', 'title': u'лот', 'bids': [{'id': '1', 'status': 'pending'}]}
+    fresh = {'status': 'active.tendering', 'title': u'лот',
+             'bids': [{'id': '1', 'status': 'draft'}, {'id': '2', 'status': 'draft'}]}
+    merged = merge_auction_changes(src, ours, fresh)
+    test_case.assertEqual(merged['bids'], [{'id': '1', 'status': 'pending'}, {'id': '2', 'status': 'draft'}])
+
+    # the same data is not merged
+    fresh = {'status': 'active.tendering', 'title': u'лот', 'bids': [{'id': '1', 'status': 'active'}]}
+    test_case.assertIsNone(merge_auction_changes(src, ours, fresh))
+
+    # changes in other status of auction are not merged
+    fresh = {'status': 'active.qualification', 'title': u'лот', 'bids': [{'id': '1', 'status': 'draft'}]}
+    test_case.assertIsNone(merge_auction_changes(src, ours, fresh))
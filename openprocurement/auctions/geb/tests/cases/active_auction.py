@@ -32,6 +32,7 @@ from openprocurement.auctions.geb.tests.blanks.active_auction import (
     module_auction_post_audit_without_ds,
     module_auction_post_result_invalid_number_of_bids,
     module_auction_switch_to_qualification,
+    module_auction_switch_to_qualification_journal,
     module_auction_switch_to_qualification_outstanding,
     module_auction_switch_to_unsuccessful,
     module_auction_update_auction_urls
@@ -70,6 +71,7 @@ class StatusActiveAuctionModuleAuctionTest(BaseWebTest):
     test_module_auction_post_audit = snitch(module_auction_post_audit)
     test_module_auction_post_result_invalid_number_of_bids = snitch(module_auction_post_result_invalid_number_of_bids)
     test_module_auction_switch_to_qualification = snitch(module_auction_switch_to_qualification)
+    test_module_auction_switch_to_qualification_journal = snitch(module_auction_switch_to_qualification_journal)
     test_module_auction_switch_to_qualification_outstanding = snitch(module_auction_switch_to_qualification_outstanding)
     test_module_auction_switch_to_unsuccessful = snitch(module_auction_switch_to_unsuccessful)
     test_module_auction_update_auction_urls = snitch(module_auction_update_auction_urls)
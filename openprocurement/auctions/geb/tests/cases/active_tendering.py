@@ -36,13 +36,19 @@ from openprocurement.auctions.geb.tests.blanks.active_tendering import (
     auction_bid_post,
     auction_bid_post_invalid,
     auction_document_download,
+    auction_document_download_range_without_ds,
+    auction_document_listing_versions,
     auction_document_patch,
     auction_document_post,
     auction_document_post_offline,
+    auction_document_post_streamed,
     auction_document_post_without_ds,
     auction_document_put,
     auction_document_put_offline,
     auction_document_put_without_ds,
+    auction_get_compressed,
+    auction_get_encoded,
+    auction_get_should_start_after,
     auction_patch,
     auction_question_post,
     bid_active_get_document,
@@ -51,6 +57,7 @@ from openprocurement.auctions.geb.tests.blanks.active_tendering import (
     bid_delete_in_draft_status,
     bid_delete_in_pending_status,
     bid_document_post,
+    bid_document_post_multipart,
     bid_document_post_without_ds,
     bid_document_put_without_ds,
     bid_draft_get_document,
@@ -65,6 +72,10 @@ from openprocurement.auctions.geb.tests.blanks.active_tendering import (
     bid_patch_in_active_status,
     bid_patch_in_draft_status,
     bid_patch_in_pending_status,
+    bid_patch_concurrent_save,
+    bid_patch_admission,
+    bid_patch_revision_token,
+    bid_owner_portfolio,
     bid_pending_get_document,
     bid_pending_patch_document,
     item_question_post,
@@ -81,11 +92,15 @@ class ActiveTenderingTest(BaseWebTest):
 
     test_auction_document_post_offline = snitch(auction_document_post_offline)
     test_auction_document_post = snitch(auction_document_post)
+    test_auction_document_post_streamed = snitch(auction_document_post_streamed)
     test_auction_question_post = snitch(auction_question_post)
     test_item_question_post = snitch(item_question_post)
     test_auction_bid_post = snitch(auction_bid_post)
     test_auction_auction_get = snitch(auction_auction_get)
     test_auction_change_fields = snitch(auction_patch)
+    test_auction_get_encoded = snitch(auction_get_encoded)
+    test_auction_get_compressed = snitch(auction_get_compressed)
+    test_auction_get_should_start_after = snitch(auction_get_should_start_after)
     test_auction_bid_post_invalid = snitch(auction_bid_post_invalid)
 
     def setUp(self):
@@ -114,6 +129,7 @@ class ActiveTenderingWithoutDSTest(BaseWebTest):
     docservice = False
 
     test_auction_document_post_without_ds = snitch(auction_document_post_without_ds)
+    test_auction_document_download_range_without_ds = snitch(auction_document_download_range_without_ds)
 
     def setUp(self):
         super(ActiveTenderingWithoutDSTest, self).setUp()
@@ -237,9 +253,14 @@ class ActiveTenderingBidsPendingTest(BaseWebTest):
     test_bid_patch_bidNumber_invalid = snitch(bid_patch_bid_number_invalid)
     test_bid_make_activate = snitch(bid_make_activate)
     test_bid_document_post = snitch(bid_document_post)
+    test_bid_document_post_multipart = snitch(bid_document_post_multipart)
     test_bid_delete_in_pending_status = snitch(bid_delete_in_pending_status)
     test_bid_get_in_pending_status = snitch(bid_get_in_pending_status)
     test_bid_patch_in_pending_status = snitch(bid_patch_in_pending_status)
+    test_bid_patch_concurrent_save = snitch(bid_patch_concurrent_save)
+    test_bid_patch_revision_token = snitch(bid_patch_revision_token)
+    test_bid_owner_portfolio = snitch(bid_owner_portfolio)
+    test_bid_patch_admission = snitch(bid_patch_admission)
 
     def setUp(self):
         super(ActiveTenderingBidsPendingTest, self).setUp()
@@ -262,6 +283,8 @@ class ActiveTenderingBidsPendingTest(BaseWebTest):
         pattern = '/auctions/{auction}/bids'
         entrypoints['bid_post'] = pattern.format(auction=auction['data']['id'])
 
+        entrypoints['portfolio'] = '/geb/bids'
+
         pattern = '/auctions/{auction}/bids/{bid}/documents?acc_token={token}'
         entrypoints['add_bid_document'] = pattern.format(auction=auction['data']['id'],
                                                          bid=bid['data']['id'],
@@ -560,6 +583,7 @@ class ActiveTenderingDocumentsTest(BaseWebTest):
     test_auction_document_patch = snitch(auction_document_patch)
     test_auction_document_put = snitch(auction_document_put)
     test_auction_document_download = snitch(auction_document_download)
+    test_auction_document_listing_versions = snitch(auction_document_listing_versions)
 
     def setUp(self):
         super(ActiveTenderingDocumentsTest, self).setUp()
@@ -581,6 +605,9 @@ class ActiveTenderingDocumentsTest(BaseWebTest):
 
         entrypoints['document_put'] = entrypoints['document_patch']
 
+        entrypoint_pattern = '/auctions/{}/documents'
+        entrypoints['documents_get'] = entrypoint_pattern.format(auction['data']['id'])
+
         self.document = document
         self.auction = auction
         self.ENTRYPOINTS = entrypoints
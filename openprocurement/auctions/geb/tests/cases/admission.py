@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+import unittest
+
+from openprocurement.auctions.core.tests.base import snitch
+from openprocurement.auctions.geb.tests.blanks.admission import (
+    admission_exempt_roles,
+    admission_owner_rate
+)
+
+
+class AdmissionControllerTest(unittest.TestCase):
+
+    test_admission_exempt_roles = snitch(admission_exempt_roles)
+    test_admission_owner_rate = snitch(admission_owner_rate)
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(AdmissionControllerTest))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.main(defaultTest='suite')
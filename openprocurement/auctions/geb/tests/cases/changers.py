@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+import unittest
+
+from openprocurement.auctions.core.tests.base import snitch
+from openprocurement.auctions.geb.tests.blanks.changers import (
+    validator_bypass_roles,
+    validators_pipeline,
+    validators_pipeline_stops
+)
+
+
+class ChangersValidationTest(unittest.TestCase):
+
+    test_validator_bypass_roles = snitch(validator_bypass_roles)
+    test_validators_pipeline = snitch(validators_pipeline)
+    test_validators_pipeline_stops = snitch(validators_pipeline_stops)
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(ChangersValidationTest))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.main(defaultTest='suite')
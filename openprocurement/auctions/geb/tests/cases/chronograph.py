@@ -28,6 +28,7 @@ from openprocurement.auctions.geb.tests.blanks.chronograph import (
     replaning_auction,
     tendering_delete_draft_bids,
     tendering_switch_to_enquiry,
+    tendering_switch_to_enquiry_journal,
     tendering_switch_to_unsuccessful_bid_min_number_2_bid_1_active,
     tendering_switch_to_unsuccessful_only_draft_bids,
 )
@@ -59,6 +60,7 @@ class ChronographEndTenderingTest(BaseWebTest):
     test_tendering_switch_unsuccessful_bid_min_number_2_bid_1_active = snitch(tendering_switch_to_unsuccessful_bid_min_number_2_bid_1_active)
     test_tendering_delete_draft_bids = snitch(tendering_delete_draft_bids)
     test_tendering_switch_to_enquiry = snitch(tendering_switch_to_enquiry)
+    test_tendering_switch_to_enquiry_journal = snitch(tendering_switch_to_enquiry_journal)
 
     def setUp(self):
         super(ChronographEndTenderingTest, self).setUp()
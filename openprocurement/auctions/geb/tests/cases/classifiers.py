@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+import unittest
+
+from openprocurement.auctions.core.tests.base import snitch
+from openprocurement.auctions.geb.tests.blanks.classifiers import (
+    choices_membership,
+    choices_ordering,
+    classifier_lookup
+)
+
+
+class ClassifiersTest(unittest.TestCase):
+
+    test_choices_membership = snitch(choices_membership)
+    test_choices_ordering = snitch(choices_ordering)
+    test_classifier_lookup = snitch(classifier_lookup)
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(ClassifiersTest))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.main(defaultTest='suite')
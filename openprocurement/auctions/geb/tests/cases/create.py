@@ -8,13 +8,21 @@ from openprocurement.auctions.geb.tests.base import (
 
 from openprocurement.auctions.geb.tests.blanks.create import (
     auction_create_without_items,
+    classifiers_search,
+    auction_lookup_from_replica,
+    auction_lookup_by_views,
+    auction_get_from_replica,
     create_auction,
     create_auction_invalid_auctionPeriod,
     create_auction_invalid_value,
+    create_auction_invalid_item_additional_classification_code,
     create_auction_invalid_item_additional_classifications,
     create_auction_invalid_minimalStep,
     create_auction_check_minNumberOfQualifiedBids,
-    create_auction_check_auctionParameters
+    create_auction_check_auctionParameters,
+    create_auction_duplicate_lot_attempt,
+    create_auction_lot_attempt_across_workers,
+    managers_dispatch
 )
 from openprocurement.auctions.geb.tests.fixtures.create import (
     AUCTION_WITHOUT_ITEMS
@@ -32,7 +40,14 @@ class CreateAuctionResourceTest(BaseWebTest):
     test_create_auction_invalid_value = snitch(create_auction_invalid_value)
     test_create_auction_invalid_minimalStep = snitch(create_auction_invalid_minimalStep)
     test_create_auction_invalid_item_additional_classifications = snitch(create_auction_invalid_item_additional_classifications)
+    test_create_auction_invalid_item_additional_classification_code = snitch(create_auction_invalid_item_additional_classification_code)
     test_create_auction_check_auctionParameters = snitch(create_auction_check_auctionParameters)
+    test_create_auction_duplicate_lot_attempt = snitch(create_auction_duplicate_lot_attempt)
+    test_create_auction_lot_attempt_across_workers = snitch(create_auction_lot_attempt_across_workers)
+    test_managers_dispatch = snitch(managers_dispatch)
+    test_auction_lookup_from_replica = snitch(auction_lookup_from_replica)
+    test_auction_lookup_by_views = snitch(auction_lookup_by_views)
+    test_auction_get_from_replica = snitch(auction_get_from_replica)
 
     def setUp(self):
         super(CreateAuctionResourceTest, self).setUp()
@@ -43,6 +58,7 @@ class CreateAuctionResourceTest(BaseWebTest):
 
         entrypoints = {}
         entrypoints['auction_post'] = '/auctions'
+        entrypoints['lookup'] = '/geb/lookup'
 
         self.ENTRYPOINTS = entrypoints
         self.auction = context['auction']['data']
@@ -66,10 +82,25 @@ class CreateAuctionResourceWithoutItemsTest(BaseWebTest):
         self.auction = context['auction']['data']
 
 
+class ClassifiersResourceTest(BaseWebTest):
+
+    test_classifiers_search = snitch(classifiers_search)
+
+    def setUp(self):
+        super(ClassifiersResourceTest, self).setUp()
+
+        entrypoints = {}
+        entrypoints['classifiers'] = '/geb/classifiers/{scheme}'
+        entrypoints['classifier'] = '/geb/classifiers/{scheme}/{code}'
+
+        self.ENTRYPOINTS = entrypoints
+
+
 def suite():
     suite = unittest.TestSuite()
     suite.addTest(unittest.makeSuite(CreateAuctionResourceTest))
     suite.addTest(unittest.makeSuite(CreateAuctionResourceWithoutItemsTest))
+    suite.addTest(unittest.makeSuite(ClassifiersResourceTest))
     return suite
 
 
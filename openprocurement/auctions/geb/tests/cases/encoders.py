@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+import unittest
+
+from openprocurement.auctions.core.tests.base import snitch
+from openprocurement.auctions.geb.tests.blanks.encoders import (
+    compress_bodies,
+    encode_encoded,
+    encode_values,
+    representation_cache_lru
+)
+
+
+class EncodersTest(unittest.TestCase):
+
+    test_encode_values = snitch(encode_values)
+    test_encode_encoded = snitch(encode_encoded)
+    test_compress_bodies = snitch(compress_bodies)
+    test_representation_cache_lru = snitch(representation_cache_lru)
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(EncodersTest))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.main(defaultTest='suite')
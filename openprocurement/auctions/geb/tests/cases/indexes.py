@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+import unittest
+
+from openprocurement.auctions.core.tests.base import snitch
+from openprocurement.auctions.geb.tests.base import (
+    BaseWebTest
+)
+from openprocurement.auctions.geb.tests.blanks.indexes import (
+    indexes_background_polling,
+    indexes_catch_up,
+    indexes_changes_consume,
+    indexes_checkpoint,
+    indexes_db_changes,
+    indexes_db_changes_filtered
+)
+from openprocurement.auctions.geb.tests.states import (
+    ProcedureMachine
+)
+
+
+class IndexesTest(unittest.TestCase):
+
+    test_indexes_changes_consume = snitch(indexes_changes_consume)
+    test_indexes_checkpoint = snitch(indexes_checkpoint)
+    test_indexes_catch_up = snitch(indexes_catch_up)
+    test_indexes_background_polling = snitch(indexes_background_polling)
+
+
+class IndexesChangesFeedTest(BaseWebTest):
+
+    test_indexes_db_changes = snitch(indexes_db_changes)
+    test_indexes_db_changes_filtered = snitch(indexes_db_changes_filtered)
+
+    def setUp(self):
+        super(IndexesChangesFeedTest, self).setUp()
+        procedure = ProcedureMachine()
+        procedure.set_db_connector(self.db)
+        procedure.toggle('active.tendering')
+        context = procedure.snapshot()
+
+        self.auction = context['auction']
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(IndexesTest))
+    suite.addTest(unittest.makeSuite(IndexesChangesFeedTest))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.main(defaultTest='suite')
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+import unittest
+
+from openprocurement.auctions.core.tests.base import snitch
+from openprocurement.auctions.geb.tests.blanks.loggers import (
+    journal_refresh,
+    log_action_lazy,
+    log_queue,
+    log_queue_target_resolved_on_emit,
+    log_sampling
+)
+
+
+class LoggersPipelineTest(unittest.TestCase):
+
+    test_log_sampling = snitch(log_sampling)
+    test_log_action_lazy = snitch(log_action_lazy)
+    test_log_queue = snitch(log_queue)
+    test_log_queue_target_resolved_on_emit = snitch(log_queue_target_resolved_on_emit)
+
+
+class JournalTest(unittest.TestCase):
+
+    test_journal_refresh = snitch(journal_refresh)
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(LoggersPipelineTest))
+    suite.addTest(unittest.makeSuite(JournalTest))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.main(defaultTest='suite')
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+import unittest
+
+from openprocurement.auctions.core.tests.base import snitch
+from openprocurement.auctions.geb.tests.base import (
+    BaseWebTest
+)
+from openprocurement.auctions.geb.tests.blanks.migration import (
+    migrate_auctions,
+    migrate_auctions_by_windows,
+    migrate_auctions_failed,
+    migrate_auctions_resume,
+    migration_plugin_loaded
+)
+from openprocurement.auctions.geb.tests.states import (
+    ProcedureMachine
+)
+
+
+class MigrationTest(BaseWebTest):
+
+    test_migrate_auctions = snitch(migrate_auctions)
+    test_migrate_auctions_resume = snitch(migrate_auctions_resume)
+    test_migrate_auctions_by_windows = snitch(migrate_auctions_by_windows)
+    test_migrate_auctions_failed = snitch(migrate_auctions_failed)
+    test_migration_plugin_loaded = snitch(migration_plugin_loaded)
+
+    def setUp(self):
+        super(MigrationTest, self).setUp()
+        procedure = ProcedureMachine()
+        procedure.set_db_connector(self.db)
+        procedure.toggle('active.tendering')
+        context = procedure.snapshot()
+
+        self.auction = context['auction']
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(MigrationTest))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.main(defaultTest='suite')
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+import unittest
+
+from openprocurement.auctions.core.tests.base import snitch
+from openprocurement.auctions.geb.tests.blanks.utils import (
+    copy_document_version,
+    merge_concurrent_auction_changes,
+    multipart_file_stream,
+    multipart_file_stream_read
+)
+
+
+class UtilsTest(unittest.TestCase):
+
+    test_copy_document_version = snitch(copy_document_version)
+    test_merge_concurrent_auction_changes = snitch(merge_concurrent_auction_changes)
+    test_multipart_file_stream = snitch(multipart_file_stream)
+    test_multipart_file_stream_read = snitch(multipart_file_stream_read)
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(UtilsTest))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.main(defaultTest='suite')
@@ -5,6 +5,7 @@ PARTIAL_MOCK_CONFIG = {
             "geb.migration": None
         },
         "migration": False,
+        "indexes_poll_interval": 0,
         "aliases": [],
         "accreditation": {
             "create": [1],
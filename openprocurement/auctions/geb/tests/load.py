@@ -0,0 +1,338 @@
+# -*- coding: utf-8 -*-
+"""
+    Load test, which replays a day of geb auctions against the test database
+
+        LOADTEST=True ./bin/nosetests openprocurement.auctions.geb.tests.load
+
+    The day is made of stages, run one after another:
+        organizers create lots and commit them to active.rectification,
+        bidders register on lots in active.tendering, upload eligibility
+        documents and make their bids pending,
+        chronograph checks lots at the end of tendering,
+        module auction reports results of lots in active.auction,
+        organizers activate awards of lots in active.qualification.
+    Lots of every stage after the first are prepared from fixtures.
+
+    Traffic shape is set by environment:
+        LOADTEST_LOTS       lots in every stage (10)
+        LOADTEST_BIDDERS    bidders registering on every lot (20)
+        LOADTEST_DOCUMENTS  eligibility documents uploaded by every bidder (1)
+        LOADTEST_TICKS      chronograph checks of every lot (3)
+        LOADTEST_WORKERS    clients sending requests concurrently (8)
+
+    Report gives throughput, latency percentiles and rate of 409 Conflict
+    by endpoint.
+"""
+import base64
+import math
+import os
+import threading
+import unittest
+
+from copy import deepcopy
+from datetime import timedelta
+from multiprocessing.dummy import Pool
+from timeit import default_timer
+from uuid import uuid4
+
+from freezegun import freeze_time
+from iso8601 import parse_date
+from webtest import TestApp
+
+from openprocurement.auctions.core.tests.base import (
+    test_document_data
+)
+from openprocurement.auctions.core.utils import (
+    set_specific_hour
+)
+from openprocurement.auctions.geb.tests.base import (
+    BaseWebTest
+)
+from openprocurement.auctions.geb.tests.fixtures.active_auction import (
+    AUCTION_WITH_URLS
+)
+from openprocurement.auctions.geb.tests.fixtures.active_qualification import (
+    AUCTION_WITH_AWARD_WITH_PROTOCOL
+)
+from openprocurement.auctions.geb.tests.fixtures.active_tendering import (
+    AUCTION as ACTIVE_TENDERING_AUCTION,
+    END_ACTIVE_TENDERING_AUCTION_WITH_TWO_BIDS
+)
+from openprocurement.auctions.geb.tests.fixtures.common import (
+    test_bid_data
+)
+from openprocurement.auctions.geb.tests.fixtures.create import (
+    AUCTION as CREATE_AUCTION
+)
+
+PROFILE = {
+    'lots': int(os.environ.get('LOADTEST_LOTS', 10)),
+    'bidders': int(os.environ.get('LOADTEST_BIDDERS', 20)),
+    'documents': int(os.environ.get('LOADTEST_DOCUMENTS', 1)),
+    'ticks': int(os.environ.get('LOADTEST_TICKS', 3)),
+    'workers': int(os.environ.get('LOADTEST_WORKERS', 8))
+}
+PERCENTILES = (50, 90, 99)
+
+# statistics
+
+
+def percentile(samples, q):
+    """
+        Nearest rank percentile
+
+        >>> percentile([1, 2, 3, 4, 5, 6, 7, 8, 9, 10], 50)
+        5
+        >>> percentile([1, 2, 3, 4, 5, 6, 7, 8, 9, 10], 99)
+        10
+    """
+    ordered = sorted(samples)
+    rank = int(math.ceil(q / 100.0 * len(ordered)))
+    return ordered[max(rank, 1) - 1]
+
+
+class Recorder(object):
+    """
+        Timings and statuses of responses, by endpoint
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.endpoints = {}
+
+    def record(self, endpoint, status, start, end):
+        with self.lock:
+            stats = self.endpoints.setdefault(endpoint, {'latencies': [], 'statuses': [], 'start': start, 'end': end})
+            stats['latencies'].append(end - start)
+            stats['statuses'].append(status)
+            stats['start'] = min(stats['start'], start)
+            stats['end'] = max(stats['end'], end)
+
+    def results(self):
+        results = []
+        for endpoint in sorted(self.endpoints):
+            stats = self.endpoints[endpoint]
+            requests = len(stats['statuses'])
+            duration = stats['end'] - stats['start']
+            result = {
+                'endpoint': endpoint,
+                'requests': requests,
+                'throughput': requests / duration if duration else None,
+                'conflicts': stats['statuses'].count(409) / float(requests),
+                'errors': len([status for status in stats['statuses'] if status >= 400 and status != 409]),
+                'server_errors': len([status for status in stats['statuses'] if status >= 500])
+            }
+            for q in PERCENTILES:
+                result['p{}'.format(q)] = percentile(stats['latencies'], q)
+            results.append(result)
+        return results
+
+
+def report(results):
+    header = '{:<44} {:>8} {:>9} {:>9} {:>9} {:>9} {:>7} {:>7}'
+    line = '{:<44} {:>8} {:>9} {:>9.1f} {:>9.1f} {:>9.1f} {:>6.1f}% {:>7}'
+    lines = [header.format('endpoint', 'requests', 'req/s', 'p50 ms', 'p90 ms', 'p99 ms', '409', 'errors')]
+    for result in results:
+        throughput = '{:.1f}'.format(result['throughput']) if result['throughput'] else '-'
+        lines.append(line.format(result['endpoint'],
+                                 result['requests'],
+                                 throughput,
+                                 result['p50'] * 1000,
+                                 result['p90'] * 1000,
+                                 result['p99'] * 1000,
+                                 result['conflicts'] * 100,
+                                 result['errors']))
+    return '\n'.join(lines)
+
+# clients
+
+
+class Client(object):
+    """
+        Client of one worker, requests are sent with their own credentials
+    """
+
+    def __init__(self, app, recorder):
+        self.app = TestApp(app.app, extra_environ=app.extra_environ)
+        self.app.RequestClass = app.RequestClass
+        self.recorder = recorder
+
+    def request(self, endpoint, method, url, data=None, user='broker'):
+        token = base64.b64encode('{}:'.format(user))
+        kwargs = {'headers': {'Authorization': 'Basic {}'.format(token)}, 'status': '*'}
+        start = default_timer()
+        if data is None:
+            response = getattr(self.app, method)(url, **kwargs)
+        else:
+            response = getattr(self.app, '{}_json'.format(method))(url, data, **kwargs)
+        self.recorder.record(endpoint, response.status_int, start, default_timer())
+        return response
+
+
+def copy_lot(db, fixture):
+    """
+        Save copy of fixture as new auction
+    """
+    doc = deepcopy(fixture)
+    doc.pop('_rev', None)
+    doc['_id'] = uuid4().hex
+    doc['lotIdentifier'] = uuid4().hex
+    db.save(doc)
+    return doc
+
+# stages
+# each stage prepares lots and returns tasks with the moment stage starts at
+# (None for now), every task gets client of worker
+
+
+def organizers_create_lots(test_case, profile):
+    def task(client):
+        auction = deepcopy(CREATE_AUCTION)
+        auction['lotIdentifier'] = uuid4().hex
+        response = client.request('POST /auctions', 'post', '/auctions', {'data': auction})
+        if response.status_int != 201:
+            return
+        url = '/auctions/{}?acc_token={}'.format(response.json['data']['id'], response.json['access']['token'])
+        client.request('PATCH /auctions/{id} (owner)', 'patch', url, {'data': {'status': 'active.rectification'}})
+    return [task] * profile['lots'], None
+
+
+def bidders_register(test_case, profile):
+    lots = [copy_lot(test_case.db, ACTIVE_TENDERING_AUCTION) for _ in range(profile['lots'])]
+
+    def task(lot):
+        def register(client):
+            url = '/auctions/{}/bids'.format(lot['_id'])
+            response = client.request('POST /auctions/{id}/bids', 'post', url, test_bid_data)
+            if response.status_int != 201:
+                return
+            bid = response.json
+            url = '/auctions/{}/bids/{}'.format(lot['_id'], bid['data']['id'])
+            for _ in range(profile['documents']):
+                document = deepcopy(test_document_data)
+                document['url'] = test_case.generate_docservice_url()
+                client.request('POST /auctions/{id}/bids/{id}/documents', 'post',
+                               '{}/documents?acc_token={}'.format(url, bid['access']['token']),
+                               {'data': document})
+            client.request('PATCH /auctions/{id}/bids/{id}', 'patch',
+                           '{}?acc_token={}'.format(url, bid['access']['token']),
+                           {'data': {'status': 'pending'}})
+        return register
+    # bidders of different lots are interleaved
+    return [task(lot) for _ in range(profile['bidders']) for lot in lots], None
+
+
+def chronograph_end_tendering(test_case, profile):
+    lots = [copy_lot(test_case.db, END_ACTIVE_TENDERING_AUCTION_WITH_TWO_BIDS) for _ in range(profile['lots'])]
+    tendering_end = parse_date(END_ACTIVE_TENDERING_AUCTION_WITH_TWO_BIDS['tenderPeriod']['endDate'])
+
+    def task(lot):
+        def tick(client):
+            client.request('PATCH /auctions/{id} (chronograph)', 'patch', '/auctions/{}'.format(lot['_id']),
+                           {'data': {'id': lot['_id']}}, user='chronograph')
+        return tick
+    return [task(lot) for _ in range(profile['ticks']) for lot in lots], tendering_end
+
+
+def module_auction_results(test_case, profile):
+    lots = [copy_lot(test_case.db, AUCTION_WITH_URLS) for _ in range(profile['lots'])]
+    auction_start = parse_date(AUCTION_WITH_URLS['auctionPeriod']['startDate'])
+
+    def task(lot):
+        def results(client):
+            bids = []
+            for number, bid in enumerate(lot['bids']):
+                amount = lot['value']['amount'] + number * lot['minimalStep']['amount']
+                bids.append({'id': bid['id'],
+                             'value': {'amount': amount, 'currency': 'UAH', 'valueAddedTaxIncluded': True}})
+            client.request('POST /auctions/{id}/auction', 'post', '/auctions/{}/auction'.format(lot['_id']),
+                           {'data': {'bids': bids}}, user='auction')
+        return results
+    return [task(lot) for lot in lots], set_specific_hour(auction_start + timedelta(days=1), 14)
+
+
+def organizers_activate_awards(test_case, profile):
+    lots = [copy_lot(test_case.db, AUCTION_WITH_AWARD_WITH_PROTOCOL) for _ in range(profile['lots'])]
+
+    def task(lot):
+        def activate(client):
+            url = '/auctions/{}/awards/{}?acc_token={}'.format(lot['_id'], lot['awards'][0]['id'], lot['owner_token'])
+            client.request('PATCH /auctions/{id}/awards/{id}', 'patch', url,
+                           {'data': {'status': 'active'}}, user=lot['owner'])
+        return activate
+    return [task(lot) for lot in lots], None
+
+
+STAGES = (
+    organizers_create_lots,
+    bidders_register,
+    chronograph_end_tendering,
+    module_auction_results,
+    organizers_activate_awards
+)
+
+
+def run_stage(test_case, stage, recorder, profile=PROFILE):
+    """
+        Run tasks of stage by pool of workers, every worker has its own client
+    """
+    tasks, frozen_time = stage(test_case, profile)
+    local = threading.local()
+
+    def run(task):
+        if not hasattr(local, 'client'):
+            local.client = Client(test_case.app, recorder)
+        task(local.client)
+
+    if frozen_time is None:
+        run_tasks(run, tasks, profile['workers'])
+        return
+    # stage starts at the moment it needs for all workers,
+    # time goes on, so latencies are measured as usual
+    with freeze_time(frozen_time, tick=True):
+        run_tasks(run, tasks, profile['workers'])
+
+
+def run_tasks(run, tasks, workers):
+    pool = Pool(workers)
+    try:
+        for _ in pool.imap_unordered(run, tasks):
+            pass
+    finally:
+        pool.close()
+        pool.join()
+
+
+class LoadTest(BaseWebTest):
+    """
+        Load Test, runs only if LOADTEST is set
+    """
+    docservice = True
+
+    def setUp(self):
+        super(LoadTest, self).setUp()
+
+        if not os.environ.get('LOADTEST'):
+            self.skipTest('not load test')
+
+    def test_auction_day(self):
+        recorder = Recorder()
+        for stage in STAGES:
+            run_stage(self, stage, recorder)
+
+        results = recorder.results()
+        print(report(results))
+
+        failed = [result['endpoint'] for result in results if result['server_errors']]
+        if failed:
+            self.fail('Server errors in {}\n{}'.format(', '.join(failed), report(results)))
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(LoadTest))
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.main(defaultTest='suite')
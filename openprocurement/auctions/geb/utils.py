@@ -1,17 +1,77 @@
 # -*- coding: utf-8 -*-
+from collections import OrderedDict
 from functools import partial
+from hashlib import md5
+from logging import getLogger
+from random import uniform
+from time import sleep
+from urlparse import urlparse, urlunsplit
+from uuid import uuid4
 
+from couchdb.http import ResourceConflict
+from jsonpatch import JsonPatch, make_patch
+from requests.packages.urllib3.fields import format_header_param
+from schematics.exceptions import ModelValidationError
+
+from openprocurement.api.utils import (
+    SESSION,
+    get_filename,
+    update_logging_context
+)
 from openprocurement.auctions.core.utils import (
+    get_now,
+    get_file as base_get_file,
     upload_file as base_upload_file,
     set_specific_hour,
     calculate_business_date
 )
+from openprocurement.auctions.core.validation import (
+    error_handler
+)
 
 from openprocurement.auctions.geb.constants import (
     DOCUMENT_BLACKLISTED_FIELDS,
-    DOCUMENT_TYPE_OFFLINE
+    DOCUMENT_TYPE_OFFLINE,
+    DOCUMENT_UPLOAD_ATTEMPTS,
+    DOCUMENT_UPLOAD_CHUNK_SIZE,
+    SAVE_CONFLICT_ATTEMPTS,
+    SAVE_CONFLICT_BACKOFF
+)
+from openprocurement.auctions.geb.managers.loggers.base import (
+    log_action
 )
 
+LOGGER = getLogger(__name__)
+
+
+# fields of document class, which are copied from the actual
+# version of document to the new one, keyed by (class, blacklisted fields)
+DOCUMENT_COPY_PLANS = {}
+
+
+def get_document_copy_plan(document_class, blacklisted_fields):
+    key = (document_class, frozenset(blacklisted_fields))
+    plan = DOCUMENT_COPY_PLANS.get(key)
+    if plan is None:
+        plan = tuple(name for name in document_class._fields if name not in key[1])
+        DOCUMENT_COPY_PLANS[key] = plan
+    return plan
+
+
+def copy_document_fields(source, target, plan):
+    # values are imported through the target model,
+    # so they are converted by fields of the target, not copied raw
+    target.import_data(dict((name, getattr(source, name)) for name in plan))
+
+
+def get_document_versions(documents):
+    # index of documents versions by document id
+    # versions are kept in order of upload, the last one is actual
+    versions = OrderedDict()
+    for document in documents:
+        versions.setdefault(document.id, []).append(document)
+    return versions
+
 
 def get_actual_document(request):
     documents = request.validated.get('documents')
@@ -22,20 +82,185 @@ def upload_offline_document(request, document, blacklisted_fields):
     actual_document = get_actual_document(request)
 
     if actual_document:
-        for attr_name in type(actual_document)._fields:
-            if attr_name not in blacklisted_fields:
-                setattr(document, attr_name, getattr(actual_document, attr_name))
+        plan = get_document_copy_plan(type(actual_document), blacklisted_fields)
+        copy_document_fields(actual_document, document, plan)
         document.format = 'offline/on-site-examination'
         if 'document_id' in request.validated:
             document.id = request.validated['document_id']
     return document
 
 
+class MultipartFileStream(object):
+    """
+        multipart/form-data body with the single field 'file'
+
+        Body is read from the uploaded file by chunks while it is sent,
+        so it is never built in memory as a whole.
+        md5 hash of the file is calculated on the fly.
+    """
+
+    def __init__(self, filename, in_file, content_type, chunk_size=DOCUMENT_UPLOAD_CHUNK_SIZE):
+        boundary = uuid4().hex
+        disposition = u'form-data; {}; {}'.format(format_header_param('name', 'file'),
+                                                  format_header_param('filename', filename))
+        head = u'--{}\r\nContent-Disposition: {}\r\nContent-Type: {}\r\n\r\n'.format(boundary, disposition, content_type)
+
+        self.content_type = 'multipart/form-data; boundary={}'.format(boundary)
+        self.head = head.encode('utf-8')
+        self.tail = '\r\n--{}--\r\n'.format(boundary)
+        self.in_file = in_file
+        self.chunk_size = chunk_size
+
+        in_file.seek(0, 2)
+        self.file_size = in_file.tell()
+        self.rewind()
+
+    def __len__(self):
+        return len(self.head) + self.file_size + len(self.tail)
+
+    def __iter__(self):
+        return iter(partial(self.read, self.chunk_size), '')
+
+    def _chunks(self):
+        yield self.head
+        chunk = self.in_file.read(self.chunk_size)
+        while chunk:
+            self._md5.update(chunk)
+            yield chunk
+            chunk = self.in_file.read(self.chunk_size)
+        yield self.tail
+
+    def rewind(self):
+        # start body from the beginning, e.g. to retry upload
+        self.in_file.seek(0)
+        self._md5 = md5()
+        self._chunks_iter = self._chunks()
+        self._buffer = ''
+
+    def read(self, size=-1):
+        data = self._buffer
+        while size < 0 or len(data) < size:
+            chunk = next(self._chunks_iter, None)
+            if chunk is None:
+                break
+            data += chunk
+        if size < 0:
+            size = len(data)
+        self._buffer = data[size:]
+        return data[:size]
+
+    @property
+    def hash(self):
+        return 'md5:{}'.format(self._md5.hexdigest())
+
+
+def post_to_docservice(request, stream):
+    """
+        Send file stream to document service, return url and hash of uploaded file
+    """
+    parsed_url = urlparse(request.registry.docservice_url)
+    url = request.registry.docservice_upload_url or urlunsplit((parsed_url.scheme, parsed_url.netloc, '/upload', '', ''))
+    headers = {
+        'Content-Type': stream.content_type,
+        'X-Client-Request-ID': request.environ.get('REQUEST_ID', '')
+    }
+    auth = (request.registry.docservice_username, request.registry.docservice_password)
+
+    for _ in range(DOCUMENT_UPLOAD_ATTEMPTS):
+        stream.rewind()
+        try:
+            response = SESSION.post(url, data=stream, headers=headers, auth=auth)
+            json_data = response.json()
+        except Exception as e:
+            LOGGER.warning("Raised exception '{}' on uploading document to document service': {}.".format(type(e), e),
+                           extra={'MESSAGE_ID': 'document_service_exception'})
+        else:
+            if response.status_code == 200 and json_data.get('data', {}).get('url'):
+                return json_data['data']['url'], json_data['data']['hash']
+            LOGGER.warning("Error {} on uploading document to document service '{}': {}".format(response.status_code, url, response.text),
+                           extra={'MESSAGE_ID': 'document_service_error'})
+
+    request.errors.add('body', 'data', "Can't upload document to document service.")
+    request.errors.status = 422
+    raise error_handler(request)
+
+
+def upload_file_by_chunks(request, blacklisted_fields):
+    """
+        Upload multipart file to document service by chunks
+
+        Only the body is sent here, uploaded document is registered
+        by core upload_file, the same way as document which was
+        uploaded to document service by client.
+    """
+    data = request.validated['file']
+    filename = get_filename(data)
+
+    stream = MultipartFileStream(filename, data.file, data.type)
+    doc_url, doc_hash = post_to_docservice(request, stream)
+    if doc_hash != stream.hash:
+        # document service received other bytes than were sent
+        LOGGER.warning("Document service hash {} differs from uploaded file hash {}".format(doc_hash, stream.hash),
+                       extra={'MESSAGE_ID': 'document_service_hash_mismatch'})
+        request.errors.add('body', 'data', "Document was corrupted on uploading to document service.")
+        request.errors.status = 422
+        raise error_handler(request)
+    update_logging_context(request, {'file_size': stream.file_size})
+
+    if hasattr(request.context, 'documents'):
+        # upload new document
+        model = type(request.context).documents.model_class
+    else:
+        # update document
+        model = type(request.context)
+    document_data = {'title': filename, 'format': data.type, 'url': doc_url, 'hash': doc_hash}
+    if 'document_id' in request.validated:
+        document_data['id'] = request.validated['document_id']
+    document = model(document_data)
+    document.__parent__ = request.context
+
+    request.validated['data'] = request.validated['json_data'] = document_data
+    request.validated['document'] = document
+    return base_upload_file(request, blacklisted_fields)
+
+
 def upload_file(request, document, blacklisted_fields=DOCUMENT_BLACKLISTED_FIELDS):
     if hasattr(document, 'documentType') and document.documentType in DOCUMENT_TYPE_OFFLINE:
         return upload_offline_document(request, document, blacklisted_fields)
+    if request.registry.docservice_url and request.content_type == 'multipart/form-data':
+        return upload_file_by_chunks(request, blacklisted_fields)
     return base_upload_file(request, blacklisted_fields)
 
+
+def enable_file_ranges(request, response):
+    """
+        Prepare streamed attachment response for HTTP Range
+        and conditional requests
+
+        Attachment is relayed to client by chunks, webob serves
+        the requested range of it if response knows its length,
+        and answers 304 if the digest of attachment matches If-None-Match.
+        Redirects to document service and errors are returned as is.
+    """
+    if response is not request.response:
+        return response
+    document = request.validated['document']
+    filename = "{}_{}".format(document.id, request.params.get('download'))
+    db_doc = request.validated.get('db_doc') or {}
+    attachment = db_doc.get('_attachments', {}).get(filename, {})
+    if attachment.get('length') is not None:
+        response.content_length = attachment['length']
+        response.accept_ranges = 'bytes'
+        response.conditional_response = True
+    if attachment.get('digest'):
+        response.etag = attachment['digest']
+    return response
+
+
+def get_file(request):
+    return enable_file_ranges(request, base_get_file(request))
+
+
 # fuction calculate business date without context arg
 # is need for using in date calculation in test
 
@@ -43,6 +268,105 @@ def upload_file(request, document, blacklisted_fields=DOCUMENT_BLACKLISTED_FIELD
 calculate_certainly_business_date = partial(calculate_business_date, context=None)
 
 
+# paths of auction which are changed by every save, they are not merged
+SAVE_CONFLICT_IGNORED_PATHS = ('/_rev', '/revisions', '/dateModified')
+
+
+def _get_changes(src, dst):
+    return [op for op in make_patch(src, dst).patch
+            if not op['path'].startswith(SAVE_CONFLICT_IGNORED_PATHS)]
+
+
+def _overlap(path, other):
+    return path == other or path.startswith(other + '/') or other.startswith(path + '/')
+
+
+def _shifted(path, op):
+    # add or remove of list item shifts positions of next items
+    parent, _, position = op['path'].rpartition('/')
+    if op['op'] not in ('add', 'remove') or not position.isdigit():
+        return False
+    if not path.startswith(parent + '/'):
+        return False
+    item = path[len(parent) + 1:].split('/')[0]
+    return item.isdigit() and int(item) >= int(position)
+
+
+def _conflict(op, other):
+    if 'from' in op or 'from' in other:
+        # move and copy are not merged
+        return True
+    return _overlap(op['path'], other['path']) or _shifted(op['path'], other) or _shifted(other['path'], op)
+
+
+def merge_auction_changes(src, ours, fresh):
+    """
+        Three-way merge of own changes of auction into freshly stored auction
+
+        src - auction as it was loaded, ours - auction with own changes,
+        fresh - auction stored by concurrent request,
+        all of them serialized with 'plain' role
+        return merged auction or None if changes touch the same data
+    """
+    if src.get('status') != fresh.get('status'):
+        return None
+    our_changes = _get_changes(src, ours)
+    their_changes = _get_changes(src, fresh)
+    for op in our_changes:
+        if any(_conflict(op, other) for other in their_changes):
+            return None
+    return JsonPatch(our_changes).apply(fresh)
+
+
+def save_auction_with_retry(request, save):
+    """
+        Save auction, on conflict merge own changes into fresh revision
+        of auction and store it again, with jittered backoff between attempts
+    """
+    auction = request.validated['auction']
+    ours = auction.serialize('plain')
+    if save():
+        return True
+    if request.errors.status != 409:
+        return None
+
+    db = request.registry.db
+    src = request.validated['auction_src']
+    for attempt in range(SAVE_CONFLICT_ATTEMPTS):
+        sleep(uniform(0, SAVE_CONFLICT_BACKOFF * 2 ** attempt))
+        # stored auction is serialized the same way as src and ours
+        model = type(auction)(db.get(auction.id))
+        model.__parent__ = auction.__parent__
+        fresh = model.serialize('plain')
+        merged = merge_auction_changes(src, ours, fresh)
+        if merged is None:
+            return None
+
+        model.import_data(merged)
+        revision = type(auction).revisions.model_class({
+            'author': request.authenticated_userid,
+            'changes': make_patch(merged, fresh).patch,
+            'rev': model.rev
+        })
+        model.revisions.append(revision)
+        if getattr(auction, 'modified', True):
+            model.dateModified = get_now()
+        try:
+            model.store(db)
+        except ResourceConflict:
+            continue
+        except ModelValidationError:
+            return None
+
+        del request.errors[:]
+        request.errors.status = 400
+        request.validated['auction'] = model
+        log_action(LOGGER, request, 'save_auction_conflict_merged',
+                   'Saved auction {} after conflict, attempt {}'.format(auction.id, attempt + 1))
+        return True
+    return None
+
+
 def calc_expected_auction_end_time(auction_start_date):
     # calculate expected auction end time
     # it is need for checking replaning of module auction
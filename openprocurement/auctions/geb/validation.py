@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 from datetime import timedelta
+from functools import wraps
 
 from schematics.exceptions import (
     ModelValidationError,
@@ -7,7 +8,6 @@ from schematics.exceptions import (
     ValidationError
 )
 from jsonpatch import JsonPointerException
-from schematics.types import BaseType
 from openprocurement.auctions.core.validation import (
     validate_json_data,
     error_handler
@@ -34,12 +34,37 @@ from openprocurement.auctions.geb.constants import (
     BID_STATUSES_FOR_ADDING_BID_DOCUMENTS,
     BID_STATUSES_FOR_DELETING,
     BID_STATUSES_FOR_PATCHING,
-    CAV_PS_CODES
+    CAV_PS,
+    CPVS,
+    KVTSPZ
+)
+from openprocurement.auctions.geb.design import (
+    auctions_by_lot_attempt_view,
+    query_view
 )
 
 # base validators
 
 
+def bypass_roles(*roles):
+    """
+        Validator passes requests of roles without checks
+
+        roles are kept on validator as bypass_roles,
+        so validators pipeline checks the role once, before any validator run
+    """
+    def decorator(validator):
+        @wraps(validator)
+        def wrapper(request, **kwargs):
+            if request.authenticated_role in roles:
+                return True
+            return validator(request, **kwargs)
+        wrapper.bypass_roles = frozenset(roles)
+        wrapper.validator = validator
+        return wrapper
+    return decorator
+
+
 def _get_contexture_to_patch(request, model):
     initial_data = request.context.serialize()
     contexture = model(initial_data)
@@ -63,15 +88,19 @@ def impose_patch(contexture, patch):
 
 def _validate_patch_data(request, model, data):
     contexture = _get_contexture_to_patch(request, model)
-    request.validated['resource_src'] = contexture.serialize()
+    resource_src = contexture.serialize()
+    request.validated['resource_src'] = resource_src
 
-    contexture_to_patch = _get_contexture_to_patch(request, model)
-    method = contexture_to_patch.to_patch
+    method = contexture.to_patch
     role = _get_role_to_patch(contexture)
 
-    patch = _revel_patch(contexture_to_patch, data)
+    # serialized resource is the same for both contextures
+    patch = apply_data_patch(resource_src, data)
     # check if data received make patch
+    # copy of resource is built only for data which change it
     if patch:
+        contexture_to_patch = _get_contexture_to_patch(request, model)
+        method = contexture_to_patch.to_patch
         # apply patch to contexture
         impose_patch(contexture_to_patch, patch)
         # serialize and cut off not valid fields
@@ -110,16 +139,28 @@ def validate_patch_resource_data(request, **kwargs):
     validate_patch_data(request, request.context.__class__, data)
 
 
+# admission validators
+
+
+def validate_admission(request, **kwargs):
+    controller = request.registry.geb_admission
+    if controller is None:
+        return
+    rejection = controller.admit(request.authenticated_role, request.authenticated_userid)
+    if rejection:
+        request.errors.add('body', 'data', 'Too many requests, {}'.format(rejection))
+        request.errors.status = 429
+        raise error_handler(request)
+
+
 # patch bid validators
 
 
+@bypass_roles('Administrator')
 def validate_bid_patch_auction_period(request, **kwargs):
     """
         validate in which auction periods, can patch bid
     """
-    if request.authenticated_role == 'Administrator':
-        return True
-
     if request.validated['auction_status'] not in AUCTION_STATUSES_FOR_PATCHING_BIDS:
         err_msg = 'Can\'t change bid, it can be done only in {} auction statuses'.format(AUCTION_STATUSES_FOR_PATCHING_BIDS)
         request.errors.add('body', 'data', err_msg)
@@ -128,15 +169,12 @@ def validate_bid_patch_auction_period(request, **kwargs):
     return True
 
 
+@bypass_roles('Administrator')
 def validate_bid_activation(request, **kwargs):
     """
         validate bid activation(patch status to 'pending')
     """
 
-    # check if it administrator bacause he can do everything
-    if request.authenticated_role == 'Administrator':
-        return True
-
     # check if it is valid two-phase commit
     new_status = request.validated['json_data'].get('status')
     if new_status != 'pending':
@@ -147,15 +185,12 @@ def validate_bid_activation(request, **kwargs):
     return True
 
 
+@bypass_roles('Administrator')
 def validate_bid_patch_pending_make_active_status(request, **kwargs):
     """
         validate patch bid(make status 'active')
     """
 
-    # check if it administrator bacause he can do everything
-    if request.authenticated_role == 'Administrator':
-        return True
-
     bid = kwargs['context']
     auction = request.auction
 
@@ -189,15 +224,12 @@ def validate_bid_patch_pending_make_active_status(request, **kwargs):
     return True
 
 
+@bypass_roles('Administrator')
 def validate_bid_patch_pending(request, **kwargs):
     """
         validate bid patch in 'pending' status
     """
 
-    # check if it administrator bacause he can do everything
-    if request.authenticated_role == 'Administrator':
-        return True
-
     # check if it is patch status, only to active can switch
     new_status = request.validated['json_data'].get('status')
     if new_status and new_status != 'active':
@@ -209,15 +241,12 @@ def validate_bid_patch_pending(request, **kwargs):
     return True
 
 
+@bypass_roles('Administrator')
 def validate_bid_patch_active(request, **kwargs):
     """
         validate bid patch in 'active' status
     """
 
-    # check if it administrator bacause he can do everything
-    if request.authenticated_role == 'Administrator':
-        return True
-
     # check if it is patch status, in active ca`nt patch status
     new_status = request.validated['json_data'].get('status')
     if new_status:
@@ -230,15 +259,13 @@ def validate_bid_patch_active(request, **kwargs):
 # delete bid validaators
 
 
+@bypass_roles('Administrator')
 def validate_bid_delete(request, **kwargs):
     bid = kwargs['context']
     auction = request.auction
     bid_status = bid.status
     auction_status = auction.status
 
-    if request.authenticated_role == 'Administrator':
-        return True
-
     if auction_status not in AUCTION_STATUSES_FOR_DELETING_BIDS:
         err_msg = 'Can\'t delete bid in current ({}) auction status'.format(auction_status)
         request.errors.add('body', 'data', err_msg)
@@ -338,20 +365,13 @@ def validate_auction_patch_rectification(request, **kwargs):
     return True
 
 
+@bypass_roles('Administrator', 'chronograph')
 def validate_auction_patch_period(request, **kwargs):
     # validate auction patch fields
 
     auction = kwargs['context']
     status = auction['status']
 
-    # if it is Adminsrtator patch, he can patch
-    if request.authenticated_role == 'Administrator':
-        return True
-
-    # if it is Chronograph patch, he can patch
-    if request.authenticated_role == 'chronograph':
-        return True
-
     # if it is Organizator patch, he can patch only in 'active.rectification'
     if status not in AUCTION_STATUSES_FOR_PATCHING_AUCTION:
         err_msg = 'Can\'t patch auction in current ({}) auction status'.format(status)
@@ -415,8 +435,24 @@ def validate_patch_questions(request, **kwargs):
 
 
 def cav_ps_code_validator(data, code):
-    if code not in CAV_PS_CODES:
-        raise ValidationError(BaseType.MESSAGES['choices'].format(CAV_PS_CODES))
+    if code not in CAV_PS:
+        raise ValidationError(CAV_PS.error_message)
+
+
+def scheme_code_validator(scheme, classifier):
+    """
+        Validator of codes of additional classification,
+        only codes of the given scheme are checked
+    """
+
+    def validator(data, code):
+        if data.get('scheme') == scheme and code not in classifier:
+            raise ValidationError(classifier.error_message)
+    return validator
+
+
+cpvs_code_validator = scheme_code_validator(u'CPVS', CPVS)
+kvtspz_code_validator = scheme_code_validator(u'kvtspz', KVTSPZ)
 
 
 def validate_auction_post(request, **kwargs):
@@ -434,6 +470,24 @@ def validate_auction_post(request, **kwargs):
     return True
 
 
+def validate_auction_lot_attempt(request, **kwargs):
+    """
+        check if there is no other not cancelled auction
+        with the same lotIdentifier and tenderAttempts
+    """
+    auction = request.validated['json_data']
+    key = [auction.get('lotIdentifier'), auction.get('tenderAttempts')]
+    # view of primary database is shared by all workers and is up to date
+    for row in query_view(request.registry.db, auctions_by_lot_attempt_view, key=key):
+        auction_id, procurement_method_type = row.value
+        if procurement_method_type in request.registry.geb_procurement_method_types:
+            err_msg = 'Auction {} with the same lotIdentifier and tenderAttempts already exists'.format(auction_id)
+            request.errors.add('body', 'lotIdentifier', err_msg)
+            request.errors.status = 409
+            return False
+    return True
+
+
 def validate_auction_status_for_adding_bid_document(request, **kwargs):
     auction = request.auction
 
@@ -1,17 +1,20 @@
 # -*- coding: utf-8 -*-
 from openprocurement.auctions.core.utils import (
     json_view,
-    context_unpack,
     opresource
 )
 from openprocurement.auctions.core.views.mixins import (
     APIResource
 )
 from openprocurement.auctions.geb.validation import (
+    validate_admission,
     validate_patch_resource_data
 )
-from openprocurement.auctions.core.interfaces import (
-    IManager
+from openprocurement.auctions.geb.managers.dispatch import (
+    get_manager
+)
+from openprocurement.auctions.geb.managers.loggers.base import (
+    log_action
 )
 
 
@@ -20,15 +23,14 @@ from openprocurement.auctions.core.interfaces import (
             auctionsprocurementMethodType="geb")
 class AuctionAuctionResource(APIResource):
 
-    @json_view(content_type="application/json", permission='auction', validators=(validate_patch_resource_data))
+    @json_view(content_type="application/json", permission='auction', validators=(validate_admission, validate_patch_resource_data))
     def post(self):
-        manager = self.request.registry.queryMultiAdapter((self.request, self.context), IManager)
+        manager = get_manager(self.request, self.context)
 
         manager.report()
 
         if manager.save():
-            extra = context_unpack(self.request, {'MESSAGE_ID': 'auction_auction_post'})
-            self.LOGGER.info('Report auction results', extra=extra)
+            log_action(self.LOGGER, self.request, 'auction_auction_post', 'Report auction results')
             return {'data': self.request.validated['auction'].serialize("auction_view")}
 
     @json_view(permission='auction')
@@ -40,14 +42,13 @@ class AuctionAuctionResource(APIResource):
             return
         return {'data': self.request.validated['auction'].serialize("auction_view")}
 
-    @json_view(content_type="application/json", permission='auction', validators=(validate_patch_resource_data,))
+    @json_view(content_type="application/json", permission='auction', validators=(validate_admission, validate_patch_resource_data))
     def patch(self):
-        manager = self.request.registry.queryMultiAdapter((self.request, self.context), IManager)
+        manager = get_manager(self.request, self.context)
 
         manager.change()
         save = manager.save()
 
         if save:
-            extra = context_unpack(self.request, {'MESSAGE_ID': 'auction_auction_patch'})
-            self.LOGGER.info('Updated auction urls', extra=extra)
+            log_action(self.LOGGER, self.request, 'auction_auction_patch', 'Updated auction urls')
             return {'data': self.request.validated['auction'].serialize("auction_view")}
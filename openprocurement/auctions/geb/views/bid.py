@@ -5,10 +5,11 @@ from openprocurement.auctions.core.utils import (
 )
 from openprocurement.auctions.core.views.mixins import AuctionBidResource
 from openprocurement.auctions.geb.validation import (
+    validate_admission,
     validate_patch_bid_data
 )
-from openprocurement.auctions.core.interfaces import (
-    IManager
+from openprocurement.auctions.geb.managers.dispatch import (
+    get_manager
 )
 
 
@@ -19,10 +20,10 @@ from openprocurement.auctions.core.interfaces import (
             description="Auction bids")
 class AuctionBidResource(AuctionBidResource):
 
-    @json_view(content_type="application/json", permission='edit_bid', validators=(validate_patch_bid_data,))
+    @json_view(content_type="application/json", permission='edit_bid', validators=(validate_admission, validate_patch_bid_data))
     def patch(self):
 
-        manager = self.request.registry.queryMultiAdapter((self.request, self.context), IManager)
+        manager = get_manager(self.request, self.context)
 
         manager.change()
 
@@ -37,14 +38,14 @@ class AuctionBidResource(AuctionBidResource):
         """
         Auction Bid Get
         """
-        manager = self.request.registry.queryMultiAdapter((self.request, self.context), IManager)
+        manager = get_manager(self.request, self.context)
         representation_manager = manager.get_representation_manager()
         return representation_manager.represent()
 
     @json_view(permission='edit_bid')
     def delete(self):
 
-        manager = self.request.registry.queryMultiAdapter((self.request, self.context), IManager)
+        manager = get_manager(self.request, self.context)
 
         manager.delete()
 
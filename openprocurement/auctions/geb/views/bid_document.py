@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 from openprocurement.auctions.core.utils import (
     opresource,
-    json_view,
-    context_unpack
+    json_view
 )
 from openprocurement.auctions.core.views.mixins import AuctionBidDocumentResource
 from openprocurement.auctions.core.validation import (
@@ -12,8 +11,17 @@ from openprocurement.auctions.core.validation import (
     validate_patch_document_data
 )
 
-from openprocurement.auctions.core.interfaces import (
-    IManager
+from openprocurement.auctions.geb.validation import (
+    validate_admission
+)
+from openprocurement.auctions.geb.managers.dispatch import (
+    get_manager
+)
+from openprocurement.auctions.geb.managers.loggers.base import (
+    log_action
+)
+from openprocurement.auctions.geb.utils import (
+    enable_file_ranges
 )
 
 
@@ -24,20 +32,19 @@ from openprocurement.auctions.core.interfaces import (
             description="Auction bidder documents")
 class AuctionBidDocumentResource(AuctionBidDocumentResource):
 
-    @json_view(validators=(validate_file_upload,), permission='edit_bid')
+    @json_view(validators=(validate_admission, validate_file_upload), permission='edit_bid')
     def collection_post(self):
         """Auction Bid Document Upload
         """
 
-        manager = self.request.registry.queryMultiAdapter((self.request, self.context), IManager)
+        manager = get_manager(self.request, self.context)
 
         applicant = self.request.validated.get('document', self.request.validated.get('file'))
         document = manager.create(applicant)
 
         if manager.save():
             msg = 'Created auction bid document {}'.format(document.id)
-            extra = context_unpack(self.request, {'MESSAGE_ID': 'auction_bid_document_create'}, {'document_id': document['id']})
-            self.LOGGER.info(msg, extra=extra)
+            log_action(self.LOGGER, self.request, 'auction_bid_document_create', msg, {'document_id': document['id']})
 
             self.request.response.status = 201
 
@@ -46,18 +53,25 @@ class AuctionBidDocumentResource(AuctionBidDocumentResource):
             self.request.response.headers['Location'] = locations
             return {'data': document.serialize("view")}
 
-    @json_view(content_type="application/json", validators=(validate_patch_document_data), permission='edit_bid')
+    @json_view(permission='view_auction')
+    def get(self):
+        """Auction Bid Document Read"""
+        response = super(AuctionBidDocumentResource, self).get()
+        if self.request.params.get('download'):
+            return enable_file_ranges(self.request, response)
+        return response
+
+    @json_view(content_type="application/json", validators=(validate_admission, validate_patch_document_data), permission='edit_bid')
     def patch(self):
         """Auction Bid Document Update"""
         save = None
 
-        manager = self.request.registry.queryMultiAdapter((self.request, self.context), IManager)
+        manager = get_manager(self.request, self.context)
 
         manager.change()
         save = manager.save()
 
         if save:
-            extra = context_unpack(self.request, {'MESSAGE_ID': 'auction_bid_document_patch'})
             msg = 'Updated auction bid document {}'.format(self.request.context.id)
-            self.LOGGER.info(msg, extra=extra)
+            log_action(self.LOGGER, self.request, 'auction_bid_document_patch', msg)
             return {'data': self.request.context.serialize("view")}
@@ -5,8 +5,8 @@ from openprocurement.auctions.core.utils import (
     json_view,
     opresource
 )
-from openprocurement.auctions.core.interfaces import (
-    IManager
+from openprocurement.auctions.geb.managers.dispatch import (
+    get_manager
 )
 from openprocurement.auctions.core.validation import (
     validate_cancellation_data,
@@ -29,7 +29,7 @@ class AuctionCancellationResource(APIResource):
         Auction Cancellations
         """
 
-        manager = self.request.registry.queryMultiAdapter((self.request, self.context), IManager)
+        manager = get_manager(self.request, self.context)
 
         applicant = self.request.validated['cancellation']
         cancellation = manager.create(applicant)
@@ -44,7 +44,7 @@ class AuctionCancellationResource(APIResource):
     def collection_get(self):
         """Auction Cancellations List"""
 
-        manager = self.request.registry.queryMultiAdapter((self.request, self.context), IManager)
+        manager = get_manager(self.request, self.context)
 
         representation_manager = manager.get_representation_manager()
         cancellation_type = type(manager.context).cancellations.model_class
@@ -55,7 +55,7 @@ class AuctionCancellationResource(APIResource):
         """
         Auction Cancellation Get
         """
-        manager = self.request.registry.queryMultiAdapter((self.request, self.context), IManager)
+        manager = get_manager(self.request, self.context)
         representation_manager = manager.get_representation_manager()
         return representation_manager.represent()
 
@@ -65,7 +65,7 @@ class AuctionCancellationResource(APIResource):
         """
         Patch the cancellation
         """
-        manager = self.request.registry.queryMultiAdapter((self.request, self.context), IManager)
+        manager = get_manager(self.request, self.context)
 
         manager.change()
 
@@ -6,13 +6,16 @@ from openprocurement.auctions.core.utils import (
 from openprocurement.auctions.core.validation import (
     validate_file_upload
 )
-from openprocurement.auctions.core.interfaces import (
-    IManager
+from openprocurement.auctions.geb.managers.dispatch import (
+    get_manager
 )
 from openprocurement.auctions.core.utils import opresource
 from openprocurement.auctions.core.views.mixins import (
     AuctionCancellationDocumentResource
 )
+from openprocurement.auctions.geb.utils import (
+    enable_file_ranges
+)
 
 
 @opresource(name='geb:Auction Cancellation Documents',
@@ -26,19 +29,27 @@ class AuctionCancellationDocumentResource(AuctionCancellationDocumentResource):
     def collection_get(self):
         """Auction Cancellation Documents List"""
 
-        manager = self.request.registry.queryMultiAdapter((self.request, self.context), IManager)
+        manager = get_manager(self.request, self.context)
         representation_manager = manager.get_representation_manager()
 
         document_type = type(manager.context).documents.model_class
         return representation_manager.represent_listing(implementedBy(document_type))
 
+    @json_view(permission='view_auction')
+    def get(self):
+        """Auction Cancellation Document Read"""
+        response = super(AuctionCancellationDocumentResource, self).get()
+        if self.request.params.get('download'):
+            return enable_file_ranges(self.request, response)
+        return response
+
     @json_view(validators=(validate_file_upload,), permission='edit_auction')
     def collection_post(self):
         """
         Auction Cancellation Document Post
         """
 
-        manager = self.request.registry.queryMultiAdapter((self.request, self.context), IManager)
+        manager = get_manager(self.request, self.context)
 
         applicant = self.request.validated.get('document', self.request.validated.get('file'))
         document = manager.create(applicant)
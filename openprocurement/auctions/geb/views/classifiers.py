@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+from openprocurement.auctions.core.utils import (
+    json_view,
+    opresource,
+    APIResource
+)
+from openprocurement.auctions.core.validation import (
+    error_handler
+)
+
+from openprocurement.auctions.geb.constants import (
+    CLASSIFIERS
+)
+
+
+@opresource(name='geb:Classifiers',
+            collection_path='/geb/classifiers/{scheme}',
+            path='/geb/classifiers/{scheme}/{code}',
+            description="Classifiers search")
+class ClassifierResource(APIResource):
+
+    def get_classifier(self):
+        classifier = CLASSIFIERS.get(self.request.matchdict['scheme'])
+        if classifier is None:
+            self.request.errors.add('url', 'scheme', 'Not Found')
+            self.request.errors.status = 404
+            raise error_handler(self.request)
+        return classifier
+
+    @json_view(permission='view_listing')
+    def collection_get(self):
+        """
+        Classifier codes, filtered by prefix of the code
+        """
+        classifier = self.get_classifier()
+        prefix = self.request.params.get('prefix', '')
+        data = [
+            {'id': code, 'parent': classifier.parent(code)}
+            for code in classifier.startswith(prefix)
+        ]
+        return {'data': data}
+
+    @json_view(permission='view_listing')
+    def get(self):
+        """
+        Classifier code with its place in the hierarchy
+        """
+        classifier = self.get_classifier()
+        code = self.request.matchdict['code']
+        if code not in classifier:
+            self.request.errors.add('url', 'code', 'Not Found')
+            self.request.errors.status = 404
+            raise error_handler(self.request)
+        data = {
+            'id': code,
+            'parent': classifier.parent(code),
+            'ancestors': classifier.ancestors(code),
+            'children': classifier.children(code)
+        }
+        return {'data': data}
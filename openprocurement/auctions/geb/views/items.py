@@ -10,8 +10,8 @@ from openprocurement.auctions.core.validation import (
     validate_patch_item_data
 )
 
-from openprocurement.auctions.core.interfaces import (
-    IManager
+from openprocurement.auctions.geb.managers.dispatch import (
+    get_manager
 )
 
 
@@ -26,7 +26,7 @@ class AuctionItemResource(APIResource):
     def collection_get(self):
         """Auction Item List"""
 
-        manager = self.request.registry.queryMultiAdapter((self.request, self.context), IManager)
+        manager = get_manager(self.request, self.context)
 
         representation_manager = manager.get_representation_manager()
         item_type = type(manager.context).items.model_class
@@ -40,7 +40,7 @@ class AuctionItemResource(APIResource):
         save = None
 
         applicant = self.request.validated['item']
-        manager = self.request.registry.queryMultiAdapter((self.request, self.context), IManager)
+        manager = get_manager(self.request, self.context)
         item = manager.create(applicant)
         save = manager.save()
 
@@ -55,7 +55,7 @@ class AuctionItemResource(APIResource):
         """
         Auction Item Read
         """
-        manager = self.request.registry.queryMultiAdapter((self.request, self.context), IManager)
+        manager = get_manager(self.request, self.context)
         representation_manager = manager.get_representation_manager()
         return representation_manager.represent()
 
@@ -64,7 +64,7 @@ class AuctionItemResource(APIResource):
         """
         Auction Item Change
         """
-        manager = self.request.registry.queryMultiAdapter((self.request, self.context), IManager)
+        manager = get_manager(self.request, self.context)
 
         manager.change()
         save = manager.save()
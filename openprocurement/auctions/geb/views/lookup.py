@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+from openprocurement.auctions.core.utils import (
+    json_view,
+    opresource,
+    APIResource
+)
+from openprocurement.auctions.core.validation import (
+    error_handler
+)
+
+from openprocurement.auctions.geb.design import (
+    auctions_by_auction_id_view,
+    auctions_by_lot_view,
+    query_view
+)
+from openprocurement.auctions.geb.indexes import (
+    get_auction_summary,
+    get_indexes
+)
+from openprocurement.auctions.geb.storage import (
+    read_docs
+)
+
+LOOKUP_FIELDS = ('id', 'auctionID', 'lotIdentifier', 'tenderAttempts', 'status')
+
+
+@opresource(name='geb:Auctions Lookup',
+            path='/geb/lookup',
+            description="Geb auctions lookup by auctionID and lotIdentifier")
+class AuctionLookupResource(APIResource):
+
+    @json_view(permission='view_listing')
+    def get(self):
+        """
+        Auctions with auctionID, or auctions of lotIdentifier ordered by tenderAttempts
+        """
+        params = self.request.params
+        if 'auctionID' not in params and 'lotIdentifier' not in params:
+            self.request.errors.add('querystring', 'auctionID', 'auctionID or lotIdentifier is required')
+            self.request.errors.status = 422
+            raise error_handler(self.request)
+
+        indexes = get_indexes(self.request)
+        if indexes is None:
+            auctions = self.lookup_by_views(params)
+        else:
+            auctions = self.lookup_by_indexes(indexes, params)
+        data = [dict((field, auction.get(field)) for field in LOOKUP_FIELDS) for auction in auctions]
+        return {'data': data}
+
+    def lookup_by_views(self, params):
+        """
+            Auctions found by views of database,
+            while indexes of process have not caught up with the changes feed
+        """
+        db = self.request.registry.db
+        if 'auctionID' in params:
+            rows = query_view(db, auctions_by_auction_id_view, key=params['auctionID'])
+        else:
+            lot = params['lotIdentifier']
+            rows = query_view(db, auctions_by_lot_view, startkey=[lot], endkey=[lot, {}])
+        types = self.request.registry.geb_procurement_method_types
+        return [row.value for row in rows if row.value['procurementMethodType'] in types]
+
+    def lookup_by_indexes(self, indexes, params):
+        if 'auctionID' in params:
+            auction_id = indexes.by_auction_id(params['auctionID'])
+            auction_ids = [auction_id] if auction_id else []
+        else:
+            auction_ids = [auction['id'] for auction in indexes.by_lot(params['lotIdentifier'])]
+        # index finds auctions, their data is read from replica
+        auctions = [get_auction_summary(doc) for doc in read_docs(self.request, auction_ids)]
+        if 'auctionID' not in params:
+            auctions = [auction for auction in auctions if auction['lotIdentifier'] == params['lotIdentifier']]
+        return auctions
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+from openprocurement.auctions.core.utils import (
+    json_view,
+    opresource,
+    APIResource
+)
+from openprocurement.auctions.core.validation import (
+    error_handler
+)
+
+from openprocurement.auctions.geb.constants import (
+    PORTFOLIO_PAGE_SIZE
+)
+from openprocurement.auctions.geb.indexes import (
+    get_indexes
+)
+
+PORTFOLIO_KEY_FIELDS = ('id', 'auction_id')
+PORTFOLIO_FIELDS = ('auctionID', 'auction_status', 'status', 'bidNumber', 'qualified', 'tenderer')
+PORTFOLIO_DEFAULT_FIELDS = ('auctionID', 'status', 'bidNumber', 'qualified')
+
+
+@opresource(name='geb:Bidder Portfolio',
+            path='/geb/bids',
+            description="Bids of authenticated bidder across geb auctions")
+class BidderPortfolioResource(APIResource):
+
+    def get_int_param(self, name, default):
+        value = self.request.params.get(name, default)
+        try:
+            value = int(value)
+        except ValueError:
+            value = -1
+        if value < 0:
+            self.request.errors.add('querystring', name, 'Must be a non-negative integer')
+            self.request.errors.status = 422
+            raise error_handler(self.request)
+        return value
+
+    @json_view(permission='view_listing')
+    def get(self):
+        """
+        Bids of authenticated bidder, optionally of one tenderer
+
+        ?opt_fields=status,qualified - fields of bids to return
+        ?tenderer_scheme=UA-EDR&tenderer_id=00037256 - bids of tenderer
+        ?offset=0&limit=100 - page of bids
+        """
+        owner = self.request.authenticated_userid
+        if not owner:
+            self.request.errors.add('url', 'permission', 'Forbidden')
+            self.request.errors.status = 403
+            raise error_handler(self.request)
+
+        params = self.request.params
+        offset = self.get_int_param('offset', 0)
+        limit = min(self.get_int_param('limit', PORTFOLIO_PAGE_SIZE), PORTFOLIO_PAGE_SIZE)
+        if params.get('opt_fields'):
+            fields = [field for field in params['opt_fields'].split(',') if field in PORTFOLIO_FIELDS]
+        else:
+            fields = PORTFOLIO_DEFAULT_FIELDS
+        fields = PORTFOLIO_KEY_FIELDS + tuple(fields)
+
+        indexes = get_indexes(self.request)
+        if indexes is None:
+            self.request.errors.add('body', 'data', 'Indexes of geb auctions are not ready, retry later')
+            self.request.errors.status = 503
+            raise error_handler(self.request)
+        bids = indexes.bids_by_owner(owner)
+        if 'tenderer_id' in params or 'tenderer_scheme' in params:
+            tenderer = [params.get('tenderer_scheme'), params.get('tenderer_id')]
+            if not all(tenderer):
+                self.request.errors.add('querystring', 'tenderer_id', 'tenderer_scheme and tenderer_id are required together')
+                self.request.errors.status = 422
+                raise error_handler(self.request)
+            bids = [bid for bid in bids if bid['tenderer'] == tenderer]
+
+        # bids are served as they are indexed, auctions are not read
+        page = bids[offset:offset + limit]
+        result = {'data': [dict((field, bid[field]) for field in fields) for bid in page]}
+        if offset + limit < len(bids):
+            next_params = dict(params.items(), offset=offset + limit)
+            result['next_page'] = {
+                'offset': offset + limit,
+                'path': self.request.route_path('geb:Bidder Portfolio', _query=next_params),
+                'uri': self.request.route_url('geb:Bidder Portfolio', _query=next_params)
+            }
+        return result
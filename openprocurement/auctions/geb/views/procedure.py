@@ -1,16 +1,23 @@
 # -*- coding: utf-8 -*-
 from openprocurement.auctions.core.utils import (
-    context_unpack,
     json_view,
     opresource
 )
 from openprocurement.auctions.core.views.mixins import (
     AuctionResource
 )
-from openprocurement.auctions.core.interfaces import (
-    IManager
+from openprocurement.auctions.geb.representations import (
+    get_auction_key,
+    render_representation
+)
+from openprocurement.auctions.geb.managers.dispatch import (
+    get_manager
+)
+from openprocurement.auctions.geb.managers.loggers.base import (
+    log_action
 )
 from openprocurement.auctions.geb.validation import (
+    validate_admission,
     validate_patch_resource_data
 )
 
@@ -18,16 +25,23 @@ from openprocurement.auctions.geb.validation import (
 @opresource(name='geb:Auction', path='/auctions/{auction_id}', auctionsprocurementMethodType="geb")
 class AuctionResource(AuctionResource):
 
+    @json_view(permission='view_auction')
+    def get(self):
+        """
+        Auction Read
+        """
+        key = get_auction_key(self.request, self.context)
+        return render_representation(self.request, key, super(AuctionResource, self).get)
+
     @json_view(content_type="application/json",
-               validators=(validate_patch_resource_data,),
+               validators=(validate_admission, validate_patch_resource_data),
                permission='edit_auction')
     def patch(self):
-        manager = self.request.registry.queryMultiAdapter((self.request, self.context), IManager)
+        manager = get_manager(self.request, self.context)
 
         manager.change()
         save = manager.save()
 
         if save:
-            extra = context_unpack(self.request, {'MESSAGE_ID': 'auction_patch'})
-            self.LOGGER.info('Updated auction {}'.format(self.context.id), extra=extra)
+            log_action(self.LOGGER, self.request, 'auction_patch', 'Updated auction {}'.format(self.context.id))
             return {'data': self.context.serialize(self.context.status)}
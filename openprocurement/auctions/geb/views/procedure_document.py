@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 from openprocurement.auctions.core.utils import (
     json_view,
-    context_unpack,
     opresource
 )
 from openprocurement.auctions.core.validation import (
@@ -11,11 +10,17 @@ from openprocurement.auctions.core.validation import (
 )
 from openprocurement.auctions.core.views.mixins import AuctionDocumentResource
 
-from openprocurement.auctions.core.interfaces import (
-    IManager
+from openprocurement.auctions.geb.encoders import (
+    render_json
 )
-
-from openprocurement.auctions.core.utils import (
+from openprocurement.auctions.geb.managers.dispatch import (
+    get_manager
+)
+from openprocurement.auctions.geb.managers.loggers.base import (
+    log_action
+)
+from openprocurement.auctions.geb.utils import (
+    get_document_versions,
     get_file
 )
 
@@ -27,12 +32,25 @@ from openprocurement.auctions.core.utils import (
             description="Auction related binary files (PDFs, etc.)")
 class AuctionDocumentResource(AuctionDocumentResource):
 
+    @json_view(permission='view_auction')
+    def collection_get(self):
+        """Auction Documents List"""
+        documents = self.context.documents
+        if self.request.params.get('all', ''):
+            collection_data = [document.serialize("view") for document in documents]
+        else:
+            # serialize only actual version of every document
+            versions = get_document_versions(documents)
+            collection_data = sorted([document_versions[-1].serialize("view") for document_versions in versions.values()],
+                                     key=lambda i: i['dateModified'])
+        return render_json(self.request, {'data': collection_data})
+
     @json_view(permission='upload_auction_documents', validators=(validate_file_upload,))
     def collection_post(self):
         """Auction Document Upload"""
         save = None
 
-        manager = self.request.registry.queryMultiAdapter((self.request, self.context), IManager)
+        manager = get_manager(self.request, self.context)
 
         applicant = self.request.validated.get('document', self.request.validated.get('file'))
         document = manager.create(applicant)
@@ -42,8 +60,7 @@ class AuctionDocumentResource(AuctionDocumentResource):
 
         if save:
             msg = 'Created auction document {}'.format(document.id)
-            extra = context_unpack(self.request, {'MESSAGE_ID': 'auction_document_create'}, {'document_id': document['id']})
-            self.LOGGER.info(msg, extra=extra)
+            log_action(self.LOGGER, self.request, 'auction_document_create', msg, {'document_id': document['id']})
 
             self.request.response.status = 201
 
@@ -73,28 +90,26 @@ class AuctionDocumentResource(AuctionDocumentResource):
         """Auction Document Update"""
         save = None
 
-        manager = self.request.registry.queryMultiAdapter((self.request, self.context), IManager)
+        manager = get_manager(self.request, self.context)
 
         manager.change()
         save = manager.save()
 
         if save:
-            extra = context_unpack(self.request, {'MESSAGE_ID': 'auction_document_patch'})
             msg = 'Updated auction document {}'.format(self.request.context.id)
-            self.LOGGER.info(msg, extra=extra)
+            log_action(self.LOGGER, self.request, 'auction_document_patch', msg)
             return {'data': self.request.context.serialize("view")}
 
     @json_view(permission='upload_auction_documents', validators=(validate_file_update,))
     def put(self):
         save = None
 
-        manager = self.request.registry.queryMultiAdapter((self.request, self.context), IManager)
+        manager = get_manager(self.request, self.context)
 
         document = manager.put()
         save = manager.save()
 
         if save:
-            extra = context_unpack(self.request, {'MESSAGE_ID': 'auction_document_put'})
             msg = 'Updated auction document {}'.format(document.id)
-            self.LOGGER.info(msg, extra=extra)
+            log_action(self.LOGGER, self.request, 'auction_document_put', msg)
             return {'data': document.serialize("view")}
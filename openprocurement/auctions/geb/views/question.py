@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 from openprocurement.auctions.core.utils import (
     json_view,
-    context_unpack,
     opresource
 )
 from openprocurement.auctions.core.validation import (
@@ -9,8 +8,14 @@ from openprocurement.auctions.core.validation import (
     validate_patch_question_data,
 )
 
-from openprocurement.auctions.core.interfaces import (
-    IManager
+from openprocurement.auctions.geb.validation import (
+    validate_admission
+)
+from openprocurement.auctions.geb.managers.dispatch import (
+    get_manager
+)
+from openprocurement.auctions.geb.managers.loggers.base import (
+    log_action
 )
 
 from openprocurement.auctions.core.views.mixins import (
@@ -25,14 +30,14 @@ from openprocurement.auctions.core.views.mixins import (
             description="Auction questions")
 class AuctionQuestionResource(AuctionQuestionResource):
 
-    @json_view(content_type="application/json", validators=(validate_question_data,), permission='create_question')
+    @json_view(content_type="application/json", validators=(validate_admission, validate_question_data), permission='create_question')
     def collection_post(self):
         """
         Post a question
         """
         save = None
 
-        manager = self.request.registry.queryMultiAdapter((self.request, self.context), IManager)
+        manager = get_manager(self.request, self.context)
 
         applicant = self.request.validated['question']
         question = manager.create(applicant)
@@ -41,8 +46,7 @@ class AuctionQuestionResource(AuctionQuestionResource):
 
         if save:
             msg = 'Created auction question {}'.format(question['id'])
-            extra = context_unpack(self.request, {'MESSAGE_ID': 'auction_question_create'}, {'question_id': question['id']})
-            self.LOGGER.info(msg, extra=extra)
+            log_action(self.LOGGER, self.request, 'auction_question_create', msg, {'question_id': question['id']})
 
             self.request.response.status = 201
 
@@ -58,13 +62,12 @@ class AuctionQuestionResource(AuctionQuestionResource):
         """
         question = self.request.context
 
-        manager = self.request.registry.queryMultiAdapter((self.request, self.context), IManager)
+        manager = get_manager(self.request, self.context)
 
         manager.change()
         save = manager.save()
 
         if save:
-            extra = context_unpack(self.request, {'MESSAGE_ID': 'auction_question_patch'})
             msg = 'Updated auction question {}'.format(self.request.context.id)
-            self.LOGGER.info(msg, extra=extra)
+            log_action(self.LOGGER, self.request, 'auction_question_patch', msg)
             return {'data': question.serialize(question.__parent__.status)}